@@ -29,6 +29,10 @@ def create_app(config_name=None):
     app = Flask(__name__)
     app.config.from_object(config[config_name])
 
+    # jsonify: Dict-Reihenfolge beibehalten statt jede Antwort rekursiv
+    # nach Schlüsseln zu sortieren (Clients lesen JSON-Objekte per Key)
+    app.json.sort_keys = False
+
     # Ensure instance folder exists
     try:
         os.makedirs(app.instance_path, exist_ok=True)
@@ -50,11 +54,18 @@ def create_app(config_name=None):
     csrf.init_app(app)
 
     # User loader for Flask-Login
-    from app.models import User
+    from app.models import User, KundeBenutzer
+
+    # All models are imported now: build the mappers once at startup
+    # instead of lazily on the first query of the first request
+    db.configure_mappers()
 
     @login_manager.user_loader
     def load_user(user_id):
-        return User.query.get(int(user_id))
+        # Kunde-Zuordnungen samt Kunde in einer Abfrage (current_user.kunde in base.html)
+        return User.query.options(
+            db.selectinload(User.kunde_zuordnungen).joinedload(KundeBenutzer.kunde)
+        ).get(int(user_id))
 
     # Register blueprints
     from app.routes import (
@@ -171,6 +182,27 @@ def create_app(config_name=None):
             return parts[-1].replace('_', ' ').title()
         return endpoint.title()
 
+    if app.config.get('N_PLUS_ONE_WARN_THRESHOLD'):
+        @app.after_request
+        def warn_repeated_queries(response):
+            """Log statements repeated within one request (N+1 lazy loads)."""
+            from collections import Counter
+            from flask import request
+            from flask_sqlalchemy.record_queries import get_recorded_queries
+
+            queries = get_recorded_queries()
+            counts = Counter(q.statement for q in queries)
+            threshold = app.config['N_PLUS_ONE_WARN_THRESHOLD']
+            for statement, count in counts.most_common():
+                if count < threshold:
+                    break
+                location = next(q.location for q in queries if q.statement == statement)
+                app.logger.warning(
+                    'Possible N+1 in %s: %dx (of %d queries) at %s: %s',
+                    request.endpoint, count, len(queries), location, statement[:200]
+                )
+            return response
+
     @app.before_request
     def track_admin_page_visit():
         """Track page visits in admin area for 'Recently Visited' feature."""
@@ -201,7 +233,7 @@ def create_app(config_name=None):
             # Check if last visit was same endpoint (avoid duplicates)
             last_visit = AdminPageVisit.query.filter_by(
                 user_id=current_user.id
-            ).order_by(AdminPageVisit.timestamp.desc()).first()
+            ).order_by(AdminPageVisit.timestamp.desc(), AdminPageVisit.id.desc()).first()
 
             if last_visit and last_visit.endpoint == request.endpoint:
                 # Same page as last visit - update timestamp instead of creating new
@@ -227,7 +259,7 @@ def create_app(config_name=None):
             if visit_count > 50:
                 old_visits = AdminPageVisit.query.filter_by(
                     user_id=current_user.id
-                ).order_by(AdminPageVisit.timestamp.asc()).limit(visit_count - 50).all()
+                ).order_by(AdminPageVisit.timestamp.asc(), AdminPageVisit.id.asc()).limit(visit_count - 50).all()
                 for old_visit in old_visits:
                     db.session.delete(old_visit)
                 db.session.commit()
@@ -346,7 +378,7 @@ def create_app(config_name=None):
             ).filter(
                 AdminPageVisit.user_id == current_user.id
             ).order_by(
-                AdminPageVisit.timestamp.desc()
+                AdminPageVisit.timestamp.desc(), AdminPageVisit.id.desc()
             ).limit(3).all()
 
             return {'recent_admin_pages': recent}
@@ -2702,6 +2734,62 @@ Bei Fragen stehen wir Ihnen gerne zur Verfügung.
         click.echo('')
         click.echo('Demo seeding complete!')
 
+    @app.cli.command('sync-lieferanten')
+    def sync_lieferanten_command():
+        """Synchronize Lieferanten with VEDES FTP.
+
+        Same as the "Lieferanten synchronisieren" button in the PRICAT admin,
+        but outside the web worker - intended for cron, e.g.:
+            flask sync-lieferanten
+        """
+        from app.services import FTPService
+
+        result = FTPService().sync_lieferanten()
+        for label in ('created', 'updated', 'downloaded'):
+            if result[label]:
+                click.echo(f"{label}: {', '.join(result[label])}")
+        for error in result['errors']:
+            click.echo(f'ERROR: {error}')
+
+        if not result['success']:
+            raise click.ClickException(result['message'])
+        click.echo(result['message'])
+
+    @app.cli.command('support-auto-close')
+    @click.option('--tage', default=14, show_default=True,
+                  help='Gelöste Tickets schließen, wenn seit so vielen Tagen gelöst')
+    @click.option('--user-email', default=lambda: os.environ.get('INITIAL_ADMIN_EMAIL'),
+                  help='Benutzer für die Statuskommentare (Default: INITIAL_ADMIN_EMAIL)')
+    def support_auto_close_command(tage, user_email):
+        """Close support tickets that have been resolved for a while.
+
+        Intended for a nightly cron job, e.g.:
+            flask support-auto-close --tage 14
+        """
+        from datetime import timedelta
+        from app.models import SupportTicket, TicketStatus, User
+        from app.services import get_support_service
+
+        user = User.query.filter_by(email=user_email).first() if user_email else None
+        if user is None:
+            raise click.ClickException(
+                'Benutzer nicht gefunden - --user-email oder INITIAL_ADMIN_EMAIL setzen'
+            )
+
+        grenze = datetime.utcnow() - timedelta(days=tage)
+        tickets = SupportTicket.query.filter(
+            SupportTicket.status == TicketStatus.GELOEST.value,
+            SupportTicket.geloest_am < grenze
+        ).all()
+
+        anzahl = get_support_service().change_status_bulk(
+            tickets,
+            TicketStatus.GESCHLOSSEN.value,
+            kommentar_text=f'Automatisch geschlossen ({tage} Tage nach Lösung ohne Rückmeldung)',
+            user=user
+        )
+        click.echo(f'{anzahl} Tickets geschlossen')
+
     # ─────────────────────────────────────────────────────────
     # Compatibility aliases for old commands
     # ─────────────────────────────────────────────────────────
@@ -34,6 +34,11 @@ class DevelopmentConfig(Config):
     DEBUG = True
     DEV_PORT = 5055
 
+    # N+1-Erkennung: SQL pro Request mitschreiben und warnen, sobald
+    # dieselbe Abfrage mindestens so oft wiederholt wird
+    SQLALCHEMY_RECORD_QUERIES = True
+    N_PLUS_ONE_WARN_THRESHOLD = 5
+
 
 class ProductionConfig(Config):
     """Production configuration."""
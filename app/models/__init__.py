@@ -40,7 +40,7 @@ from app.models.lookup_wert import LookupWert
 # Anwender-Support Module (PRD-007)
 from app.models.support_team import SupportTeam, SupportTeamMitglied
 from app.models.support_ticket import (
-    SupportTicket, TicketKommentar,
+    SupportTicket, TicketKommentar, TicketCounter,
     TicketTyp, TicketStatus, TicketPrioritaet
 )
 
@@ -105,7 +105,7 @@ __all__ = [
     'LookupWert',
     # Anwender-Support Module (PRD-007)
     'SupportTeam', 'SupportTeamMitglied',
-    'SupportTicket', 'TicketKommentar',
+    'SupportTicket', 'TicketKommentar', 'TicketCounter',
     'TicketTyp', 'TicketStatus', 'TicketPrioritaet',
     # Produktdaten Module (PRD-009)
     'ProduktLookup', 'Attributgruppe',
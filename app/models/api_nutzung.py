@@ -40,6 +40,12 @@ class KundeApiNutzung(db.Model):
         'User', backref=db.backref('api_nutzungen', lazy='dynamic')
     )
 
+    __table_args__ = (
+        # Abrechnung: Detailliste pro User (neueste zuerst), Summen pro Kunde
+        db.Index('ix_api_nutzung_user_created', 'user_id', db.text('created_at DESC')),
+        db.Index('ix_api_nutzung_user_kunde', 'user_id', 'kunde_id'),
+    )
+
     def __repr__(self):
         return f'<KundeApiNutzung {self.api_service}:{self.api_endpoint}>'
 
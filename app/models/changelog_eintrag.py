@@ -17,24 +17,36 @@ class ChangelogKategorie(str, Enum):
 
     @classmethod
     def choices(cls):
-        """Return list of (value, label) tuples for form selects."""
-        labels = {
-            cls.ADDED: 'Added (Neu)',
-            cls.CHANGED: 'Changed (Geändert)',
-            cls.FIXED: 'Fixed (Behoben)',
-            cls.REMOVED: 'Removed (Entfernt)',
-        }
-        return [(t.value, labels[t]) for t in cls]
+        """Return (value, label) tuples for form selects."""
+        return cls._CHOICES
 
     @classmethod
     def color_map(cls):
         """Return Bootstrap color classes for each category."""
-        return {
-            cls.ADDED.value: 'success',
-            cls.CHANGED.value: 'info',
-            cls.FIXED.value: 'warning',
-            cls.REMOVED.value: 'danger',
-        }
+        return cls._COLORS
+
+    @classmethod
+    def get_color(cls, value):
+        """Get the Bootstrap color class for a category value."""
+        return cls._COLORS.get(value, 'secondary')
+
+
+# Lookup-Tabellen einmalig beim Import aufbauen statt pro Aufruf
+ChangelogKategorie._LABELS = {
+    ChangelogKategorie.ADDED.value: 'Added (Neu)',
+    ChangelogKategorie.CHANGED.value: 'Changed (Geändert)',
+    ChangelogKategorie.FIXED.value: 'Fixed (Behoben)',
+    ChangelogKategorie.REMOVED.value: 'Removed (Entfernt)',
+}
+ChangelogKategorie._COLORS = {
+    ChangelogKategorie.ADDED.value: 'success',
+    ChangelogKategorie.CHANGED.value: 'info',
+    ChangelogKategorie.FIXED.value: 'warning',
+    ChangelogKategorie.REMOVED.value: 'danger',
+}
+ChangelogKategorie._CHOICES = tuple(
+    (k.value, ChangelogKategorie._LABELS[k.value]) for k in ChangelogKategorie
+)
 
 
 class ChangelogSichtbarkeit(str, Enum):
@@ -101,7 +113,7 @@ class ChangelogEintrag(db.Model):
     @property
     def kategorie_color(self):
         """Return Bootstrap color class for category."""
-        return ChangelogKategorie.color_map().get(self.kategorie, 'secondary')
+        return ChangelogKategorie.get_color(self.kategorie)
 
     @property
     def ist_oeffentlich(self):
@@ -1,8 +1,15 @@
 """Config (Key-Value Store) Model."""
 from datetime import datetime
+
+from flask import g, has_app_context
+
 from app import db
 
 
+# Schlüssel des request-lokalen Config-Caches in flask.g
+_CACHE_ATTR = '_config_werte'
+
+
 class Config(db.Model):
     """Configuration key-value store."""
 
@@ -18,11 +25,23 @@ class Config(db.Model):
     def __repr__(self):
         return f'<Config {self.key}>'
 
+    @staticmethod
+    def as_dict():
+        """Return all configuration values as {key: value}.
+
+        The table is loaded once per app context (i.e. per request) and
+        cached in flask.g; writes through the ORM reset the cache.
+        """
+        werte = g.get(_CACHE_ATTR)
+        if werte is None:
+            werte = dict(db.session.query(Config.key, Config.value).all())
+            setattr(g, _CACHE_ATTR, werte)
+        return werte
+
     @staticmethod
     def get_value(key, default=None):
         """Get configuration value by key."""
-        entry = Config.query.filter_by(key=key).first()
-        return entry.value if entry else default
+        return Config.as_dict().get(key, default)
 
     @staticmethod
     def set_value(key, value, beschreibung=None):
@@ -37,3 +56,12 @@ class Config(db.Model):
             db.session.add(entry)
         db.session.commit()
         return entry
+
+
+@db.event.listens_for(Config, 'after_insert')
+@db.event.listens_for(Config, 'after_update')
+@db.event.listens_for(Config, 'after_delete')
+def _config_cache_leeren(mapper, connection, target):
+    """Config changes invalidate the request-local cache."""
+    if has_app_context():
+        g.pop(_CACHE_ATTR, None)
@@ -197,7 +197,10 @@ class Komponente(db.Model):
     @property
     def offene_tasks(self):
         """Return tasks that are not completed."""
-        return self.tasks.filter(Task.status != 'erledigt').all()
+        from app.models.task import Task
+        return self.tasks.options(
+            db.undefer(Task.anzahl_abgeleitete)
+        ).filter(Task.status != 'erledigt').all()
 
     @property
     def erledigte_tasks(self):
@@ -90,6 +90,10 @@ class Kunde(db.Model):
     branchenrollen = db.relationship('KundeBranchenRolle', back_populates='kunde',
                                      cascade='all, delete-orphan')
 
+    # Support-Tickets (PRD-007); nur per selectinload(...) laden
+    support_tickets = db.relationship('SupportTicket', back_populates='kunde',
+                                      lazy='raise_on_sql')
+
     # Mailing opt-out (PRD-013)
     mailing_abgemeldet = db.Column(db.Boolean, default=False, nullable=False)
     mailing_abgemeldet_am = db.Column(db.DateTime, nullable=True)
@@ -8,9 +8,15 @@ extended without schema changes. Use cases:
 """
 from typing import Optional
 
+from flask import g, has_app_context
+
 from app import db
 
 
+# Schlüssel des request-lokalen Lookup-Caches in flask.g
+_CACHE_ATTR = '_lookup_werte'
+
+
 class LookupWert(db.Model):
     """Generic key-value storage for configuration values.
 
@@ -59,12 +65,8 @@ class LookupWert(db.Model):
         Returns:
             The value string, or None if not found or inactive
         """
-        lw = cls.query.filter_by(
-            kategorie=kategorie,
-            schluessel=schluessel,
-            aktiv=True
-        ).first()
-        return lw.wert if lw else None
+        treffer = _lookup(kategorie, schluessel)
+        return treffer[0] if treffer else None
 
     @classmethod
     def get_entry(cls, kategorie: str, schluessel: str) -> Optional['LookupWert']:
@@ -95,8 +97,8 @@ class LookupWert(db.Model):
         Returns:
             The icon class (always prefixed with 'ti ')
         """
-        lw = cls.get_entry(kategorie, schluessel)
-        icon = lw.icon if lw and lw.icon else default
+        treffer = _lookup(kategorie, schluessel)
+        icon = treffer[1] if treffer and treffer[1] else default
         # Ensure 'ti ' prefix for Tabler icons
         if icon and not icon.startswith('ti '):
             icon = f'ti {icon}'
@@ -114,8 +116,14 @@ class LookupWert(db.Model):
         Returns:
             The Bootstrap color class
         """
-        lw = cls.get_entry(kategorie, schluessel)
-        return lw.farbe if lw and lw.farbe else default
+        treffer = _lookup(kategorie, schluessel)
+        return treffer[2] if treffer and treffer[2] else default
+
+    @staticmethod
+    def _cache_clear() -> None:
+        """Reset the cache behind get_wert/get_icon/get_farbe."""
+        if has_app_context():
+            g.pop(_CACHE_ATTR, None)
 
     @classmethod
     def get_by_kategorie(cls, kategorie: str) -> list['LookupWert']:
@@ -154,3 +162,31 @@ class LookupWert(db.Model):
         """
         result = db.session.query(cls.kategorie).distinct().order_by(cls.kategorie).all()
         return [r[0] for r in result]
+
+
+def _lookup(kategorie: str, schluessel: str) -> Optional[tuple]:
+    """(wert, icon, farbe) of an active entry, or None.
+
+    Icons, colors and labels are read once per row in every list view
+    (Task.typ_icon etc.). All active entries are loaded once per app
+    context (i.e. per request) and cached in flask.g, like Config.as_dict();
+    a process-wide cache would go stale in the other gunicorn workers.
+    Defaults are applied by the callers.
+    """
+    werte = g.get(_CACHE_ATTR)
+    if werte is None:
+        zeilen = db.session.query(
+            LookupWert.kategorie, LookupWert.schluessel,
+            LookupWert.wert, LookupWert.icon, LookupWert.farbe
+        ).filter(LookupWert.aktiv == True).all()
+        werte = {(k, s): (w, i, f) for k, s, w, i, f in zeilen}
+        setattr(g, _CACHE_ATTR, werte)
+    return werte.get((kategorie, schluessel))
+
+
+@db.event.listens_for(LookupWert, 'after_insert')
+@db.event.listens_for(LookupWert, 'after_update')
+@db.event.listens_for(LookupWert, 'after_delete')
+def _lookup_cache_leeren(mapper, connection, target):
+    """Admin changes invalidate the lookup cache."""
+    LookupWert._cache_clear()
@@ -99,6 +99,8 @@ class Modul(db.Model):
     zugriffe = db.relationship('ModulZugriff', backref='modul',
                                lazy='dynamic', cascade='all, delete-orphan')
     audit_logs = db.relationship('AuditLog', backref='modul', lazy='dynamic')
+    support_tickets = db.relationship('SupportTicket', back_populates='modul',
+                                      lazy='raise_on_sql')
 
     def __repr__(self):
         return f'<Modul {self.code}>'
@@ -5,9 +5,9 @@ These are NOT the same as ev247 Modul entries (which represent app areas with
 access control). ModulErp entries are used to link customer project components
 to specific ERP functionality.
 """
-from datetime import datetime
 from enum import Enum
 from app import db
+from app.models.sql_functions import utcnow
 
 
 class ModulErpKontext(str, Enum):
@@ -56,8 +56,8 @@ class ModulErp(db.Model):
     sortierung = db.Column(db.Integer, default=0)
 
     # Timestamps
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
+    updated_at = db.Column(db.DateTime, server_default=utcnow(), onupdate=utcnow())
 
     # Relationships
     komponenten = db.relationship(
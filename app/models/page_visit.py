@@ -1,7 +1,7 @@
 """Admin Page Visit tracking for 'recently visited' feature."""
-from datetime import datetime
 
 from app import db
+from app.models.sql_functions import utcnow
 
 
 class AdminPageVisit(db.Model):
@@ -14,7 +14,7 @@ class AdminPageVisit(db.Model):
     endpoint = db.Column(db.String(200), nullable=False)  # Flask endpoint, e.g. 'admin.system'
     page_url = db.Column(db.String(500), nullable=False)  # URL path, e.g. '/admin/system'
     page_title = db.Column(db.String(200))                # Human-readable title
-    timestamp = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    timestamp = db.Column(db.DateTime, server_default=utcnow(), index=True)
 
     # Relationship to User
     user = db.relationship('User', backref=db.backref('admin_page_visits', lazy='dynamic'))
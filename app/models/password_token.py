@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 import secrets
 
 from app import db
+from app.models.sql_functions import utcnow
 
 
 class PasswordToken(db.Model):
@@ -20,7 +21,7 @@ class PasswordToken(db.Model):
     password_plain = db.Column(db.String(100))  # Cleared after reveal
     expires_at = db.Column(db.DateTime, nullable=False)
     revealed_at = db.Column(db.DateTime)  # NULL = not yet revealed
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
 
     # Relationship
     user = db.relationship('User', backref=db.backref('password_tokens', lazy='dynamic'))
@@ -11,8 +11,10 @@ Enthält die Kern-Felder, die direkt am Produkt gespeichert werden:
 
 Weitere Eigenschaften werden über EigenschaftWert (EAV-Pattern) verknüpft.
 """
-from datetime import datetime
+from sqlalchemy.ext.hybrid import hybrid_property
+
 from app import db
+from app.models.sql_functions import utcnow
 
 
 class ProduktStatus:
@@ -39,10 +41,10 @@ class Produkt(db.Model):
     # === IDENTIFIKATION ===
 
     # EAN/GTIN (Pflichtfeld, unique) - NTG-P-007
-    ean = db.Column(db.String(14), nullable=False, unique=True, index=True)
+    ean = db.Column(db.String(14), nullable=False)
 
     # Artikelnummer Lieferant - NTG-P-013
-    artikelnummer_lieferant = db.Column(db.String(35), index=True)
+    artikelnummer_lieferant = db.Column(db.String(35))
 
     # Artikelnummer Hersteller - NTG-P-014
     artikelnummer_hersteller = db.Column(db.String(35))
@@ -135,8 +137,8 @@ class Produkt(db.Model):
 
     # === META ===
 
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
+    updated_at = db.Column(db.DateTime, onupdate=utcnow())
 
     # Erstellt von (User)
     created_by_id = db.Column(db.Integer, db.ForeignKey('user.id'))
@@ -155,16 +157,46 @@ class Produkt(db.Model):
         cascade='all, delete-orphan'
     )
 
+    __table_args__ = (
+        # Covering indexes (PostgreSQL INCLUDE): lookup + label via index-only scan
+        db.Index(
+            'ix_produkt_ean', 'ean', unique=True,
+            postgresql_include=['artikelbezeichnung', 'markenname', 'status'],
+        ),
+        db.Index(
+            'ix_produkt_artikelnummer_lieferant', 'artikelnummer_lieferant',
+            postgresql_include=['artikelbezeichnung', 'markenname', 'status'],
+        ),
+        # get_by_lieferant(nur_aktive=True): filter + sort in one index walk
+        db.Index(
+            'ix_produkt_lieferant_bezeichnung_aktiv',
+            'lieferant_id', 'artikelbezeichnung',
+            postgresql_where=db.text("status <> 'archiviert'"),
+            sqlite_where=db.text("status <> 'archiviert'"),
+        ),
+        # get_by_lieferant(nur_aktive=False)
+        db.Index('ix_produkt_lieferant_status', 'lieferant_id', 'status'),
+    )
+
     def __repr__(self):
         return f'<Produkt {self.ean}: {self.artikelbezeichnung[:30] if self.artikelbezeichnung else "?"}>'
 
-    @property
+    @hybrid_property
     def vollstaendiger_name(self):
         """Marke + Bezeichnung für Anzeige."""
         if self.markenname:
             return f"{self.markenname} - {self.artikelbezeichnung}"
         return self.artikelbezeichnung
 
+    @vollstaendiger_name.expression
+    def vollstaendiger_name(cls):
+        """SQL-Ausdruck für Sortierung/Filter nach vollständigem Namen."""
+        return db.case(
+            (db.func.coalesce(cls.markenname, '') != '',
+             cls.markenname + ' - ' + cls.artikelbezeichnung),
+            else_=cls.artikelbezeichnung
+        )
+
     @property
     def kategorie_pfad(self):
         """Vollständiger Kategorie-Pfad aus Attributgruppe."""
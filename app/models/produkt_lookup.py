@@ -52,6 +52,12 @@ class ProduktLookup(db.Model):
         db.UniqueConstraint('kategorie', 'code', name='uq_produkt_lookup_kategorie_code'),
     )
 
+    # Spalten, die bulk_upsert() bei vorhandenem (kategorie, code) aktualisiert
+    UPSERT_COLUMNS = ('bezeichnung', 'zusatz_1', 'zusatz_2', 'zusatz_3', 'sortierung', 'aktiv')
+
+    # Zeilen pro INSERT-Statement in bulk_upsert()
+    UPSERT_BATCH_SIZE = 500
+
     def __repr__(self):
         return f'<ProduktLookup {self.kategorie}:{self.code}>'
 
@@ -108,3 +114,53 @@ class ProduktLookup(db.Model):
             func.count(cls.id)
         ).group_by(cls.kategorie).order_by(cls.kategorie).all()
         return dict(result)
+
+    @classmethod
+    def bulk_upsert(cls, rows):
+        """Mehrere Einträge per INSERT ... ON CONFLICT anlegen/aktualisieren.
+
+        Statt session.add() pro Zeile wird je Batch ein einziges Statement
+        gesendet. Schlüssel ist (kategorie, code). Vorhandene Einträge werden
+        nur in den Spalten überschrieben, die die Zeile übergibt; fehlende
+        Spalten (oder None) behalten den gespeicherten Wert bzw. bekommen
+        beim Anlegen den Model-Default. Kein Commit.
+
+        Args:
+            rows: Liste von Dicts mit mindestens kategorie, code, bezeichnung
+
+        Returns:
+            Anzahl verarbeiteter Zeilen
+        """
+        columns = ('kategorie', 'code') + cls.UPSERT_COLUMNS
+
+        # Ein Multi-VALUES-Statement braucht dieselben Spalten in jeder Zeile:
+        # Zeilen nach übergebenen Spalten gruppieren
+        gruppen = {}
+        for row in rows:
+            values = {c: row[c] for c in columns if row.get(c) is not None}
+            gruppen.setdefault(tuple(values), []).append(values)
+
+        dialect = db.session.get_bind().dialect.name
+        if dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.mysql import insert
+
+        for spalten, values in gruppen.items():
+            update_spalten = [c for c in cls.UPSERT_COLUMNS if c in spalten]
+            for start in range(0, len(values), cls.UPSERT_BATCH_SIZE):
+                stmt = insert(cls).values(values[start:start + cls.UPSERT_BATCH_SIZE])
+                if dialect in ('postgresql', 'sqlite'):
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=['kategorie', 'code'],
+                        set_={c: stmt.excluded[c] for c in update_spalten}
+                    )
+                else:
+                    stmt = stmt.on_duplicate_key_update(
+                        {c: stmt.inserted[c] for c in update_spalten}
+                    )
+                db.session.execute(stmt)
+
+        return len(rows)
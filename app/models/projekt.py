@@ -3,9 +3,9 @@
 A Projekt is the top-level container for components (PRDs/modules).
 It can be either internal (ev247 platform development) or customer-specific.
 """
-from datetime import datetime
 from enum import Enum
 from app import db
+from app.models.sql_functions import utcnow
 
 
 class ProjektTyp(str, Enum):
@@ -43,8 +43,8 @@ class Projekt(db.Model):
     aktiv = db.Column(db.Boolean, default=True, nullable=False)
 
     # Timestamps
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
+    updated_at = db.Column(db.DateTime, server_default=utcnow(), onupdate=utcnow())
 
     # Relationships
     komponenten = db.relationship(
@@ -54,6 +54,13 @@ class Projekt(db.Model):
         cascade='all, delete-orphan',
         order_by='Komponente.sortierung'
     )
+    # Active components only, filtered in SQL (supports selectinload)
+    aktive_komponenten = db.relationship(
+        'Komponente',
+        primaryjoin="and_(Projekt.id == Komponente.projekt_id, Komponente.status == 'aktiv')",
+        viewonly=True,
+        order_by='Komponente.sortierung'
+    )
     kunde = db.relationship('Kunde', backref=db.backref('projekte', lazy='dynamic'))
 
     def __repr__(self):
@@ -69,11 +76,6 @@ class Projekt(db.Model):
         """Return number of components in this project."""
         return self.komponenten.count()
 
-    @property
-    def aktive_komponenten(self):
-        """Return active components."""
-        return self.komponenten.filter_by(status='aktiv').all()
-
     def to_dict(self, include_komponenten=False):
         """Return dictionary representation.
 
@@ -1,7 +1,7 @@
 """Rolle (Role) model."""
-from datetime import datetime
 
 from app import db
+from app.models.sql_functions import utcnow
 
 
 class Rolle(db.Model):
@@ -11,10 +11,10 @@ class Rolle(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(30), unique=True, nullable=False)
     beschreibung = db.Column(db.String(100))
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
 
     # Relationship to User
-    users = db.relationship('User', backref='rolle_obj', lazy='dynamic')
+    users = db.relationship('User', back_populates='rolle_obj', lazy='dynamic')
 
     def __repr__(self):
         return f'<Rolle {self.name}>'
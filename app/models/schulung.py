@@ -3,15 +3,71 @@
 Eine Schulung ist ein Kurs-Template mit Preis, Metadaten und verknüpften Themen.
 Konkrete Termine werden als Schulungsdurchführung angelegt.
 """
-from datetime import datetime, date
+from dataclasses import dataclass
+from datetime import date, datetime
 from decimal import Decimal
+from typing import Optional
 from enum import Enum
+from functools import cached_property
+from operator import attrgetter
+from sqlalchemy.ext.hybrid import hybrid_property
 from app import db
+from app.utils import request_today
+
+
+# Dauer eines Themas über die Verknüpfung (SchulungThema → Schulungsthema)
+_THEMA_DAUER = attrgetter('thema.dauer_minuten')
+
+
+def _format_dauer(minuten: int) -> str:
+    """Formatierte Dauer (z.B. '4h 30min')."""
+    if minuten >= 60:
+        stunden = minuten // 60
+        rest = minuten % 60
+        if rest > 0:
+            return f'{stunden}h {rest}min'
+        return f'{stunden}h'
+    return f'{minuten}min'
+
+
+@dataclass
+class SchulungSummary:
+    """Flache Katalogzeile aus Schulung.list_with_summary()."""
+    id: int
+    titel: str
+    preis: Decimal
+    aktueller_preis: Decimal
+    max_teilnehmer: int
+    anzahl_themen: int
+    gesamtdauer_minuten: int
+    naechste_durchfuehrung_id: Optional[int] = None
+    naechster_start: Optional[date] = None
+    anzahl_gebucht: int = 0
+
+    @property
+    def hat_sonderpreis(self) -> bool:
+        return self.aktueller_preis != self.preis
+
+    @property
+    def gesamtdauer_formatiert(self) -> str:
+        return _format_dauer(self.gesamtdauer_minuten)
+
+    @property
+    def freie_plaetze(self) -> int:
+        return max(0, self.max_teilnehmer - self.anzahl_gebucht)
+
+    @property
+    def ist_ausgebucht(self) -> bool:
+        return self.freie_plaetze <= 0
 
 
 class Schulung(db.Model):
     """Kurs-Template mit Preis und Metadaten."""
     __tablename__ = 'schulung'
+    __table_args__ = (
+        # get_aktive / get_mit_kommenden_terminen: filter aktiv, sortiert
+        db.Index('ix_schulung_aktiv_sort', 'aktiv', 'sortierung', 'titel'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
 
@@ -69,12 +125,12 @@ class Schulung(db.Model):
         order_by='SchulungThema.sortierung'
     )
 
-    # Durchführungen dieser Schulung
+    # Durchführungen dieser Schulung (in Listen per selectinload vorladen)
     durchfuehrungen = db.relationship(
         'Schulungsdurchfuehrung',
         back_populates='schulung',
         cascade='all, delete-orphan',
-        lazy='dynamic'
+        order_by='Schulungsdurchfuehrung.start_datum'
     )
 
     def __repr__(self):
@@ -82,10 +138,23 @@ class Schulung(db.Model):
 
     # === PROPERTIES ===
 
-    @property
+    # Aus thema_verknuepfungen abgeleitete Werte werden pro Instanz gecacht
+    # und bei Änderungen der Verknüpfungen, der Themen-Dauer sowie bei
+    # expire/refresh verworfen (siehe Event-Listener)
+    THEMEN_CACHE_ATTRS = (
+        'themen_sortiert', 'anzahl_themen',
+        'gesamtdauer_minuten', 'gesamtdauer_formatiert',
+    )
+
+    def reset_themen_cache(self):
+        """Verwirft die gecachten Themen-Kennzahlen."""
+        for name in self.THEMEN_CACHE_ATTRS:
+            self.__dict__.pop(name, None)
+
+    @hybrid_property
     def aktueller_preis(self) -> Decimal:
         """Gibt Sonderpreis zurück wenn im Aktionszeitraum, sonst Standardpreis."""
-        heute = date.today()
+        heute = request_today()
 
         if self.sonderpreis is not None:
             von_ok = self.aktionszeitraum_von is None or self.aktionszeitraum_von <= heute
@@ -96,63 +165,73 @@ class Schulung(db.Model):
 
         return self.preis
 
-    @property
+    @aktueller_preis.expression
+    def aktueller_preis(cls):
+        """SQL-Variante als CASE, z.B. für Listen-Queries."""
+        return db.case(
+            (cls._sonderpreis_gueltig(), cls.sonderpreis),
+            else_=cls.preis
+        )
+
+    @hybrid_property
     def hat_sonderpreis(self) -> bool:
         """True wenn aktuell ein Sonderpreis gilt."""
         return self.aktueller_preis != self.preis
 
-    @property
+    @hat_sonderpreis.expression
+    def hat_sonderpreis(cls):
+        """SQL-Variante für Filter nach aktuellen Aktionen."""
+        return db.and_(cls._sonderpreis_gueltig(), cls.sonderpreis != cls.preis)
+
+    @classmethod
+    def _sonderpreis_gueltig(cls):
+        """SQL-Bedingung: Sonderpreis gesetzt und heute im Aktionszeitraum."""
+        heute = request_today()
+        return db.and_(
+            cls.sonderpreis.isnot(None),
+            db.or_(cls.aktionszeitraum_von.is_(None), cls.aktionszeitraum_von <= heute),
+            db.or_(cls.aktionszeitraum_bis.is_(None), cls.aktionszeitraum_bis >= heute)
+        )
+
+    @cached_property
     def themen_sortiert(self) -> list:
         """Alle Themen sortiert nach Junction-Sortierung."""
         return [vk.thema for vk in self.thema_verknuepfungen]
 
-    @property
+    @cached_property
     def anzahl_themen(self) -> int:
         """Anzahl der verknüpften Themen."""
         return len(self.thema_verknuepfungen)
 
-    @property
+    @cached_property
     def gesamtdauer_minuten(self) -> int:
         """Summe aller Themen-Dauern."""
-        return sum(vk.thema.dauer_minuten for vk in self.thema_verknuepfungen)
+        return sum(map(_THEMA_DAUER, self.thema_verknuepfungen))
 
-    @property
+    @cached_property
     def gesamtdauer_formatiert(self) -> str:
         """Formatierte Gesamtdauer (z.B. '4h 30min')."""
-        minuten = self.gesamtdauer_minuten
-        if minuten >= 60:
-            stunden = minuten // 60
-            rest = minuten % 60
-            if rest > 0:
-                return f'{stunden}h {rest}min'
-            return f'{stunden}h'
-        return f'{minuten}min'
+        return _format_dauer(self.gesamtdauer_minuten)
 
     @property
     def naechste_durchfuehrung(self):
         """Nächste geplante/aktive Durchführung."""
-        from app.models.schulungsdurchfuehrung import DurchfuehrungStatus
-        heute = date.today()
-        return self.durchfuehrungen.filter(
-            db.or_(
-                Schulungsdurchfuehrung.status == DurchfuehrungStatus.GEPLANT.value,
-                Schulungsdurchfuehrung.status == DurchfuehrungStatus.AKTIV.value
-            ),
-            Schulungsdurchfuehrung.start_datum >= heute
-        ).order_by(Schulungsdurchfuehrung.start_datum).first()
+        kommende = self.kommende_durchfuehrungen
+        return kommende[0] if kommende else None
 
     @property
     def kommende_durchfuehrungen(self) -> list:
-        """Alle kommenden Durchführungen (geplant/aktiv, ab heute)."""
-        from app.models.schulungsdurchfuehrung import DurchfuehrungStatus
-        heute = date.today()
-        return self.durchfuehrungen.filter(
-            db.or_(
-                Schulungsdurchfuehrung.status == DurchfuehrungStatus.GEPLANT.value,
-                Schulungsdurchfuehrung.status == DurchfuehrungStatus.AKTIV.value
-            ),
-            Schulungsdurchfuehrung.start_datum >= heute
-        ).order_by(Schulungsdurchfuehrung.start_datum).all()
+        """Alle kommenden Durchführungen (geplant/aktiv, ab heute).
+
+        Filtert die geladenen (nach start_datum sortierten) Durchführungen;
+        für eine einzelne Schulung ohne Vorladen ist
+        Schulungsdurchfuehrung.get_by_schulung() die SQL-Variante.
+        """
+        heute = request_today()
+        return [
+            df for df in self.durchfuehrungen
+            if df.status in _OFFENE_STATUS and df.start_datum >= heute
+        ]
 
     def to_dict(self, include_themen: bool = False):
         """Serialization for API/Export."""
@@ -184,34 +263,102 @@ class Schulung(db.Model):
 
     # === CLASS METHODS ===
 
+    @classmethod
+    def _listen_optionen(cls):
+        """Eager-Loading für Listen: Durchführungen sowie Themen samt Thema
+        (anzahl_themen, gesamtdauer_* ohne Lazy-Load pro Zeile)."""
+        return (
+            db.selectinload(cls.durchfuehrungen).lazyload(Schulungsdurchfuehrung.buchungen),
+            db.selectinload(cls.thema_verknuepfungen).joinedload(SchulungThema.thema),
+        )
+
     @classmethod
     def get_aktive(cls):
         """Get all active trainings ordered by sortierung."""
-        return cls.query.filter_by(aktiv=True).order_by(cls.sortierung, cls.titel).all()
+        return cls.query.options(
+            *cls._listen_optionen()
+        ).filter_by(aktiv=True).order_by(cls.sortierung, cls.titel).all()
 
     @classmethod
     def get_mit_kommenden_terminen(cls):
         """Get active trainings that have upcoming executions."""
-        from app.models.schulungsdurchfuehrung import DurchfuehrungStatus
-        heute = date.today()
-
-        return cls.query.filter_by(aktiv=True).filter(
-            cls.durchfuehrungen.any(
-                db.and_(
-                    db.or_(
-                        Schulungsdurchfuehrung.status == DurchfuehrungStatus.GEPLANT.value,
-                        Schulungsdurchfuehrung.status == DurchfuehrungStatus.AKTIV.value
-                    ),
-                    Schulungsdurchfuehrung.start_datum >= heute
-                )
-            )
-        ).order_by(cls.sortierung, cls.titel).all()
+        heute = request_today()
+
+        # JOIN + DISTINCT statt korreliertem EXISTS (nutzt ix_durchf_schulung_start)
+        return cls.query.options(
+            *cls._listen_optionen()
+        ).join(
+            Schulungsdurchfuehrung, Schulungsdurchfuehrung.schulung_id == cls.id
+        ).filter(
+            cls.aktiv == True,
+            Schulungsdurchfuehrung.status.in_(_OFFENE_STATUS),
+            Schulungsdurchfuehrung.start_datum >= heute
+        ).order_by(cls.sortierung, cls.titel).distinct().all()
+
+    @classmethod
+    def list_with_summary(cls, suchbegriff: str = None, limit: int = 50) -> list:
+        """Katalogzeilen für aktive Schulungen in einer flachen SQL-Query.
+
+        Liefert Preis, Themen-Kennzahlen und die nächste Durchführung samt
+        Buchungszähler ohne ORM-Objekte. Ohne Suchbegriff nur Schulungen mit
+        kommenden Terminen (wie get_mit_kommenden_terminen), mit Suchbegriff
+        alle Treffer bis ``limit`` (wie suche).
+
+        Returns:
+            Liste von SchulungSummary
+        """
+        from app.models.schulungsthema import Schulungsthema
+        heute = request_today()
+
+        # Nächste offene Durchführung je Schulung (korreliert, deterministisch)
+        naechste_id = db.select(Schulungsdurchfuehrung.id).where(
+            Schulungsdurchfuehrung.schulung_id == cls.id,
+            Schulungsdurchfuehrung.status.in_(_OFFENE_STATUS),
+            Schulungsdurchfuehrung.start_datum >= heute
+        ).order_by(
+            Schulungsdurchfuehrung.start_datum, Schulungsdurchfuehrung.id
+        ).limit(1).correlate(cls).scalar_subquery()
+        naechste = db.aliased(Schulungsdurchfuehrung)
+
+        themen = db.select(
+            SchulungThema.schulung_id,
+            db.func.count(SchulungThema.id).label('anzahl'),
+            db.func.coalesce(db.func.sum(Schulungsthema.dauer_minuten), 0).label('dauer')
+        ).join(
+            Schulungsthema, Schulungsthema.id == SchulungThema.thema_id
+        ).group_by(SchulungThema.schulung_id).subquery()
+
+        stmt = db.select(
+            cls.id, cls.titel, cls.preis, cls.aktueller_preis, cls.max_teilnehmer,
+            db.func.coalesce(themen.c.anzahl, 0),
+            db.func.coalesce(themen.c.dauer, 0),
+            naechste.id, naechste.start_datum,
+            db.func.coalesce(naechste.gebucht_count, 0)
+        ).outerjoin(
+            themen, themen.c.schulung_id == cls.id
+        ).outerjoin(
+            naechste, naechste.id == naechste_id
+        ).where(cls.aktiv == True)
+
+        if suchbegriff:
+            pattern = f'%{suchbegriff}%'
+            stmt = stmt.where(db.or_(cls.titel.ilike(pattern), cls.beschreibung.ilike(pattern)))
+            stmt = stmt.limit(limit)
+        else:
+            stmt = stmt.where(naechste.id.isnot(None))
+
+        stmt = stmt.order_by(cls.sortierung, cls.titel)
+        return [SchulungSummary(*row) for row in db.session.execute(stmt)]
 
     @classmethod
     def suche(cls, suchbegriff: str, nur_aktive: bool = True, limit: int = 50):
-        """Search trainings by title or description."""
+        """Search trainings by title or description.
+
+        On PostgreSQL the ILIKE filters are served by the trigram GIN
+        index ix_schulung_trgm (migration 7c2d5e9f0b31).
+        """
         pattern = f'%{suchbegriff}%'
-        query = cls.query.filter(
+        query = cls.query.options(*cls._listen_optionen()).filter(
             db.or_(
                 cls.titel.ilike(pattern),
                 cls.beschreibung.ilike(pattern)
@@ -222,8 +369,29 @@ class Schulung(db.Model):
         return query.order_by(cls.sortierung, cls.titel).limit(limit).all()
 
 
+@db.event.listens_for(Schulung.thema_verknuepfungen, 'append')
+@db.event.listens_for(Schulung.thema_verknuepfungen, 'remove')
+def _reset_themen_cache(schulung, *args):
+    schulung.reset_themen_cache()
+
+
+@db.event.listens_for(Schulung, 'expire')
+def _reset_themen_cache_bei_expire(schulung, attrs):
+    # Beim Commit kann die Instanz bereits eingesammelt sein
+    if schulung is not None:
+        schulung.reset_themen_cache()
+
+
+@db.event.listens_for(Schulung, 'refresh')
+def _reset_themen_cache_bei_refresh(schulung, context, attrs):
+    schulung.reset_themen_cache()
+
+
 # Import here to avoid circular imports
-from app.models.schulungsdurchfuehrung import Schulungsdurchfuehrung
+from app.models.schulungsdurchfuehrung import Schulungsdurchfuehrung, DurchfuehrungStatus
+
+# Status kommender Durchführungen (geplant/aktiv)
+_OFFENE_STATUS = (DurchfuehrungStatus.GEPLANT.value, DurchfuehrungStatus.AKTIV.value)
 
 
 class SchulungThema(db.Model):
@@ -234,6 +402,8 @@ class SchulungThema(db.Model):
     __tablename__ = 'schulung_thema'
     __table_args__ = (
         db.UniqueConstraint('schulung_id', 'thema_id', name='uq_schulung_thema'),
+        # Schulung.thema_verknuepfungen (order_by sortierung)
+        db.Index('ix_schulung_thema_schulung_sort', 'schulung_id', 'sortierung'),
     )
 
     id = db.Column(db.Integer, primary_key=True)
@@ -8,6 +8,7 @@ from datetime import datetime, date
 from decimal import Decimal
 from enum import Enum
 from app import db
+from app.utils import request_today
 
 
 class BuchungStatus(Enum):
@@ -17,11 +18,21 @@ class BuchungStatus(Enum):
     STORNIERT = 'storniert'     # Storniert
 
 
+# Status-Werte einmalig beim Import binden (Hot Path in Properties/Filtern)
+_GEBUCHT = BuchungStatus.GEBUCHT.value
+_WARTELISTE = BuchungStatus.WARTELISTE.value
+_STORNIERT = BuchungStatus.STORNIERT.value
+
+
 class Schulungsbuchung(db.Model):
     """Buchung einer Schulungsdurchführung durch einen Kunden."""
     __tablename__ = 'schulungsbuchung'
     __table_args__ = (
         db.UniqueConstraint('kunde_id', 'durchfuehrung_id', name='uq_kunde_durchfuehrung'),
+        # Zählung je Durchführung und Status (u.a. Backfill der Buchungszähler)
+        db.Index('ix_buchung_durchf_status', 'durchfuehrung_id', 'status'),
+        # get_fuer_export: Status + Buchungszeitraum
+        db.Index('ix_buchung_status_gebucht_am', 'status', 'gebucht_am'),
     )
 
     id = db.Column(db.Integer, primary_key=True)
@@ -38,10 +49,11 @@ class Schulungsbuchung(db.Model):
 
     # === STATUS ===
 
+    # Native ENUM-Typ (PostgreSQL/MySQL), Python-seitig weiterhin der String-Wert
     status = db.Column(
-        db.String(20),
+        db.Enum(*[s.value for s in BuchungStatus], name='buchung_status', length=20),
         nullable=False,
-        default=BuchungStatus.GEBUCHT.value
+        default=_GEBUCHT
     )
 
     # === PREIS ===
@@ -77,15 +89,15 @@ class Schulungsbuchung(db.Model):
 
     @property
     def is_gebucht(self) -> bool:
-        return self.status == BuchungStatus.GEBUCHT.value
+        return self.status == _GEBUCHT
 
     @property
     def is_warteliste(self) -> bool:
-        return self.status == BuchungStatus.WARTELISTE.value
+        return self.status == _WARTELISTE
 
     @property
     def is_storniert(self) -> bool:
-        return self.status == BuchungStatus.STORNIERT.value
+        return self.status == _STORNIERT
 
     @property
     def schulung(self):
@@ -107,14 +119,14 @@ class Schulungsbuchung(db.Model):
             return False
         if not self.storno_frist_datum:
             return False
-        return date.today() <= self.storno_frist_datum
+        return request_today() <= self.storno_frist_datum
 
     @property
     def tage_bis_storno_frist(self) -> int:
         """Anzahl Tage bis zur Storno-Frist (negativ = überschritten)."""
         if not self.storno_frist_datum:
             return 0
-        delta = self.storno_frist_datum - date.today()
+        delta = self.storno_frist_datum - request_today()
         return delta.days
 
     # === STATUS TRANSITIONS ===
@@ -123,23 +135,26 @@ class Schulungsbuchung(db.Model):
         """Buchung stornieren."""
         if self.is_storniert:
             raise ValueError('Buchung ist bereits storniert')
-        self.status = BuchungStatus.STORNIERT.value
+        self.status = _STORNIERT
         self.storniert_am = datetime.utcnow()
 
     def auf_warteliste_setzen(self):
         """Buchung auf Warteliste setzen."""
         if not self.is_gebucht:
             raise ValueError('Nur gebuchte Buchungen können auf die Warteliste gesetzt werden')
-        self.status = BuchungStatus.WARTELISTE.value
+        self.status = _WARTELISTE
 
     def von_warteliste_freischalten(self):
         """Buchung von Warteliste auf gebucht setzen."""
         if not self.is_warteliste:
             raise ValueError('Nur Wartelisten-Buchungen können freigeschaltet werden')
-        self.status = BuchungStatus.GEBUCHT.value
+        self.status = _GEBUCHT
 
     def to_dict(self, include_kunde: bool = False, include_durchfuehrung: bool = False):
         """Serialization for API/Export."""
+        # Storno-Frist einmal berechnen (sonst 3x über durchfuehrung.schulung)
+        storno_frist_datum = self.storno_frist_datum
+
         data = {
             'id': self.id,
             'kunde_id': self.kunde_id,
@@ -149,8 +164,11 @@ class Schulungsbuchung(db.Model):
             'gebucht_am': self.gebucht_am.isoformat() if self.gebucht_am else None,
             'storniert_am': self.storniert_am.isoformat() if self.storniert_am else None,
             'anmerkungen': self.anmerkungen,
-            'kann_storniert_werden': self.kann_storniert_werden,
-            'storno_frist_datum': self.storno_frist_datum.isoformat() if self.storno_frist_datum else None,
+            'kann_storniert_werden': (
+                not self.is_storniert and storno_frist_datum is not None
+                and request_today() <= storno_frist_datum
+            ),
+            'storno_frist_datum': storno_frist_datum.isoformat() if storno_frist_datum else None,
             'created_at': self.created_at.isoformat() if self.created_at else None,
         }
 
@@ -173,7 +191,7 @@ class Schulungsbuchung(db.Model):
         """Get all bookings for a customer."""
         query = cls.query.filter_by(kunde_id=kunde_id)
         if nur_aktive:
-            query = query.filter(cls.status != BuchungStatus.STORNIERT.value)
+            query = query.filter(cls.status != _STORNIERT)
         return query.order_by(cls.gebucht_am.desc()).all()
 
     @classmethod
@@ -184,10 +202,13 @@ class Schulungsbuchung(db.Model):
     @classmethod
     def kunde_hat_gebucht(cls, kunde_id: int, durchfuehrung_id: int) -> bool:
         """Check if a customer has an active booking for an execution."""
-        return cls.query.filter_by(
-            kunde_id=kunde_id,
-            durchfuehrung_id=durchfuehrung_id
-        ).filter(cls.status != BuchungStatus.STORNIERT.value).first() is not None
+        return db.session.query(
+            db.exists().where(
+                cls.kunde_id == kunde_id,
+                cls.durchfuehrung_id == durchfuehrung_id,
+                cls.status != _STORNIERT
+            )
+        ).scalar()
 
     @classmethod
     def get_fuer_export(cls, von_datum: date = None, bis_datum: date = None):
@@ -195,12 +216,15 @@ class Schulungsbuchung(db.Model):
 
         Returns bookings with status=gebucht within date range.
         """
-        query = cls.query.filter_by(status=BuchungStatus.GEBUCHT.value)
+        query = cls.query.filter_by(status=_GEBUCHT)
 
+        # Halboffenes Intervall [von, bis + 1 Tag) für ix_buchung_status_gebucht_am
         if von_datum:
             query = query.filter(cls.gebucht_am >= datetime.combine(von_datum, datetime.min.time()))
         if bis_datum:
-            query = query.filter(cls.gebucht_am <= datetime.combine(bis_datum, datetime.max.time()))
+            query = query.filter(
+                cls.gebucht_am < datetime.combine(bis_datum + timedelta(days=1), datetime.min.time())
+            )
 
         return query.order_by(cls.gebucht_am).all()
 
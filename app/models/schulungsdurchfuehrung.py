@@ -3,9 +3,14 @@
 Eine Durchführung ist eine konkrete Instanz einer Schulung mit festgelegten Terminen.
 Termine werden aus dem Terminmuster und den verknüpften Themen generiert.
 """
-from datetime import datetime, date, time
+from datetime import datetime, time
 from enum import Enum
+from functools import cached_property
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm.attributes import set_committed_value
 from app import db
+from app.models.schulungsbuchung import Schulungsbuchung, BuchungStatus
+from app.utils import request_today
 
 
 class DurchfuehrungStatus(Enum):
@@ -16,6 +21,15 @@ class DurchfuehrungStatus(Enum):
     ABGESAGT = 'abgesagt'         # Abgesagt (keine Durchführung)
 
 
+# Status-Werte einmalig beim Import binden (Hot Path in Properties/Filtern)
+_GEPLANT = DurchfuehrungStatus.GEPLANT.value
+_AKTIV = DurchfuehrungStatus.AKTIV.value
+_ABGESCHLOSSEN = DurchfuehrungStatus.ABGESCHLOSSEN.value
+_ABGESAGT = DurchfuehrungStatus.ABGESAGT.value
+_BUCHUNG_GEBUCHT = BuchungStatus.GEBUCHT.value
+_BUCHUNG_WARTELISTE = BuchungStatus.WARTELISTE.value
+
+
 class Schulungsdurchfuehrung(db.Model):
     """Konkrete Instanz einer Schulung mit Terminen.
 
@@ -27,6 +41,12 @@ class Schulungsdurchfuehrung(db.Model):
     }
     """
     __tablename__ = 'schulungsdurchfuehrung'
+    __table_args__ = (
+        # get_kommende: Status-Filter + Datumsbereich
+        db.Index('ix_durchf_status_start', 'status', 'start_datum'),
+        # get_by_schulung / Schulung.durchfuehrungen
+        db.Index('ix_durchf_schulung_start', 'schulung_id', 'start_datum'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
 
@@ -38,8 +58,8 @@ class Schulungsdurchfuehrung(db.Model):
     # Erster Schulungstag
     start_datum = db.Column(db.Date, nullable=False)
 
-    # Terminmuster als JSON
-    terminmuster = db.Column(db.JSON, nullable=False)
+    # Terminmuster als JSON (PostgreSQL: binär als JSONB)
+    terminmuster = db.Column(db.JSON().with_variant(JSONB(), 'postgresql'), nullable=False)
 
     # === TEAMS-MEETING ===
 
@@ -48,13 +68,19 @@ class Schulungsdurchfuehrung(db.Model):
 
     # === STATUS ===
 
-    # Aktueller Status
+    # Aktueller Status (native ENUM, Python-seitig weiterhin der String-Wert)
     status = db.Column(
-        db.String(20),
+        db.Enum(*[s.value for s in DurchfuehrungStatus], name='durchfuehrung_status', length=20),
         nullable=False,
-        default=DurchfuehrungStatus.GEPLANT.value
+        default=_GEPLANT
     )
 
+    # === BUCHUNGSZÄHLER ===
+
+    # Denormalisiert, gepflegt über Mapper-Events auf Schulungsbuchung (Modulende)
+    gebucht_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    warteliste_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
     # === NOTIZEN ===
 
     # Interne Anmerkungen (nur für Admins)
@@ -77,12 +103,14 @@ class Schulungsdurchfuehrung(db.Model):
         order_by='Schulungstermin.datum, Schulungstermin.uhrzeit_von'
     )
 
-    # Buchungen für diese Durchführung
+    # Buchungen für diese Durchführung (gebündelt per selectin geladen;
+    # für Paging query_buchungen() verwenden)
     buchungen = db.relationship(
         'Schulungsbuchung',
         back_populates='durchfuehrung',
         cascade='all, delete-orphan',
-        lazy='dynamic'
+        lazy='selectin',
+        order_by='Schulungsbuchung.gebucht_am'
     )
 
     def __repr__(self):
@@ -92,19 +120,19 @@ class Schulungsdurchfuehrung(db.Model):
 
     @property
     def is_geplant(self) -> bool:
-        return self.status == DurchfuehrungStatus.GEPLANT.value
+        return self.status == _GEPLANT
 
     @property
     def is_aktiv(self) -> bool:
-        return self.status == DurchfuehrungStatus.AKTIV.value
+        return self.status == _AKTIV
 
     @property
     def is_abgeschlossen(self) -> bool:
-        return self.status == DurchfuehrungStatus.ABGESCHLOSSEN.value
+        return self.status == _ABGESCHLOSSEN
 
     @property
     def is_abgesagt(self) -> bool:
-        return self.status == DurchfuehrungStatus.ABGESAGT.value
+        return self.status == _ABGESAGT
 
     @property
     def ist_buchbar(self) -> bool:
@@ -124,28 +152,22 @@ class Schulungsdurchfuehrung(db.Model):
     @property
     def anzahl_gebucht(self) -> int:
         """Anzahl verbindlicher Buchungen (Status = gebucht)."""
-        from app.models.schulungsbuchung import BuchungStatus
-        return self.buchungen.filter_by(status=BuchungStatus.GEBUCHT.value).count()
+        return self.gebucht_count or 0
 
     @property
     def anzahl_warteliste(self) -> int:
         """Anzahl Wartelisten-Buchungen."""
-        from app.models.schulungsbuchung import BuchungStatus
-        return self.buchungen.filter_by(status=BuchungStatus.WARTELISTE.value).count()
+        return self.warteliste_count or 0
 
     @property
     def teilnehmer_gebucht(self) -> list:
         """Alle verbindlichen Buchungen."""
-        from app.models.schulungsbuchung import BuchungStatus
-        return self.buchungen.filter_by(status=BuchungStatus.GEBUCHT.value).all()
+        return [b for b in self.buchungen if b.status == _BUCHUNG_GEBUCHT]
 
     @property
     def teilnehmer_warteliste(self) -> list:
         """Alle Wartelisten-Buchungen."""
-        from app.models.schulungsbuchung import BuchungStatus
-        return self.buchungen.filter_by(
-            status=BuchungStatus.WARTELISTE.value
-        ).order_by('gebucht_am').all()
+        return [b for b in self.buchungen if b.status == _BUCHUNG_WARTELISTE]
 
     @property
     def erster_termin(self):
@@ -157,7 +179,7 @@ class Schulungsdurchfuehrung(db.Model):
         """Letzter Termin dieser Durchführung."""
         return self.termine[-1] if self.termine else None
 
-    @property
+    @cached_property
     def wochentage_formatiert(self) -> str:
         """Formatierte Wochentage aus Terminmuster."""
         if not self.terminmuster:
@@ -165,39 +187,53 @@ class Schulungsdurchfuehrung(db.Model):
         wochentage = self.terminmuster.get('wochentage', [])
         return ', '.join(wochentage)
 
-    @property
+    @cached_property
     def uhrzeit_formatiert(self) -> str:
         """Formatierte Uhrzeit aus Terminmuster."""
         if not self.terminmuster:
             return ''
         return self.terminmuster.get('uhrzeit', '')
 
+    def query_buchungen(self):
+        """Bookings as query (e.g. for paging in admin views)."""
+        from app.models.schulungsbuchung import Schulungsbuchung
+        return Schulungsbuchung.query.filter_by(
+            durchfuehrung_id=self.id
+        ).order_by(Schulungsbuchung.gebucht_am)
+
     # === STATUS TRANSITIONS ===
 
     def aktivieren(self):
         """Set status to AKTIV."""
-        if self.status != DurchfuehrungStatus.GEPLANT.value:
+        if self.status != _GEPLANT:
             raise ValueError('Nur geplante Durchführungen können aktiviert werden')
-        self.status = DurchfuehrungStatus.AKTIV.value
+        self.status = _AKTIV
 
     def abschliessen(self):
         """Set status to ABGESCHLOSSEN."""
-        if self.status != DurchfuehrungStatus.AKTIV.value:
+        if self.status != _AKTIV:
             raise ValueError('Nur aktive Durchführungen können abgeschlossen werden')
-        self.status = DurchfuehrungStatus.ABGESCHLOSSEN.value
+        self.status = _ABGESCHLOSSEN
 
     def absagen(self):
         """Set status to ABGESAGT."""
-        if self.status not in [DurchfuehrungStatus.GEPLANT.value, DurchfuehrungStatus.AKTIV.value]:
+        if self.status not in [_GEPLANT, _AKTIV]:
             raise ValueError('Nur geplante oder aktive Durchführungen können abgesagt werden')
-        self.status = DurchfuehrungStatus.ABGESAGT.value
+        self.status = _ABGESAGT
 
     def to_dict(self, include_termine: bool = False, include_buchungen: bool = False):
         """Serialization for API/Export."""
+        # Abgeleitete Platz-Kennzahlen einmal berechnen statt über die
+        # verketteten Properties (freie_plaetze → anzahl_gebucht) je Feld
+        schulung = self.schulung
+        anzahl_gebucht = self.anzahl_gebucht
+        freie_plaetze = max(0, schulung.max_teilnehmer - anzahl_gebucht)
+        ist_ausgebucht = freie_plaetze <= 0
+
         data = {
             'id': self.id,
             'schulung_id': self.schulung_id,
-            'schulung_titel': self.schulung.titel if self.schulung else None,
+            'schulung_titel': schulung.titel,
             'start_datum': self.start_datum.isoformat() if self.start_datum else None,
             'terminmuster': self.terminmuster,
             'wochentage': self.wochentage_formatiert,
@@ -205,12 +241,12 @@ class Schulungsdurchfuehrung(db.Model):
             'teams_link': self.teams_link,
             'status': self.status,
             'anmerkungen': self.anmerkungen,
-            'freie_plaetze': self.freie_plaetze,
-            'ist_ausgebucht': self.ist_ausgebucht,
-            'ist_buchbar': self.ist_buchbar,
-            'anzahl_gebucht': self.anzahl_gebucht,
+            'freie_plaetze': freie_plaetze,
+            'ist_ausgebucht': ist_ausgebucht,
+            'ist_buchbar': self.is_geplant and not ist_ausgebucht,
+            'anzahl_gebucht': anzahl_gebucht,
             'anzahl_warteliste': self.anzahl_warteliste,
-            'max_teilnehmer': self.schulung.max_teilnehmer if self.schulung else None,
+            'max_teilnehmer': schulung.max_teilnehmer,
             'created_at': self.created_at.isoformat() if self.created_at else None,
         }
 
@@ -218,7 +254,7 @@ class Schulungsdurchfuehrung(db.Model):
             data['termine'] = [t.to_dict() for t in self.termine]
 
         if include_buchungen:
-            data['buchungen'] = [b.to_dict() for b in self.buchungen.all()]
+            data['buchungen'] = [b.to_dict() for b in self.buchungen]
 
         return data
 
@@ -226,12 +262,17 @@ class Schulungsdurchfuehrung(db.Model):
 
     @classmethod
     def get_kommende(cls, limit: int = 20):
-        """Get upcoming executions (geplant/aktiv, ab heute)."""
-        heute = date.today()
-        return cls.query.filter(
+        """Get upcoming executions (geplant/aktiv, ab heute).
+
+        Die Schulung wird per JOIN mitgeladen (freie_plaetze, Titel in Listen).
+        """
+        heute = request_today()
+        return cls.query.options(
+            db.joinedload(cls.schulung)
+        ).filter(
             db.or_(
-                cls.status == DurchfuehrungStatus.GEPLANT.value,
-                cls.status == DurchfuehrungStatus.AKTIV.value
+                cls.status == _GEPLANT,
+                cls.status == _AKTIV
             ),
             cls.start_datum >= heute
         ).order_by(cls.start_datum).limit(limit).all()
@@ -242,11 +283,11 @@ class Schulungsdurchfuehrung(db.Model):
         query = cls.query.filter_by(schulung_id=schulung_id)
 
         if nur_kommende:
-            heute = date.today()
+            heute = request_today()
             query = query.filter(
                 db.or_(
-                    cls.status == DurchfuehrungStatus.GEPLANT.value,
-                    cls.status == DurchfuehrungStatus.AKTIV.value
+                    cls.status == _GEPLANT,
+                    cls.status == _AKTIV
                 ),
                 cls.start_datum >= heute
             )
@@ -257,6 +298,9 @@ class Schulungsdurchfuehrung(db.Model):
 class Schulungstermin(db.Model):
     """Konkreter Kalender-Termin (generiert aus Durchführung + Thema)."""
     __tablename__ = 'schulungstermin'
+    __table_args__ = (
+        db.Index('ix_termin_durchf_datum', 'durchfuehrung_id', 'datum', 'uhrzeit_von'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
 
@@ -294,23 +338,21 @@ class Schulungstermin(db.Model):
     @property
     def ist_vergangen(self) -> bool:
         """True wenn der Termin in der Vergangenheit liegt."""
-        heute = date.today()
+        heute = request_today()
         return self.datum < heute
 
     @property
     def ist_heute(self) -> bool:
         """True wenn der Termin heute ist."""
-        return self.datum == date.today()
+        return self.datum == request_today()
 
-    @property
+    @cached_property
     def dauer_minuten(self) -> int:
         """Dauer des Termins in Minuten."""
-        von = datetime.combine(date.today(), self.uhrzeit_von)
-        bis = datetime.combine(date.today(), self.uhrzeit_bis)
-        delta = bis - von
-        return int(delta.total_seconds() / 60)
+        von, bis = self.uhrzeit_von, self.uhrzeit_bis
+        return (bis.hour - von.hour) * 60 + (bis.minute - von.minute)
 
-    @property
+    @cached_property
     def zeitraum_formatiert(self) -> str:
         """Formatierter Zeitraum (z.B. '14:00 - 15:30')."""
         return f'{self.uhrzeit_von.strftime("%H:%M")} - {self.uhrzeit_bis.strftime("%H:%M")}'
@@ -331,3 +373,88 @@ class Schulungstermin(db.Model):
             'ist_vergangen': self.ist_vergangen,
             'ist_heute': self.ist_heute,
         }
+
+    # === CLASS METHODS ===
+
+    @classmethod
+    def bulk_create(cls, durchfuehrung_id: int, records: list):
+        """Insert many dates for one execution without the unit of work.
+
+        Args:
+            durchfuehrung_id: Execution the dates belong to
+            records: Dicts with the column values (thema_id, termin_nummer,
+                datum, uhrzeit_von, uhrzeit_bis)
+        """
+        db.session.bulk_insert_mappings(
+            cls, [{**record, 'durchfuehrung_id': durchfuehrung_id} for record in records]
+        )
+
+
+@db.event.listens_for(Schulungsdurchfuehrung.terminmuster, 'set')
+def _reset_terminmuster_cache(durchfuehrung, *args):
+    durchfuehrung.__dict__.pop('wochentage_formatiert', None)
+    durchfuehrung.__dict__.pop('uhrzeit_formatiert', None)
+
+
+@db.event.listens_for(Schulungstermin.uhrzeit_von, 'set')
+@db.event.listens_for(Schulungstermin.uhrzeit_bis, 'set')
+def _reset_zeitraum_cache(termin, *args):
+    termin.__dict__.pop('dauer_minuten', None)
+    termin.__dict__.pop('zeitraum_formatiert', None)
+
+
+# === BUCHUNGSZÄHLER-EVENTS ===
+
+_ZAEHLER_SPALTEN = {
+    _BUCHUNG_GEBUCHT: 'gebucht_count',
+    _BUCHUNG_WARTELISTE: 'warteliste_count',
+}
+
+
+def _zaehler_anpassen(connection, buchung, durchfuehrung_id, status, delta):
+    """Zähler der Durchführung per UPDATE anpassen und geladene Instanz nachziehen."""
+    spalte = _ZAEHLER_SPALTEN.get(status)
+    if spalte is None or durchfuehrung_id is None:
+        return
+
+    tabelle = Schulungsdurchfuehrung.__table__
+    connection.execute(
+        tabelle.update()
+        .where(tabelle.c.id == durchfuehrung_id)
+        .values({spalte: tabelle.c[spalte] + delta})
+    )
+
+    session = db.object_session(buchung)
+    if session is not None:
+        key = db.inspect(Schulungsdurchfuehrung).identity_key_from_primary_key((durchfuehrung_id,))
+        durchfuehrung = session.identity_map.get(key)
+        if durchfuehrung is not None and spalte in durchfuehrung.__dict__:
+            set_committed_value(durchfuehrung, spalte, durchfuehrung.__dict__[spalte] + delta)
+
+
+@db.event.listens_for(Schulungsbuchung, 'after_insert')
+def _zaehler_nach_insert(mapper, connection, buchung):
+    _zaehler_anpassen(connection, buchung, buchung.durchfuehrung_id, buchung.status, 1)
+
+
+@db.event.listens_for(Schulungsbuchung, 'after_delete')
+def _zaehler_nach_delete(mapper, connection, buchung):
+    status = db.inspect(buchung).committed_state.get('status', buchung.status)
+    _zaehler_anpassen(connection, buchung, buchung.durchfuehrung_id, status, -1)
+
+
+@db.event.listens_for(Schulungsbuchung, 'after_update')
+def _zaehler_nach_update(mapper, connection, buchung):
+    attrs = db.inspect(buchung).attrs
+    status_alt = attrs.status.history.deleted
+    durchfuehrung_alt = attrs.durchfuehrung_id.history.deleted
+    if not status_alt and not durchfuehrung_alt:
+        return
+
+    _zaehler_anpassen(
+        connection, buchung,
+        durchfuehrung_alt[0] if durchfuehrung_alt else buchung.durchfuehrung_id,
+        status_alt[0] if status_alt else buchung.status,
+        -1
+    )
+    _zaehler_anpassen(connection, buchung, buchung.durchfuehrung_id, buchung.status, 1)
@@ -4,8 +4,8 @@ Ein Schulungsthema ist ein einzelner Lernblock, der in mehreren Schulungen
 verwendet werden kann. Themen haben eine definierte Dauer und können mit
 Beschreibungen/Markdown-Inhalten versehen werden.
 """
-from datetime import datetime
 from app import db
+from app.models.sql_functions import utcnow
 
 
 class Schulungsthema(db.Model):
@@ -32,8 +32,8 @@ class Schulungsthema(db.Model):
 
     # === META ===
 
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
+    updated_at = db.Column(db.DateTime, onupdate=utcnow())
 
     # === RELATIONSHIPS ===
 
@@ -57,18 +57,9 @@ class Schulungsthema(db.Model):
     @property
     def dauer_formatiert(self) -> str:
         """Formatierte Dauer (z.B. '1h 30min' oder '45min')."""
-        if self.dauer_minuten >= 60:
-            stunden = self.dauer_minuten // 60
-            minuten = self.dauer_minuten % 60
-            if minuten > 0:
-                return f'{stunden}h {minuten}min'
-            return f'{stunden}h'
-        return f'{self.dauer_minuten}min'
+        return _format_dauer(self.dauer_minuten)
 
-    @property
-    def anzahl_schulungen(self) -> int:
-        """Anzahl der Schulungen, die dieses Thema verwenden."""
-        return len(self.schulung_verknuepfungen)
+    # anzahl_schulungen: COUNT-Subquery als deferred column_property (Modulende)
 
     def to_dict(self):
         """Serialization for API/Export."""
@@ -92,14 +83,50 @@ class Schulungsthema(db.Model):
 
     @classmethod
     def suche(cls, suchbegriff: str, nur_aktive: bool = True, limit: int = 50):
-        """Search themes by title or description."""
-        pattern = f'%{suchbegriff}%'
-        query = cls.query.filter(
-            db.or_(
-                cls.titel.ilike(pattern),
-                cls.beschreibung.ilike(pattern)
-            )
-        )
-        if nur_aktive:
-            query = query.filter_by(aktiv=True)
-        return query.order_by(cls.titel).limit(limit).all()
+        """Search themes by title or description.
+
+        Vergleicht lower(Spalte) LIKE lower(Begriff), damit PostgreSQL die
+        Trigram-Indizes auf lower(titel)/lower(beschreibung) nutzen kann.
+        """
+        stmt = _SUCHE_AKTIV_STMT if nur_aktive else _SUCHE_STMT
+        return db.session.execute(
+            stmt, {'pattern': f'%{suchbegriff.lower()}%', 'limit': limit}
+        ).scalars().all()
+
+
+# Such-Statements einmalig aufbauen; Begriff und Limit sind Bind-Parameter,
+# so wird pro Aufruf weder das Statement neu gebaut noch das SQL variiert
+_SUCHE_STMT = db.select(Schulungsthema).where(
+    db.or_(
+        db.func.lower(Schulungsthema.titel).like(db.bindparam('pattern')),
+        db.func.lower(Schulungsthema.beschreibung).like(db.bindparam('pattern'))
+    )
+).order_by(Schulungsthema.titel).limit(db.bindparam('limit'))
+_SUCHE_AKTIV_STMT = _SUCHE_STMT.where(Schulungsthema.aktiv == db.true())
+
+
+# Import here to avoid circular imports
+from app.models.schulung import Schulung, SchulungThema, _format_dauer
+
+# Anzahl der Schulungen, die dieses Thema verwenden. Zählt in der DB statt
+# alle Verknüpfungen zu laden; in Listen per undefer() mitselektieren.
+Schulungsthema.anzahl_schulungen = db.column_property(
+    db.select(db.func.count(SchulungThema.id))
+    .where(SchulungThema.thema_id == Schulungsthema.id)
+    .correlate_except(SchulungThema)
+    .scalar_subquery(),
+    deferred=True
+)
+
+
+@db.event.listens_for(Schulungsthema.dauer_minuten, 'set')
+def _reset_themen_cache_bei_dauer(thema, *args):
+    # Gesamtdauer der in der Session geladenen Schulungen neu berechnen
+    # lassen (thema.schulung_verknuepfungen ist meist nicht geladen)
+    session = db.object_session(thema)
+    if session is None:
+        return
+    for obj in list(session.identity_map.values()):
+        verknuepfungen = obj.__dict__.get('thema_verknuepfungen', ())
+        if isinstance(obj, Schulung) and any(vk.thema_id == thema.id for vk in verknuepfungen):
+            obj.reset_themen_cache()
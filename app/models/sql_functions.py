@@ -0,0 +1,36 @@
+"""Portable SQL functions shared by the models.
+
+``utcnow()`` renders the current UTC timestamp on the database side, so
+timestamp columns can be filled via ``server_default``/``onupdate`` without
+a Python call per row. The values stay naive UTC, matching the
+``datetime.utcnow()`` comparisons used throughout the application.
+"""
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.types import DateTime
+
+
+class utcnow(FunctionElement):
+    """Current UTC timestamp (naive), evaluated by the database."""
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    # SQLite: 'now' is UTC. CURRENT_TIMESTAMP only has whole seconds, which
+    # would make rows from the same second tie in ORDER BY timestamp.
+    # Parentheses: SQLite only accepts expression defaults in parentheses
+    return "(strftime('%Y-%m-%d %H:%M:%f', 'now'))"
+
+
+@compiles(utcnow, 'postgresql')
+def _utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow, 'mysql')
+@compiles(utcnow, 'mariadb')
+def _utcnow_mysql(element, compiler, **kw):
+    # Parentheses: MySQL 8 only accepts expression defaults in parentheses
+    return '(UTC_TIMESTAMP())'
@@ -0,0 +1,36 @@
+"""Column types shared by the models.
+
+``StringEnum`` stores a Python ``Enum`` as its plain string value in a
+VARCHAR column. Existing tables keep their schema (no native ENUM type,
+no migration), reads still return plain strings for templates and JSON,
+but writes reject values that are not part of the enum.
+"""
+from sqlalchemy.types import String, TypeDecorator
+
+
+class StringEnum(TypeDecorator):
+    """VARCHAR column restricted to the values of ``enum_class``."""
+    impl = String
+    # Parameter (Enum-Klasse, Länge) sind hashbar -> Statement-Cache nutzbar
+    cache_ok = True
+
+    def __init__(self, enum_class, length=None):
+        super().__init__(length)
+        self.enum_class = enum_class
+        self.length = length
+        self._werte = frozenset(e.value for e in enum_class)
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, self.enum_class):
+            return value.value
+        if value not in self._werte:
+            raise ValueError(
+                f'{value!r} ist kein gültiger Wert für {self.enum_class.__name__}'
+            )
+        return value
+
+    def coerce_compared_value(self, op, value):
+        # Filter nicht validieren: unbekannte Werte liefern einfach keine Treffer
+        return String(self.length)
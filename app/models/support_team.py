@@ -3,9 +3,10 @@
 This module contains the SupportTeam and SupportTeamMitglied models
 for managing support teams and their members.
 """
-from datetime import datetime
+from flask import g, has_request_context
 
 from app import db
+from app.models.sql_functions import utcnow
 
 
 class SupportTeam(db.Model):
@@ -22,13 +23,15 @@ class SupportTeam(db.Model):
     email = db.Column(db.String(120), nullable=True)  # Optional team email
     icon = db.Column(db.String(50), default='ti-users')
     aktiv = db.Column(db.Boolean, default=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
 
     # Relationships
+    # Mitglieder werden per selectin mitgeladen (N Teams = 2 Queries); mit
+    # Usern über with_active_members() bzw. .joinedload(SupportTeamMitglied.user)
     mitglieder = db.relationship(
         'SupportTeamMitglied',
         backref='team',
-        lazy='dynamic',
+        lazy='selectin',
         cascade='all, delete-orphan'
     )
     tickets = db.relationship(
@@ -58,10 +61,29 @@ class SupportTeam(db.Model):
         """Get the team leader(s)."""
         return [m for m in self.mitglieder if m.ist_teamleiter]
 
+    @classmethod
+    def with_active_members(cls, team_id):
+        """Load a team with its members and their users in two queries.
+
+        Use before aktive_mitglieder / mitglieder_mit_benachrichtigung so the
+        properties do not lazy-load one user per member.
+        """
+        return cls.query.options(
+            db.selectinload(cls.mitglieder).joinedload(SupportTeamMitglied.user)
+        ).filter_by(id=team_id).one()
+
     @classmethod
     def get_default_team(cls):
-        """Get the default support team (first active team)."""
-        return cls.query.filter_by(aktiv=True).first()
+        """Get the default support team (first active team).
+
+        Cached in flask.g for the current request; outside a request
+        (CLI, scheduler) this queries every time.
+        """
+        if not has_request_context():
+            return cls.query.filter_by(aktiv=True).first()
+        if 'default_support_team' not in g:
+            g.default_support_team = cls.query.filter_by(aktiv=True).first()
+        return g.default_support_team
 
 
 class SupportTeamMitglied(db.Model):
@@ -84,7 +106,7 @@ class SupportTeamMitglied(db.Model):
     )
     ist_teamleiter = db.Column(db.Boolean, default=False)
     benachrichtigung_aktiv = db.Column(db.Boolean, default=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
 
     # Relationships
     user = db.relationship('User', backref='support_team_mitgliedschaften')
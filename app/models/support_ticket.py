@@ -7,6 +7,7 @@ from datetime import datetime
 from enum import Enum
 
 from app import db
+from app.models.sql_functions import utcnow
 
 
 class TicketTyp(str, Enum):
@@ -21,28 +22,12 @@ class TicketTyp(str, Enum):
     @classmethod
     def choices(cls):
         """Return choices for form select fields."""
-        labels = {
-            cls.FRAGE: 'Frage',
-            cls.VERBESSERUNG: 'Verbesserungsvorschlag',
-            cls.BUG: 'Fehlermeldung',
-            cls.SCHULUNG: 'Schulungsanfrage',
-            cls.DATEN: 'Datenkorrektur',
-            cls.SONSTIGES: 'Sonstiges',
-        }
-        return [(t.value, labels[t]) for t in cls]
+        return cls._CHOICES
 
     @classmethod
     def get_label(cls, value):
         """Get the German label for a ticket type value."""
-        labels = {
-            cls.FRAGE.value: 'Frage',
-            cls.VERBESSERUNG.value: 'Verbesserungsvorschlag',
-            cls.BUG.value: 'Fehlermeldung',
-            cls.SCHULUNG.value: 'Schulungsanfrage',
-            cls.DATEN.value: 'Datenkorrektur',
-            cls.SONSTIGES.value: 'Sonstiges',
-        }
-        return labels.get(value, value)
+        return cls._LABELS.get(value, value)
 
     @classmethod
     def get_icon(cls, value):
@@ -50,16 +35,27 @@ class TicketTyp(str, Enum):
 
         Returns icon with 'ti ' prefix for Tabler Icons compatibility.
         """
-        icons = {
-            cls.FRAGE.value: 'ti-help',
-            cls.VERBESSERUNG.value: 'ti-bulb',
-            cls.BUG.value: 'ti-alert-triangle',  # Changed from ti-bug for better visibility
-            cls.SCHULUNG.value: 'ti-school',
-            cls.DATEN.value: 'ti-database-edit',
-            cls.SONSTIGES.value: 'ti-dots',
-        }
-        icon = icons.get(value, 'ti-ticket')
-        return f'ti {icon}'
+        return cls._ICONS.get(value, 'ti ti-ticket')
+
+
+# Lookup-Tabellen einmalig beim Import aufbauen statt pro Aufruf
+TicketTyp._LABELS = {
+    TicketTyp.FRAGE.value: 'Frage',
+    TicketTyp.VERBESSERUNG.value: 'Verbesserungsvorschlag',
+    TicketTyp.BUG.value: 'Fehlermeldung',
+    TicketTyp.SCHULUNG.value: 'Schulungsanfrage',
+    TicketTyp.DATEN.value: 'Datenkorrektur',
+    TicketTyp.SONSTIGES.value: 'Sonstiges',
+}
+TicketTyp._ICONS = {
+    TicketTyp.FRAGE.value: 'ti ti-help',
+    TicketTyp.VERBESSERUNG.value: 'ti ti-bulb',
+    TicketTyp.BUG.value: 'ti ti-alert-triangle',  # Changed from ti-bug for better visibility
+    TicketTyp.SCHULUNG.value: 'ti ti-school',
+    TicketTyp.DATEN.value: 'ti ti-database-edit',
+    TicketTyp.SONSTIGES.value: 'ti ti-dots',
+}
+TicketTyp._CHOICES = tuple((t.value, TicketTyp._LABELS[t.value]) for t in TicketTyp)
 
 
 class TicketStatus(str, Enum):
@@ -73,43 +69,50 @@ class TicketStatus(str, Enum):
     @classmethod
     def choices(cls):
         """Return choices for form select fields."""
-        labels = {
-            cls.OFFEN: 'Offen',
-            cls.IN_BEARBEITUNG: 'In Bearbeitung',
-            cls.WARTE_AUF_KUNDE: 'Warte auf Kunde',
-            cls.GELOEST: 'Gelöst',
-            cls.GESCHLOSSEN: 'Geschlossen',
-        }
-        return [(t.value, labels[t]) for t in cls]
+        return cls._CHOICES
 
     @classmethod
     def get_label(cls, value):
         """Get the German label for a status value."""
-        labels = {
-            cls.OFFEN.value: 'Offen',
-            cls.IN_BEARBEITUNG.value: 'In Bearbeitung',
-            cls.WARTE_AUF_KUNDE.value: 'Warte auf Kunde',
-            cls.GELOEST.value: 'Gelöst',
-            cls.GESCHLOSSEN.value: 'Geschlossen',
-        }
-        return labels.get(value, value)
+        return cls._LABELS.get(value, value)
 
     @classmethod
     def get_color(cls, value):
         """Get the Bootstrap color class for a status."""
-        colors = {
-            cls.OFFEN.value: 'warning',
-            cls.IN_BEARBEITUNG.value: 'info',
-            cls.WARTE_AUF_KUNDE.value: 'secondary',
-            cls.GELOEST.value: 'success',
-            cls.GESCHLOSSEN.value: 'dark',
-        }
-        return colors.get(value, 'secondary')
+        return cls._COLORS.get(value, 'secondary')
 
     @classmethod
     def aktive_status(cls):
-        """Return list of status values that are considered 'open'."""
-        return [cls.OFFEN.value, cls.IN_BEARBEITUNG.value, cls.WARTE_AUF_KUNDE.value]
+        """Return the (frozen) set of status values that are considered 'open'."""
+        return _AKTIVE_STATUS
+
+
+TicketStatus._LABELS = {
+    TicketStatus.OFFEN.value: 'Offen',
+    TicketStatus.IN_BEARBEITUNG.value: 'In Bearbeitung',
+    TicketStatus.WARTE_AUF_KUNDE.value: 'Warte auf Kunde',
+    TicketStatus.GELOEST.value: 'Gelöst',
+    TicketStatus.GESCHLOSSEN.value: 'Geschlossen',
+}
+TicketStatus._COLORS = {
+    TicketStatus.OFFEN.value: 'warning',
+    TicketStatus.IN_BEARBEITUNG.value: 'info',
+    TicketStatus.WARTE_AUF_KUNDE.value: 'secondary',
+    TicketStatus.GELOEST.value: 'success',
+    TicketStatus.GESCHLOSSEN.value: 'dark',
+}
+TicketStatus._CHOICES = tuple((s.value, TicketStatus._LABELS[s.value]) for s in TicketStatus)
+
+# Statusgruppen für ist_offen/ist_geloest und Filter (status IN ...)
+_AKTIVE_STATUS = frozenset({
+    TicketStatus.OFFEN.value,
+    TicketStatus.IN_BEARBEITUNG.value,
+    TicketStatus.WARTE_AUF_KUNDE.value,
+})
+_ERLEDIGT_STATUS = frozenset({
+    TicketStatus.GELOEST.value,
+    TicketStatus.GESCHLOSSEN.value,
+})
 
 
 class TicketPrioritaet(str, Enum):
@@ -122,23 +125,29 @@ class TicketPrioritaet(str, Enum):
     @classmethod
     def choices(cls):
         """Return choices for form select fields."""
-        return [(p.value, p.value.capitalize()) for p in cls]
+        return cls._CHOICES
 
     @classmethod
     def get_label(cls, value):
         """Get the German label for a priority value."""
-        return value.capitalize() if value else 'Normal'
+        if not value:
+            return 'Normal'
+        return cls._LABELS.get(value) or value.capitalize()
 
     @classmethod
     def get_color(cls, value):
         """Get the Bootstrap color class for a priority."""
-        colors = {
-            cls.NIEDRIG.value: 'secondary',
-            cls.NORMAL.value: 'primary',
-            cls.HOCH.value: 'warning',
-            cls.KRITISCH.value: 'danger',
-        }
-        return colors.get(value, 'primary')
+        return cls._COLORS.get(value, 'primary')
+
+
+TicketPrioritaet._LABELS = {p.value: p.value.capitalize() for p in TicketPrioritaet}
+TicketPrioritaet._COLORS = {
+    TicketPrioritaet.NIEDRIG.value: 'secondary',
+    TicketPrioritaet.NORMAL.value: 'primary',
+    TicketPrioritaet.HOCH.value: 'warning',
+    TicketPrioritaet.KRITISCH.value: 'danger',
+}
+TicketPrioritaet._CHOICES = tuple(TicketPrioritaet._LABELS.items())
 
 
 class SupportTicket(db.Model):
@@ -148,11 +157,36 @@ class SupportTicket(db.Model):
     Includes context information about where the ticket was created.
     """
     __tablename__ = 'support_ticket'
+    __table_args__ = (
+        # Ticketlisten: Status (IN ...) + Team, neueste zuerst. Auf PostgreSQL
+        # covering, damit die Listenspalten ohne Heap-Zugriff kommen.
+        db.Index(
+            'ix_ticket_status_team_erstellt',
+            'status', 'team_id', db.desc('erstellt_am'),
+            postgresql_include=['nummer', 'titel', 'prioritaet']
+        ),
+        # Höchste laufende Nummer je Jahr (max_seq)
+        db.Index('ix_ticket_year_seq', 'year', 'seq_num'),
+        # Partiell: nur offene Tickets (Dashboard-Standard "nur offene",
+        # neueste zuerst); geschlossene Zeilen landen nicht im Index
+        db.Index(
+            'ix_ticket_open', db.desc('erstellt_am'),
+            postgresql_where=db.text(
+                "status IN ('offen', 'in_bearbeitung', 'warte_auf_kunde')"
+            ),
+            sqlite_where=db.text(
+                "status IN ('offen', 'in_bearbeitung', 'warte_auf_kunde')"
+            )
+        ),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
 
     # Human-readable ticket number (e.g., "T-2025-00042")
     nummer = db.Column(db.String(20), unique=True, nullable=False, index=True)
+    # Aus nummer abgeleitet (beim Setzen befüllt), für Anzeige und max_seq
+    year = db.Column(db.SmallInteger, nullable=True)
+    seq_num = db.Column(db.Integer, nullable=True)
 
     # Content
     titel = db.Column(db.String(200), nullable=False)
@@ -160,7 +194,7 @@ class SupportTicket(db.Model):
 
     # Classification
     typ = db.Column(db.String(30), default=TicketTyp.FRAGE.value)
-    status = db.Column(db.String(30), default=TicketStatus.OFFEN.value, index=True)
+    status = db.Column(db.String(30), default=TicketStatus.OFFEN.value)
     prioritaet = db.Column(db.String(20), default=TicketPrioritaet.NORMAL.value)
 
     # Context (where was the ticket created from)
@@ -189,30 +223,41 @@ class SupportTicket(db.Model):
     kunde_id = db.Column(db.Integer, db.ForeignKey('kunde.id'), nullable=True)
 
     # Timestamps
-    erstellt_am = db.Column(db.DateTime, default=datetime.utcnow)
-    aktualisiert_am = db.Column(db.DateTime, onupdate=datetime.utcnow)
+    erstellt_am = db.Column(db.DateTime, server_default=utcnow())
+    aktualisiert_am = db.Column(db.DateTime, onupdate=utcnow())
     geloest_am = db.Column(db.DateTime, nullable=True)
     geschlossen_am = db.Column(db.DateTime, nullable=True)
 
     # Relationships
+    # Gegenseiten (User/Modul/Kunde) sind lazy='raise_on_sql': Zugriff nur
+    # mit explizitem selectinload(...), damit kein verstecktes N+1 entsteht
     ersteller = db.relationship(
         'User',
         foreign_keys=[erstellt_von_id],
-        backref='erstellte_tickets'
+        back_populates='erstellte_tickets'
     )
     bearbeiter = db.relationship(
         'User',
         foreign_keys=[bearbeiter_id],
-        backref='zugewiesene_tickets'
+        back_populates='zugewiesene_tickets'
     )
-    modul = db.relationship('Modul', backref='support_tickets')
-    kunde = db.relationship('Kunde', backref='support_tickets')
+    modul = db.relationship('Modul', back_populates='support_tickets')
+    kunde = db.relationship('Kunde', back_populates='support_tickets')
     kommentare = db.relationship(
         'TicketKommentar',
-        backref='ticket',
+        back_populates='ticket',
         lazy='dynamic',
         cascade='all, delete-orphan',
-        order_by='TicketKommentar.erstellt_am'
+        order_by='[TicketKommentar.erstellt_am, TicketKommentar.id]'
+    )
+    # Nur öffentliche Kommentare (für den Ticket-Ersteller); in Listen per
+    # selectinload(SupportTicket.oeffentliche_kommentare) vorladen
+    oeffentliche_kommentare = db.relationship(
+        'TicketKommentar',
+        primaryjoin='and_(SupportTicket.id == TicketKommentar.ticket_id, '
+                    'TicketKommentar.ist_intern == False)',
+        order_by='[TicketKommentar.erstellt_am, TicketKommentar.id]',
+        viewonly=True
     )
 
     def __repr__(self):
@@ -226,25 +271,58 @@ class SupportTicket(db.Model):
         Display format: YY-HEX (e.g., '25-2A') via nummer_anzeige property
         """
         year = datetime.now().year
+        return f'{year}-{TicketCounter.next_seq(year)}'
 
-        # Find highest number this year (supports both old T-YYYY and new YYYY format)
-        last = cls.query.filter(
-            db.or_(
-                cls.nummer.like(f'T-{year}-%'),  # Old format
-                cls.nummer.like(f'{year}-%')     # New format
-            )
-        ).order_by(cls.id.desc()).first()
-
-        if last:
-            try:
-                last_num = int(last.nummer.split('-')[-1])
-                new_num = last_num + 1
-            except (ValueError, IndexError):
-                new_num = 1
-        else:
-            new_num = 1
+    @classmethod
+    def for_list(cls, *filters):
+        """Load tickets for list views, newest first.
+
+        Creator, assignee and module are joined in and the last comment
+        timestamp comes as a subquery, so rendering a row issues no
+        further queries.
 
-        return f'{year}-{new_num}'
+        Args:
+            *filters: SQLAlchemy filter expressions
+
+        Returns:
+            List of SupportTicket instances
+        """
+        return cls.query.options(
+            db.joinedload(cls.ersteller),
+            db.joinedload(cls.bearbeiter),
+            db.joinedload(cls.modul),
+            db.undefer(cls.letzte_kommentar_am)
+        ).filter(*filters).order_by(cls.erstellt_am.desc(), cls.id.desc()).all()
+
+    @classmethod
+    def max_seq(cls, year):
+        """Return the highest sequence number already used in a year.
+
+        Uses year/seq_num, which are filled for the old T-YYYY-N and the
+        new YYYY-N format alike.
+        """
+        return db.session.query(
+            db.func.max(cls.seq_num)
+        ).filter(cls.year == year).scalar() or 0
+
+    @staticmethod
+    def parse_nummer(nummer):
+        """Split a ticket number into (year, seq_num).
+
+        Supports '2025-42' and the legacy 'T-2025-00042' format.
+        Returns (None, None) if the number cannot be parsed.
+        """
+        try:
+            parts = nummer.replace('T-', '').split('-')
+            return int(parts[0]), int(parts[-1])
+        except (ValueError, IndexError, AttributeError):
+            return None, None
+
+    @db.validates('nummer')
+    def _set_year_seq(self, key, nummer):
+        """Keep year/seq_num in sync so the display formats need no parsing."""
+        self.year, self.seq_num = self.parse_nummer(nummer)
+        return nummer
 
     @property
     def nummer_anzeige(self):
@@ -253,18 +331,9 @@ class SupportTicket(db.Model):
         Converts internal format like '2025-42' to '25-2A'.
         Also supports legacy 'T-2025-00042' format.
         """
-        try:
-            # Parse the internal format
-            parts = self.nummer.replace('T-', '').split('-')
-            year = parts[0]
-            seq_num = int(parts[-1])
-
-            # Return YY-HEX format
-            year_short = year[-2:]  # Last 2 digits of year
-            hex_num = format(seq_num, 'X')  # Uppercase hex
-            return f'{year_short}-{hex_num}'
-        except (ValueError, IndexError, AttributeError):
+        if self.seq_num is None:
             return self.nummer  # Fallback to stored value
+        return f'{self.year % 100:02d}-{self.seq_num:X}'
 
     @property
     def nummer_intern(self):
@@ -272,23 +341,19 @@ class SupportTicket(db.Model):
 
         Converts '2025-42' or 'T-2025-00042' to '#42 (2025)'.
         """
-        try:
-            parts = self.nummer.replace('T-', '').split('-')
-            year = parts[0]
-            seq_num = int(parts[-1])
-            return f'#{seq_num} ({year})'
-        except (ValueError, IndexError, AttributeError):
+        if self.seq_num is None:
             return self.nummer  # Fallback to stored value
+        return f'#{self.seq_num} ({self.year})'
 
     @property
     def ist_offen(self):
         """Check if ticket is still open (not resolved or closed)."""
-        return self.status in TicketStatus.aktive_status()
+        return self.status in _AKTIVE_STATUS
 
     @property
     def ist_geloest(self):
         """Check if ticket is resolved or closed."""
-        return self.status in [TicketStatus.GELOEST.value, TicketStatus.GESCHLOSSEN.value]
+        return self.status in _ERLEDIGT_STATUS
 
     @property
     def typ_label(self):
@@ -320,20 +385,14 @@ class SupportTicket(db.Model):
         """Get the Bootstrap color class for the priority."""
         return TicketPrioritaet.get_color(self.prioritaet)
 
-    @property
-    def oeffentliche_kommentare(self):
-        """Get public comments (visible to ticket creator)."""
-        return self.kommentare.filter_by(ist_intern=False).all()
-
     @property
     def letzte_aktivitaet(self):
-        """Get the timestamp of the last activity on this ticket."""
-        last_comment = self.kommentare.order_by(
-            TicketKommentar.erstellt_am.desc()
-        ).first()
-        if last_comment:
-            return last_comment.erstellt_am
-        return self.aktualisiert_am or self.erstellt_am
+        """Get the timestamp of the last activity on this ticket.
+
+        In lists load letzte_kommentar_am via undefer() to avoid one
+        query per ticket.
+        """
+        return self.letzte_kommentar_am or self.aktualisiert_am or self.erstellt_am
 
     def kann_bearbeiten(self, user):
         """Check if a user can edit this ticket."""
@@ -372,25 +431,103 @@ class TicketKommentar(db.Model):
         nullable=False
     )
 
-    inhalt = db.Column(db.Text, nullable=False)
+    # Deferred: nur Detailansichten brauchen den Text, dort per
+    # undefer_group('content') mitladen
+    inhalt = db.deferred(db.Column(db.Text, nullable=False), group='content')
 
     # Type flags
     ist_intern = db.Column(db.Boolean, default=False)  # Only visible to team
     ist_status_aenderung = db.Column(db.Boolean, default=False)  # System-generated
 
     # Timestamps
-    erstellt_am = db.Column(db.DateTime, default=datetime.utcnow)
-    aktualisiert_am = db.Column(db.DateTime, onupdate=datetime.utcnow)
+    erstellt_am = db.Column(db.DateTime, server_default=utcnow())
+    aktualisiert_am = db.Column(db.DateTime, onupdate=utcnow())
 
     # Relationships
-    user = db.relationship('User', backref='ticket_kommentare')
+    ticket = db.relationship('SupportTicket', back_populates='kommentare')
+    user = db.relationship('User', back_populates='ticket_kommentare')
 
     def __repr__(self):
         return f'<TicketKommentar {self.id} on Ticket {self.ticket_id}>'
 
+    @classmethod
+    def bulk_log_status_changes(cls, rows: list):
+        """Insert many status change comments without the unit of work.
+
+        No commit; the caller commits together with the status update.
+        erstellt_am is filled by the database (server default).
+
+        Args:
+            rows: Dicts with ticket_id, user_id and inhalt
+        """
+        db.session.bulk_insert_mappings(cls, [
+            {'ist_intern': False, 'ist_status_aenderung': True, **row}
+            for row in rows
+        ])
+
     def kann_sehen(self, user):
         """Check if a user can see this comment."""
         # Internal comments only visible to team
         if self.ist_intern:
             return user.is_admin or user.is_mitarbeiter
         return True
+
+
+# Zeitpunkt des letzten Kommentars als korrelierte Subquery. Deferred, in
+# Ticketlisten per undefer(SupportTicket.letzte_kommentar_am) mitselektieren.
+SupportTicket.letzte_kommentar_am = db.column_property(
+    db.select(db.func.max(TicketKommentar.erstellt_am))
+    .where(TicketKommentar.ticket_id == SupportTicket.id)
+    .correlate_except(TicketKommentar)
+    .scalar_subquery(),
+    deferred=True
+)
+
+
+class TicketCounter(db.Model):
+    """Per-year counter for ticket numbers.
+
+    Replaces scanning support_ticket for the last number: the next value
+    is taken with a single UPDATE ... RETURNING on the year's row, which
+    also serializes concurrent ticket creation.
+    """
+    __tablename__ = 'ticket_counter'
+
+    year = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    seq = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<TicketCounter {self.year}: {self.seq}>'
+
+    @classmethod
+    def next_seq(cls, year):
+        """Increment and return the counter for a year. No commit.
+
+        The first call of a year seeds the row from the highest number
+        already stored, so existing tickets keep their numbering.
+        """
+        dialect = db.session.get_bind().dialect.name
+        if dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            # Ohne RETURNING: wie bisher aus dem höchsten Ticket ableiten
+            return SupportTicket.max_seq(year) + 1
+
+        seq = db.session.execute(
+            db.update(cls)
+            .where(cls.year == year)
+            .values(seq=cls.seq + 1)
+            .returning(cls.seq)
+        ).scalar()
+        if seq is not None:
+            return seq
+
+        stmt = insert(cls).values(year=year, seq=SupportTicket.max_seq(year) + 1)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['year'],
+            set_={'seq': cls.seq + 1}
+        ).returning(cls.seq)
+        return db.session.execute(stmt).scalar()
+
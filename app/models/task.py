@@ -5,7 +5,10 @@ Tasks have a status (Kanban columns) and can be assigned to users.
 """
 from datetime import datetime
 from enum import Enum
+from sqlalchemy.orm.attributes import set_committed_value
 from app import db
+from app.models.komponente import Komponente
+from app.models.sql_types import StringEnum
 
 
 class TaskStatus(str, Enum):
@@ -18,20 +21,28 @@ class TaskStatus(str, Enum):
 
     @classmethod
     def choices(cls):
-        """Return list of (value, label) tuples for form selects."""
-        labels = {
-            cls.BACKLOG: 'Backlog',
-            cls.GEPLANT: 'Geplant',
-            cls.IN_ARBEIT: 'In Arbeit',
-            cls.REVIEW: 'Review',
-            cls.ERLEDIGT: 'Erledigt',
-        }
-        return [(t.value, labels[t]) for t in cls]
+        """Return (value, label) tuples for form selects."""
+        return cls._CHOICES
 
     @classmethod
     def kanban_order(cls):
         """Return status values in Kanban board order."""
-        return [cls.BACKLOG, cls.GEPLANT, cls.IN_ARBEIT, cls.REVIEW, cls.ERLEDIGT]
+        return cls._KANBAN_ORDER
+
+
+# Lookup-Tabellen einmalig beim Import aufbauen statt pro Aufruf
+TaskStatus._LABELS = {
+    TaskStatus.BACKLOG.value: 'Backlog',
+    TaskStatus.GEPLANT.value: 'Geplant',
+    TaskStatus.IN_ARBEIT.value: 'In Arbeit',
+    TaskStatus.REVIEW.value: 'Review',
+    TaskStatus.ERLEDIGT.value: 'Erledigt',
+}
+TaskStatus._CHOICES = tuple((t.value, TaskStatus._LABELS[t.value]) for t in TaskStatus)
+TaskStatus._KANBAN_ORDER = (
+    TaskStatus.BACKLOG, TaskStatus.GEPLANT, TaskStatus.IN_ARBEIT,
+    TaskStatus.REVIEW, TaskStatus.ERLEDIGT,
+)
 
 
 class TaskPrioritaet(str, Enum):
@@ -43,24 +54,43 @@ class TaskPrioritaet(str, Enum):
 
     @classmethod
     def choices(cls):
-        """Return list of (value, label) tuples for form selects."""
-        labels = {
-            cls.NIEDRIG: 'Niedrig',
-            cls.MITTEL: 'Mittel',
-            cls.HOCH: 'Hoch',
-            cls.KRITISCH: 'Kritisch',
-        }
-        return [(t.value, labels[t]) for t in cls]
+        """Return (value, label) tuples for form selects."""
+        return cls._CHOICES
 
     @classmethod
     def color_map(cls):
         """Return Bootstrap color classes for each priority."""
-        return {
-            cls.NIEDRIG.value: 'secondary',
-            cls.MITTEL.value: 'info',
-            cls.HOCH.value: 'warning',
-            cls.KRITISCH.value: 'danger',
-        }
+        return cls._COLORS
+
+    @classmethod
+    def get_color(cls, value):
+        """Get the Bootstrap color class for a priority value."""
+        return cls._COLORS.get(value, 'secondary')
+
+    @classmethod
+    def get_badge(cls, value):
+        """Get the full Bootstrap badge class for a priority value."""
+        return cls._BADGES.get(value, 'bg-secondary')
+
+
+TaskPrioritaet._LABELS = {
+    TaskPrioritaet.NIEDRIG.value: 'Niedrig',
+    TaskPrioritaet.MITTEL.value: 'Mittel',
+    TaskPrioritaet.HOCH.value: 'Hoch',
+    TaskPrioritaet.KRITISCH.value: 'Kritisch',
+}
+TaskPrioritaet._COLORS = {
+    TaskPrioritaet.NIEDRIG.value: 'secondary',
+    TaskPrioritaet.MITTEL.value: 'info',
+    TaskPrioritaet.HOCH.value: 'warning',
+    TaskPrioritaet.KRITISCH.value: 'danger',
+}
+TaskPrioritaet._CHOICES = tuple((t.value, TaskPrioritaet._LABELS[t.value]) for t in TaskPrioritaet)
+# Fertige Badge-Klassen (warning braucht dunklen Text)
+TaskPrioritaet._BADGES = {
+    value: f'bg-{color} text-dark' if color == 'warning' else f'bg-{color}'
+    for value, color in TaskPrioritaet._COLORS.items()
+}
 
 
 class TaskPhase(str, Enum):
@@ -73,15 +103,18 @@ class TaskPhase(str, Enum):
 
     @classmethod
     def choices(cls):
-        """Return list of (value, label) tuples for form selects."""
-        labels = {
-            cls.POC: 'POC',
-            cls.MVP: 'MVP',
-            cls.V1: 'V1',
-            cls.V2: 'V2',
-            cls.V3: 'V3',
-        }
-        return [(t.value, labels[t]) for t in cls]
+        """Return (value, label) tuples for form selects."""
+        return cls._CHOICES
+
+
+TaskPhase._LABELS = {
+    TaskPhase.POC.value: 'POC',
+    TaskPhase.MVP.value: 'MVP',
+    TaskPhase.V1.value: 'V1',
+    TaskPhase.V2.value: 'V2',
+    TaskPhase.V3.value: 'V3',
+}
+TaskPhase._CHOICES = tuple((t.value, TaskPhase._LABELS[t.value]) for t in TaskPhase)
 
 
 class Task(db.Model):
@@ -97,12 +130,13 @@ class Task(db.Model):
 
     # Content
     titel = db.Column(db.String(200), nullable=False)
-    beschreibung = db.Column(db.Text, nullable=True)
+    # Deferred: Kanban/Listen brauchen nur den Titel, Detail-Ansichten laden nach
+    beschreibung = db.deferred(db.Column(db.Text, nullable=True))
 
     # Classification
-    phase = db.Column(db.String(10), default=TaskPhase.POC.value, nullable=False)
-    status = db.Column(db.String(20), default=TaskStatus.BACKLOG.value, nullable=False)
-    prioritaet = db.Column(db.String(20), default=TaskPrioritaet.MITTEL.value, nullable=False)
+    phase = db.Column(StringEnum(TaskPhase, 10), default=TaskPhase.POC.value, nullable=False)
+    status = db.Column(StringEnum(TaskStatus, 20), default=TaskStatus.BACKLOG.value, nullable=False)
+    prioritaet = db.Column(StringEnum(TaskPrioritaet, 20), default=TaskPrioritaet.MITTEL.value, nullable=False)
     typ = db.Column(db.String(30), default='funktion', nullable=False)  # Task type from LookupWert
 
     # Assignment (optional)
@@ -117,27 +151,44 @@ class Task(db.Model):
     # Archivierung (PRD011-T030)
     ist_archiviert = db.Column(db.Boolean, default=False, nullable=False)
 
+    # Lesbare Task-ID PRD{prd_nummer}-T{id:03d}, per Event gepflegt (siehe unten)
+    task_nummer = db.Column(db.String(30), nullable=True, index=True)
+
     # Referenz auf Ursprungs-Task bei Task-Splitting (PRD011-T041)
-    entstanden_aus_id = db.Column(db.Integer, db.ForeignKey('task.id'), nullable=True)
+    entstanden_aus_id = db.Column(db.Integer, db.ForeignKey('task.id'), nullable=True, index=True)
 
     # Timestamps
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     erledigt_am = db.Column(db.DateTime, nullable=True)
 
+    __table_args__ = (
+        # Kanban-Spalten: Komponente + Status (+ Archiv-Filter), sortiert
+        db.Index('ix_task_komp_status_arch', 'komponente_id', 'status', 'ist_archiviert'),
+        db.Index('ix_task_komp_sort', 'komponente_id', 'sortierung'),
+        # Tasks eines Users nach Status
+        db.Index('ix_task_assignee_status', 'zugewiesen_an', 'status'),
+        # Offene Tasks einer Komponente (Komponente.offene_tasks, Dashboard-Zähler)
+        db.Index(
+            'ix_task_open', 'komponente_id', 'sortierung',
+            postgresql_where=db.text("status <> 'erledigt'"),
+            sqlite_where=db.text("status <> 'erledigt'")
+        ),
+    )
+
     # Relationships
-    zugewiesen_user = db.relationship('User', backref=db.backref('zugewiesene_tasks', lazy='dynamic'))
+    # Gegenseite User.zugewiesene_tasks; in Listen per listen_optionen() vorladen
+    zugewiesen_user = db.relationship('User', back_populates='zugewiesene_tasks')
     changelog_eintraege = db.relationship(
         'ChangelogEintrag',
         backref='task',
-        lazy='dynamic',
         cascade='all, delete-orphan'
     )
     # Task-Kommentare für Review-Workflow (PRD011-T055)
     kommentare = db.relationship(
         'TaskKommentar',
         backref='task',
-        lazy='dynamic',
+        lazy='selectin',
         cascade='all, delete-orphan',
         order_by='TaskKommentar.created_at.desc()'
     )
@@ -145,13 +196,27 @@ class Task(db.Model):
     entstanden_aus = db.relationship(
         'Task',
         remote_side=[id],
-        backref=db.backref('abgeleitete_tasks', lazy='dynamic'),
+        backref='abgeleitete_tasks',
         foreign_keys=[entstanden_aus_id]
     )
 
     def __repr__(self):
         return f'<Task {self.id}: {self.titel[:30]}>'
 
+    @classmethod
+    def listen_optionen(cls):
+        """Eager-Loading für Task-Listen (Kanban, API): zugewiesener User per
+        JOIN statt Lazy-Load pro Task (zugewiesen_name).
+
+        Die task_nummer ist gespeichert, die Komponente muss dafür nicht
+        geladen werden. Die Kommentare werden in Listen nicht angezeigt und
+        daher nur bei Zugriff nachgeladen statt per selectin.
+        """
+        return (
+            db.joinedload(cls.zugewiesen_user),
+            db.lazyload(cls.kommentare),
+        )
+
     @property
     def ist_erledigt(self):
         """Check if task is completed."""
@@ -160,15 +225,12 @@ class Task(db.Model):
     @property
     def prioritaet_color(self):
         """Return Bootstrap color class for priority."""
-        return TaskPrioritaet.color_map().get(self.prioritaet, 'secondary')
+        return TaskPrioritaet.get_color(self.prioritaet)
 
     @property
     def prioritaet_badge(self):
         """Return full Bootstrap badge class for priority."""
-        color = self.prioritaet_color
-        if color == 'warning':
-            return f'bg-{color} text-dark'
-        return f'bg-{color}'
+        return TaskPrioritaet.get_badge(self.prioritaet)
 
     @property
     def zugewiesen(self):
@@ -219,17 +281,6 @@ class Task(db.Model):
         }
         return beschreibungen.get(self.typ, '')
 
-    @property
-    def task_nummer(self):
-        """Return readable task ID in format PRD{prd_nummer}-T{id:03d}.
-
-        Example: PRD011-T023 for task 23 in component PRD-011.
-        Falls back to T{id:03d} if component has no PRD number.
-        """
-        if self.komponente and self.komponente.prd_nummer:
-            return f"PRD{self.komponente.prd_nummer}-T{self.id:03d}"
-        return f"T{self.id:03d}"
-
     @property
     def entstanden_aus_nummer(self):
         """Return task_nummer of parent task if exists (PRD011-T041)."""
@@ -237,25 +288,20 @@ class Task(db.Model):
             return self.entstanden_aus.task_nummer
         return None
 
-    @property
-    def anzahl_abgeleitete(self):
-        """Return count of derived tasks (PRD011-T041)."""
-        return self.abgeleitete_tasks.count()
-
     @property
     def review_kommentare(self):
         """Return only NON-COMPLETED review comments for prompt generation (PRD011-T055)."""
-        return self.kommentare.filter_by(typ='review', erledigt=False).all()
+        return [k for k in self.kommentare if k.typ == 'review' and not k.erledigt]
 
     @property
     def offene_review_kommentare(self):
         """Return count of open review comments (PRD011-T055)."""
-        return self.kommentare.filter_by(typ='review', erledigt=False).count()
+        return sum(1 for k in self.kommentare if k.typ == 'review' and not k.erledigt)
 
     @property
     def anzahl_kommentare(self):
         """Return total comment count (PRD011-T055)."""
-        return self.kommentare.count()
+        return len(self.kommentare)
 
     def erledigen(self, user_id=None):
         """Mark task as completed and set completion timestamp.
@@ -308,3 +354,88 @@ class Task(db.Model):
         if include_beschreibung:
             result['beschreibung'] = self.beschreibung
         return result
+
+
+# Anzahl abgeleiteter Tasks (PRD011-T041) als korrelierte Subquery. Deferred,
+# in Task-Listen per undefer(Task.anzahl_abgeleitete) mitselektieren.
+_abgeleitet = Task.__table__.alias('abgeleitet')
+Task.anzahl_abgeleitete = db.column_property(
+    db.select(db.func.count(_abgeleitet.c.id))
+    .where(_abgeleitet.c.entstanden_aus_id == Task.id)
+    .correlate_except(_abgeleitet)
+    .scalar_subquery(),
+    deferred=True
+)
+
+
+# === TASK-NUMMER-EVENTS ===
+
+def _format_task_nummer(prd_nummer, task_id):
+    """Return readable task ID in format PRD{prd_nummer}-T{id:03d}.
+
+    Example: PRD011-T023 for task 23 in component PRD-011.
+    Falls back to T{id:03d} if component has no PRD number.
+    """
+    if prd_nummer:
+        return f"PRD{prd_nummer}-T{task_id:03d}"
+    return f"T{task_id:03d}"
+
+
+def _task_nummer_setzen(connection, task):
+    """task_nummer per UPDATE schreiben (die ID steht erst nach dem INSERT fest)."""
+    komponenten = Komponente.__table__
+    prd_nummer = connection.scalar(
+        db.select(komponenten.c.prd_nummer).where(komponenten.c.id == task.komponente_id)
+    )
+    nummer = _format_task_nummer(prd_nummer, task.id)
+    if nummer == task.task_nummer:
+        return
+
+    tabelle = Task.__table__
+    # updated_at festhalten, sonst greift dessen onupdate
+    connection.execute(
+        tabelle.update().where(tabelle.c.id == task.id)
+        .values(task_nummer=nummer, updated_at=tabelle.c.updated_at)
+    )
+    set_committed_value(task, 'task_nummer', nummer)
+
+
+@db.event.listens_for(Task, 'after_insert')
+def _task_nummer_nach_insert(mapper, connection, task):
+    _task_nummer_setzen(connection, task)
+
+
+@db.event.listens_for(Task, 'after_update')
+def _task_nummer_nach_update(mapper, connection, task):
+    # Verschieben in eine andere Komponente (PRD011-T056)
+    if db.inspect(task).attrs.komponente_id.history.has_changes():
+        _task_nummer_setzen(connection, task)
+
+
+@db.event.listens_for(Komponente, 'after_update')
+def _task_nummern_nach_prd_aenderung(mapper, connection, komponente):
+    if not db.inspect(komponente).attrs.prd_nummer.history.has_changes():
+        return
+
+    tabelle = Task.__table__
+    task_ids = connection.scalars(
+        db.select(tabelle.c.id).where(tabelle.c.komponente_id == komponente.id)
+    ).all()
+    if not task_ids:
+        return
+
+    nummern = {task_id: _format_task_nummer(komponente.prd_nummer, task_id) for task_id in task_ids}
+    # Umnummerierung ist keine Änderung am Task: updated_at festhalten
+    connection.execute(
+        tabelle.update().where(tabelle.c.id == db.bindparam('task_id'))
+        .values(updated_at=tabelle.c.updated_at),
+        [{'task_id': task_id, 'task_nummer': nummer} for task_id, nummer in nummern.items()]
+    )
+
+    session = db.object_session(komponente)
+    if session is not None:
+        for task_id, nummer in nummern.items():
+            key = db.inspect(Task).identity_key_from_primary_key((task_id,))
+            task = session.identity_map.get(key)
+            if task is not None:
+                set_committed_value(task, 'task_nummer', nummer)
@@ -8,6 +8,7 @@ review prompt generation.
 from datetime import datetime
 from enum import Enum
 from app import db
+from app.models.sql_types import StringEnum
 
 
 class KommentarTyp(str, Enum):
@@ -19,14 +20,36 @@ class KommentarTyp(str, Enum):
 
     @classmethod
     def choices(cls):
-        """Return list of (value, label) tuples for form selects."""
-        labels = {
-            cls.REVIEW: 'Review',
-            cls.FRAGE: 'Frage',
-            cls.HINWEIS: 'Hinweis',
-            cls.KOMMENTAR: 'Kommentar',
-        }
-        return [(t.value, labels[t]) for t in cls]
+        """Return (value, label) tuples for form selects."""
+        return cls._CHOICES
+
+    @classmethod
+    def get_label(cls, value):
+        """Get the display label for a comment type value."""
+        return cls._LABELS.get(value, value)
+
+
+# Lookup-Tabellen einmalig beim Import aufbauen statt pro Aufruf
+KommentarTyp._LABELS = {
+    KommentarTyp.REVIEW.value: 'Review',
+    KommentarTyp.FRAGE.value: 'Frage',
+    KommentarTyp.HINWEIS.value: 'Hinweis',
+    KommentarTyp.KOMMENTAR.value: 'Kommentar',
+}
+KommentarTyp._CHOICES = tuple((t.value, KommentarTyp._LABELS[t.value]) for t in KommentarTyp)
+
+_TYP_ICONS = {
+    'review': 'ti-eye-check',
+    'frage': 'ti-help-circle',
+    'hinweis': 'ti-bulb',
+    'kommentar': 'ti-message',
+}
+_TYP_FARBEN = {
+    'review': 'warning',
+    'frage': 'info',
+    'hinweis': 'secondary',
+    'kommentar': 'light',
+}
 
 
 class TaskKommentar(db.Model):
@@ -42,7 +65,7 @@ class TaskKommentar(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
 
     # Comment content
-    typ = db.Column(db.String(20), default=KommentarTyp.KOMMENTAR.value, nullable=False)
+    typ = db.Column(StringEnum(KommentarTyp, 20), default=KommentarTyp.KOMMENTAR.value, nullable=False)
     inhalt = db.Column(db.Text, nullable=False)
 
     # V1: Completion status for review workflow
@@ -54,7 +77,12 @@ class TaskKommentar(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    user = db.relationship('User', backref='task_kommentare')
+    # Autor wird in jedem Kommentar-Thread angezeigt: per JOIN mitladen
+    user = db.relationship('User', backref='task_kommentare', lazy='joined')
+
+    __table_args__ = (
+        db.Index('ix_task_kommentar_task_typ_erledigt', 'task_id', 'typ', 'erledigt'),
+    )
 
     def __repr__(self):
         return f'<TaskKommentar {self.id} ({self.typ})>'
@@ -62,32 +90,17 @@ class TaskKommentar(db.Model):
     @property
     def typ_icon(self):
         """Return Tabler icon for comment type."""
-        icons = {
-            'review': 'ti-eye-check',
-            'frage': 'ti-help-circle',
-            'hinweis': 'ti-bulb',
-            'kommentar': 'ti-message',
-        }
-        return icons.get(self.typ, 'ti-message')
+        return _TYP_ICONS.get(self.typ, 'ti-message')
 
     @property
     def typ_farbe(self):
         """Return Bootstrap color for comment type."""
-        colors = {
-            'review': 'warning',
-            'frage': 'info',
-            'hinweis': 'secondary',
-            'kommentar': 'light',
-        }
-        return colors.get(self.typ, 'light')
+        return _TYP_FARBEN.get(self.typ, 'light')
 
     @property
     def typ_label(self):
         """Return display label for comment type."""
-        for value, label in KommentarTyp.choices():
-            if value == self.typ:
-                return label
-        return self.typ
+        return KommentarTyp.get_label(self.typ)
 
     def toggle_erledigt(self):
         """Toggle the completion status."""
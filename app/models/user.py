@@ -1,10 +1,17 @@
 """User Model for authentication."""
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from werkzeug.security import generate_password_hash, check_password_hash
 from flask_login import UserMixin
 
 from app import db
+from app.models.sql_types import StringEnum
+
+
+# Hash-Verfahren für neue Passwörter; check_password_hash liest das
+# Verfahren aus dem gespeicherten Hash, ältere Hashes bleiben gültig.
+PASSWORD_HASH_METHOD = 'pbkdf2:sha256'
 
 
 class UserTyp(str, Enum):
@@ -19,19 +26,24 @@ class UserTyp(str, Enum):
 
     @classmethod
     def choices(cls):
-        """Return list of (value, label) tuples for form selects."""
-        labels = {
-            cls.MENSCH: 'Mensch',
-            cls.KI_CLAUDE: 'KI: Claude',
-            cls.KI_CODEX: 'KI: Codex',
-            cls.KI_ANDERE: 'KI: Andere',
-        }
-        return [(t.value, labels[t]) for t in cls]
+        """Return (value, label) tuples for form selects."""
+        return cls._CHOICES
 
     @classmethod
     def ki_typen(cls):
-        """Return list of AI user type values."""
-        return [cls.KI_CLAUDE.value, cls.KI_CODEX.value, cls.KI_ANDERE.value]
+        """Return AI user type values."""
+        return cls._KI_TYPEN
+
+
+# Lookup-Tabellen einmalig beim Import aufbauen statt pro Aufruf
+UserTyp._LABELS = {
+    UserTyp.MENSCH.value: 'Mensch',
+    UserTyp.KI_CLAUDE.value: 'KI: Claude',
+    UserTyp.KI_CODEX.value: 'KI: Codex',
+    UserTyp.KI_ANDERE.value: 'KI: Andere',
+}
+UserTyp._CHOICES = tuple((t.value, UserTyp._LABELS[t.value]) for t in UserTyp)
+UserTyp._KI_TYPEN = (UserTyp.KI_CLAUDE.value, UserTyp.KI_CODEX.value, UserTyp.KI_ANDERE.value)
 
 
 class User(UserMixin, db.Model):
@@ -49,18 +61,49 @@ class User(UserMixin, db.Model):
     last_login = db.Column(db.DateTime)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    # Rolle wird bei fast jedem Request (current_user) gebraucht: per JOIN mitladen
+    rolle_obj = db.relationship('Rolle', back_populates='users', lazy='joined', innerjoin=True)
+
     # Anrede/Briefanrede settings (personenbezogen)
     anrede = db.Column(db.String(20), nullable=True)  # herr, frau, divers
     kommunikation_stil = db.Column(db.String(20), nullable=True)  # NULL = Kunde-Default
 
     # User type for human/AI distinction (PRD-011)
-    user_typ = db.Column(db.String(20), default=UserTyp.MENSCH.value, nullable=False)
+    user_typ = db.Column(StringEnum(UserTyp, 20), default=UserTyp.MENSCH.value, nullable=False)
 
     # NEW: 1:N relationship to Kunden via junction table
+    # Hauptbenutzer-Zuordnung zuerst, danach in Zuordnungsreihenfolge
     kunde_zuordnungen = db.relationship(
         'KundeBenutzer',
         back_populates='user',
-        cascade='all, delete-orphan'
+        cascade='all, delete-orphan',
+        lazy='selectin',
+        order_by='(KundeBenutzer.ist_hauptbenutzer.desc(), KundeBenutzer.id)'
+    )
+
+    # Zugewiesene Tasks (PRD-011)
+    zugewiesene_tasks = db.relationship(
+        'Task',
+        back_populates='zugewiesen_user'
+    )
+
+    # Support-Tickets (PRD-007); nur per selectinload(...) laden
+    erstellte_tickets = db.relationship(
+        'SupportTicket',
+        foreign_keys='SupportTicket.erstellt_von_id',
+        back_populates='ersteller',
+        lazy='raise_on_sql'
+    )
+    zugewiesene_tickets = db.relationship(
+        'SupportTicket',
+        foreign_keys='SupportTicket.bearbeiter_id',
+        back_populates='bearbeiter',
+        lazy='raise_on_sql'
+    )
+    ticket_kommentare = db.relationship(
+        'TicketKommentar',
+        back_populates='user',
+        lazy='raise_on_sql'
     )
 
     def __repr__(self):
@@ -68,41 +111,50 @@ class User(UserMixin, db.Model):
 
     def set_password(self, password):
         """Hash and set the password."""
-        self.password_hash = generate_password_hash(password, method='pbkdf2:sha256')
+        self.password_hash = generate_password_hash(password, method=PASSWORD_HASH_METHOD)
 
     def check_password(self, password):
         """Check if password matches hash."""
         return check_password_hash(self.password_hash, password)
 
+    @cached_property
+    def _rolle_name(self):
+        """Role name, cached per instance (reset when the role changes)."""
+        return self.rolle_obj.name if self.rolle_obj else None
+
+    def reset_rolle_cache(self):
+        """Drop the cached role name."""
+        self.__dict__.pop('_rolle_name', None)
+
     @property
     def rolle(self):
         """Backward-compatible property returning role name."""
-        return self.rolle_obj.name if self.rolle_obj else None
+        return self._rolle_name
 
     @property
     def is_admin(self):
         """Check if user has admin role."""
-        return self.rolle_obj and self.rolle_obj.name == 'admin'
+        return self._rolle_name == 'admin'
 
     @property
     def is_mitarbeiter(self):
         """Check if user has mitarbeiter role."""
-        return self.rolle_obj and self.rolle_obj.name == 'mitarbeiter'
+        return self._rolle_name == 'mitarbeiter'
 
     @property
     def is_kunde(self):
         """Check if user has kunde role."""
-        return self.rolle_obj and self.rolle_obj.name == 'kunde'
+        return self._rolle_name == 'kunde'
 
     @property
     def is_internal(self):
         """Check if user is internal (admin or mitarbeiter)."""
-        return self.is_admin or self.is_mitarbeiter
+        return self._rolle_name in ('admin', 'mitarbeiter')
 
     @property
     def is_test_benutzer(self):
         """Check if user is a test user (for mailing tests)."""
-        return self.rolle_obj and self.rolle_obj.name == 'test_benutzer'
+        return self._rolle_name == 'test_benutzer'
 
     @property
     def is_ki(self):
@@ -123,16 +175,10 @@ class User(UserMixin, db.Model):
     def kunde(self):
         """DEPRECATED: Return the primary Kunde (for backward compatibility).
 
-        Returns the Kunde where this user is Hauptbenutzer, or first assigned Kunde.
+        Returns the Kunde where this user is Hauptbenutzer, or first assigned Kunde
+        (kunde_zuordnungen is ordered accordingly).
         """
-        # Prefer Kunde where user is Hauptbenutzer
-        for zuo in self.kunde_zuordnungen:
-            if zuo.ist_hauptbenutzer:
-                return zuo.kunde
-        # Fallback: first assigned Kunde
-        if self.kunde_zuordnungen:
-            return self.kunde_zuordnungen[0].kunde
-        return None
+        return self.kunde_zuordnungen[0].kunde if self.kunde_zuordnungen else None
 
     def to_dict(self):
         """Convert to dictionary."""
@@ -150,3 +196,16 @@ class User(UserMixin, db.Model):
             'aktiv': self.aktiv,
             'last_login': self.last_login.isoformat() if self.last_login else None
         }
+
+
+@db.event.listens_for(User.rolle_id, 'set')
+@db.event.listens_for(User.rolle_obj, 'set')
+def _reset_rolle_cache(user, *args):
+    user.reset_rolle_cache()
+
+
+@db.event.listens_for(User, 'expire')
+def _reset_rolle_cache_bei_expire(user, attrs):
+    # Beim Commit kann die Instanz bereits eingesammelt sein
+    if user is not None:
+        user.reset_rolle_cache()
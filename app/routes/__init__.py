@@ -1,16 +1,26 @@
-"""Flask routes."""
-from app.routes.main import main_bp
-from app.routes.admin import admin_bp
-from app.routes.kunden import kunden_bp
-from app.routes.lieferanten_auswahl import lieferanten_auswahl_bp
-from app.routes.content_generator import content_generator_bp
-from app.routes.abrechnung import abrechnung_bp
+"""Flask routes.
 
-__all__ = [
-    'main_bp',
-    'admin_bp',
-    'kunden_bp',
-    'lieferanten_auswahl_bp',
-    'content_generator_bp',
-    'abrechnung_bp',
-]
+The blueprints are resolved lazily (PEP 562): importing a single route
+module such as ``app.routes.support`` no longer imports the admin,
+kunden, ... modules through this package.
+"""
+import importlib
+
+_BLUEPRINT_MODULE = {
+    'main_bp': 'app.routes.main',
+    'admin_bp': 'app.routes.admin',
+    'kunden_bp': 'app.routes.kunden',
+    'lieferanten_auswahl_bp': 'app.routes.lieferanten_auswahl',
+    'content_generator_bp': 'app.routes.content_generator',
+    'abrechnung_bp': 'app.routes.abrechnung',
+}
+
+__all__ = list(_BLUEPRINT_MODULE)
+
+
+def __getattr__(name):
+    if name not in _BLUEPRINT_MODULE:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    blueprint = getattr(importlib.import_module(_BLUEPRINT_MODULE[name]), name)
+    globals()[name] = blueprint
+    return blueprint
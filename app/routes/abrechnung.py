@@ -1,7 +1,8 @@
 """API Usage Billing routes."""
-from flask import Blueprint, render_template
+from flask import Blueprint, render_template, request
 from flask_login import login_required, current_user
 from sqlalchemy import func
+from sqlalchemy.orm import joinedload
 
 from app import db
 from app.models import KundeApiNutzung, Kunde
@@ -13,34 +14,45 @@ abrechnung_bp = Blueprint('abrechnung', __name__, url_prefix='/abrechnung')
 @login_required
 def index():
     """Show API usage summary for current user."""
-    # All usage entries for current user
-    nutzungen = KundeApiNutzung.query.filter_by(user_id=current_user.id)\
-        .order_by(KundeApiNutzung.created_at.desc())\
-        .all()
+    page = request.args.get('page', 1, type=int)
+    per_page = 50
 
-    # Grouped by Kunde with totals
+    # Grouped by Kunde with totals; grand totals via window function
+    # over the groups, so summary and total need only one query
+    credits = func.sum(KundeApiNutzung.credits_used)
+    kosten = func.sum(KundeApiNutzung.kosten_euro)
+    anzahl = func.count(KundeApiNutzung.id)
     summary_query = db.session.query(
         Kunde.id,
         Kunde.firmierung,
-        func.sum(KundeApiNutzung.credits_used).label('total_credits'),
-        func.sum(KundeApiNutzung.kosten_euro).label('total_kosten'),
-        func.count(KundeApiNutzung.id).label('anzahl_calls')
+        credits.label('total_credits'),
+        kosten.label('total_kosten'),
+        anzahl.label('anzahl_calls'),
+        func.sum(credits).over().label('grand_credits'),
+        func.sum(kosten).over().label('grand_kosten'),
+        func.sum(anzahl).over().label('grand_anzahl')
     ).join(Kunde)\
         .filter(KundeApiNutzung.user_id == current_user.id)\
         .group_by(Kunde.id, Kunde.firmierung)\
         .order_by(Kunde.firmierung)\
         .all()
 
-    # Total sum
-    total = db.session.query(
-        func.sum(KundeApiNutzung.credits_used).label('total_credits'),
-        func.sum(KundeApiNutzung.kosten_euro).label('total_kosten')
-    ).filter(KundeApiNutzung.user_id == current_user.id).first()
+    total = summary_query[0] if summary_query else None
+    total_anzahl = int(total.grand_anzahl) if total else 0
+
+    # Detail list, paginated (total already known from the summary)
+    pagination = KundeApiNutzung.query.options(joinedload(KundeApiNutzung.kunde))\
+        .filter_by(user_id=current_user.id)\
+        .order_by(KundeApiNutzung.created_at.desc())\
+        .paginate(page=page, per_page=per_page, error_out=False, count=False)
+    pagination.total = total_anzahl
 
     return render_template(
         'abrechnung/index.html',
-        nutzungen=nutzungen,
+        nutzungen=pagination.items,
+        pagination=pagination,
         summary=summary_query,
-        total_credits=total.total_credits or 0,
-        total_kosten=float(total.total_kosten or 0)
+        total_anzahl=total_anzahl,
+        total_credits=total.grand_credits if total else 0,
+        total_kosten=float(total.grand_kosten) if total else 0.0
     )
@@ -1,21 +1,30 @@
 """Admin routes for system management and testing."""
 import json
 import os
+import shutil
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime
-from flask import Blueprint, render_template, jsonify, flash, redirect, url_for, request, Response, current_app, make_response
+from flask import Blueprint, render_template, jsonify, flash, redirect, url_for, request, Response, current_app, make_response, stream_with_context, g
 from flask_login import login_required, current_user
+from sqlalchemy.orm import raiseload
 from werkzeug.utils import secure_filename
 import flask
 
 from app import db
 from app.models import Config, Lieferant, User, Kunde, KundeCI, Branche, Verband, HelpText, BranchenRolle, BrancheBranchenRolle, Modul, ModulZugriff, AuditLog, Rolle, LookupWert, LieferantBranche
 from app.models import ProduktLookup, Attributgruppe, EigenschaftDefinition, Produkt, ProduktStatus
-from app.services import FTPService, BrandingService, get_brevo_service
+from app.services import FTPService, FTPResult, BrandingService, get_brevo_service
 from app.routes.auth import admin_required, mitarbeiter_required
 
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'svg'}
 THUMB_MAX_SIZE = (100, 100)  # Max thumbnail dimensions
+FTP_PROBE_TTL = 60  # Sekunden, die health() ein FTP-Probe-Ergebnis wiederverwendet
+FTP_PROBE_TIMEOUT = 5  # Sekunden, die health() höchstens auf die FTP-Logins wartet
+
+# Letztes FTP-Probe-Ergebnis je Worker-Prozess: (Zeitpunkt, Configs, Ergebnisse)
+_ftp_probe_cache = None
 
 
 def allowed_file(filename):
@@ -35,6 +44,13 @@ def create_thumbnail(file, save_path, max_size=THUMB_MAX_SIZE):
         True if successful, False otherwise
     """
     try:
+        if save_path.lower().endswith('.svg'):
+            # SVG cannot be thumbnailed (and Pillow cannot open it): stream copy
+            file.seek(0)
+            with open(save_path, 'wb') as f:
+                shutil.copyfileobj(file, f)
+            return True
+
         from PIL import Image
 
         img = Image.open(file)
@@ -45,19 +61,15 @@ def create_thumbnail(file, save_path, max_size=THUMB_MAX_SIZE):
             background.paste(img, mask=img.split()[3])
             img = background
 
-        # Create thumbnail (maintains aspect ratio)
-        img.thumbnail(max_size, Image.Resampling.LANCZOS)
+        # Create thumbnail (maintains aspect ratio); thumbnail() pre-shrinks
+        # with reduce(), for the last <=2x step BILINEAR is as good as LANCZOS
+        img.thumbnail(max_size, Image.Resampling.BILINEAR)
 
         # Determine format
         if save_path.lower().endswith('.png'):
             img.save(save_path, 'PNG', optimize=True)
         elif save_path.lower().endswith('.gif'):
             img.save(save_path, 'GIF')
-        elif save_path.lower().endswith('.svg'):
-            # SVG cannot be thumbnailed, just copy
-            file.seek(0)
-            with open(save_path, 'wb') as f:
-                f.write(file.read())
         else:
             img.save(save_path, 'JPEG', quality=85, optimize=True)
 
@@ -97,15 +109,12 @@ def system():
     except Exception:
         db_status = False
 
-    # Counts
-    user_count = User.query.count()
-    kunde_count = Kunde.query.count()
-    lieferant_count = Lieferant.query.count()
-
-    # Modules (dashboard modules only)
-    dashboard_modules = Modul.query.filter(
-        Modul.zeige_dashboard == True
-    ).order_by(Modul.sort_order).all()
+    # Counts (ein Roundtrip)
+    user_count, kunde_count, lieferant_count = db.session.execute(db.select(
+        db.select(db.func.count()).select_from(User).scalar_subquery(),
+        db.select(db.func.count()).select_from(Kunde).scalar_subquery(),
+        db.select(db.func.count()).select_from(Lieferant).scalar_subquery(),
+    )).one()
 
     # Environment info
     environment = os.environ.get('FLASK_CONFIG', 'development')
@@ -117,7 +126,6 @@ def system():
         user_count=user_count,
         kunde_count=kunde_count,
         lieferant_count=lieferant_count,
-        modules=dashboard_modules,
         python_version=f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
         flask_version=flask.__version__,
         environment=environment
@@ -137,7 +145,8 @@ def module_uebersicht():
 
     # Load all active modules that should be shown in admin overview
     # Filtered by: aktiv=True and has a route_endpoint (excluding invisible base modules)
-    module = Modul.query.filter(
+    # Kacheln zeigen nur Spalten; raiseload macht Beziehungszugriffe sofort sichtbar
+    module = Modul.query.options(raiseload('*', sql_only=True)).filter(
         Modul.aktiv == True,
         Modul.route_endpoint.isnot(None),
         Modul.code != 'administration'  # Don't show admin module on admin page
@@ -176,8 +185,7 @@ def einstellungen_uebersicht():
 def pricat():
     """PRICAT Converter admin page."""
     # Get config status
-    configs = Config.query.all()
-    config_dict = {c.key: c.value for c in configs}
+    config_dict = Config.as_dict()
 
     # Check which configs are set
     config_status = {
@@ -185,9 +193,11 @@ def pricat():
         'elena_ftp': bool(config_dict.get('elena_ftp_host') and config_dict.get('elena_ftp_user')),
     }
 
-    # Get supplier count
-    lieferant_count = Lieferant.query.count()
-    active_lieferant_count = Lieferant.query.filter_by(aktiv=True).count()
+    # Get supplier count (gesamt und aktiv in einem Scan)
+    lieferant_count, active_lieferant_count = db.session.execute(db.select(
+        db.func.count(Lieferant.id),
+        db.func.count(db.case((Lieferant.aktiv == True, Lieferant.id))),
+    )).one()
 
     return render_template(
         'administration/pricat.html',
@@ -254,22 +264,25 @@ def sync_lieferanten():
 @admin_required
 def config_export():
     """Export all config entries as JSON file."""
-    configs = Config.query.all()
-    config_list = [
-        {
-            'key': c.key,
-            'value': c.value,
-            'beschreibung': c.beschreibung
-        }
-        for c in configs
-    ]
+    rows = db.session.execute(
+        db.select(Config.key, Config.value, Config.beschreibung)
+    ).yield_per(500).mappings()
+
+    def generate():
+        # Gleiche Ausgabe wie json.dumps(liste, indent=2), aber zeilenweise
+        # gestreamt statt als komplette Liste im Speicher
+        trenner = '[\n'
+        for row in rows:
+            eintrag = json.dumps(dict(row), indent=2, ensure_ascii=False)
+            yield trenner + '  ' + eintrag.replace('\n', '\n  ')
+            trenner = ',\n'
+        yield '[]' if trenner == '[\n' else '\n]'
 
     # Create JSON response with download headers
-    json_data = json.dumps(config_list, indent=2, ensure_ascii=False)
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     filename = f'pricat_config_{timestamp}.json'
 
-    response = make_response(json_data)
+    response = Response(stream_with_context(generate()))
     response.headers['Content-Type'] = 'application/json; charset=utf-8'
     response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
     response.headers['Cache-Control'] = 'no-cache'
@@ -306,11 +319,15 @@ def config_import():
         created = 0
         updated = 0
 
+        # Vorhandene Einträge mit einer Abfrage laden statt einer pro Key
+        keys = [entry['key'] for entry in config_list if 'key' in entry]
+        bestehend = {c.key: c for c in Config.query.filter(Config.key.in_(keys))} if keys else {}
+
         for entry in config_list:
             if 'key' not in entry:
                 continue
 
-            existing = Config.query.filter_by(key=entry['key']).first()
+            existing = bestehend.get(entry['key'])
             if existing:
                 existing.value = entry.get('value', '')
                 if 'beschreibung' in entry:
@@ -323,6 +340,7 @@ def config_import():
                     beschreibung=entry.get('beschreibung', '')
                 )
                 db.session.add(new_config)
+                bestehend[new_config.key] = new_config
                 created += 1
 
         db.session.commit()
@@ -406,7 +424,11 @@ def modul_einstellungen(code):
 
 @admin_bp.route('/health')
 def health():
-    """Health check endpoint (JSON) for monitoring."""
+    """Health check endpoint (JSON) for monitoring.
+
+    Prüft standardmäßig nur Datenbank und Config. Mit ``?deep=1`` werden
+    zusätzlich die FTP-Logins getestet (siehe _probe_ftp_targets).
+    """
     health_status = {
         'status': 'healthy',
         'checks': {}
@@ -422,11 +444,8 @@ def health():
 
     # Config check
     required_configs = ['vedes_ftp_host', 'vedes_ftp_user']
-    missing_configs = []
-    for key in required_configs:
-        config = Config.query.filter_by(key=key).first()
-        if not config or not config.value:
-            missing_configs.append(key)
+    config_dict = Config.as_dict()
+    missing_configs = [key for key in required_configs if not config_dict.get(key)]
 
     if missing_configs:
         health_status['checks']['config'] = {
@@ -436,11 +455,14 @@ def health():
     else:
         health_status['checks']['config'] = {'status': 'ok'}
 
-    # FTP checks (optional, can be slow)
-    ftp_service = FTPService()
+    # FTP checks nur auf Anfrage (?deep=1) - Load-Balancer-Polls sollen
+    # keine FTP-Logins auslösen
+    if not request.args.get('deep', 0, type=int):
+        return jsonify(health_status)
+
+    vedes_result, elena_result = _probe_ftp_targets()
 
     # VEDES FTP
-    vedes_result = ftp_service.test_connection(target='vedes')
     health_status['checks']['vedes_ftp'] = {
         'status': 'ok' if vedes_result.success else 'error',
         'message': vedes_result.message
@@ -449,7 +471,6 @@ def health():
         health_status['status'] = 'degraded'
 
     # Elena FTP
-    elena_result = ftp_service.test_connection(target='elena')
     health_status['checks']['elena_ftp'] = {
         'status': 'ok' if elena_result.success else 'error',
         'message': elena_result.message
@@ -460,11 +481,60 @@ def health():
     return jsonify(health_status)
 
 
+def _probe_ftp_targets():
+    """Test VEDES and Elena FTP, reusing the last result for FTP_PROBE_TTL.
+
+    Monitoring pollt /health alle paar Sekunden; ohne Cache würde jeder
+    Aufruf zwei FTP-Logins auslösen. Geänderte FTP-Config verwirft den
+    Cache sofort.
+
+    Returns:
+        Tuple (vedes_result, elena_result) of FTPResult
+    """
+    global _ftp_probe_cache
+
+    ftp_service = FTPService()
+    # Config im Request-Thread laden (DB-Session), nur die beiden
+    # FTP-Logins laufen parallel - Gesamtdauer = langsamster Server
+    configs = (ftp_service.load_config('vedes'), ftp_service.load_config('elena'))
+
+    jetzt = time.monotonic()
+    if _ftp_probe_cache is not None:
+        zeitpunkt, cached_configs, ergebnisse = _ftp_probe_cache
+        if cached_configs == configs and jetzt - zeitpunkt < FTP_PROBE_TTL:
+            return ergebnisse
+
+    executor = ThreadPoolExecutor(max_workers=2)
+    futures = (
+        executor.submit(ftp_service.test_connection, configs[0], 'vedes'),
+        executor.submit(ftp_service.test_connection, configs[1], 'elena'),
+    )
+    # Nicht auf hängende Logins warten; die Threads enden mit dem FTP-Timeout
+    executor.shutdown(wait=False)
+
+    deadline = jetzt + FTP_PROBE_TIMEOUT
+    ergebnisse = []
+    for target, future in zip(('vedes', 'elena'), futures):
+        try:
+            ergebnisse.append(future.result(timeout=max(0, deadline - time.monotonic())))
+        except FutureTimeoutError:
+            ergebnisse.append(FTPResult(
+                success=False,
+                message=f'{target.upper()} FTP timeout after {FTP_PROBE_TIMEOUT}s'
+            ))
+    ergebnisse = tuple(ergebnisse)
+
+    _ftp_probe_cache = (jetzt, configs, ergebnisse)
+    return ergebnisse
+
+
 @admin_bp.route('/api/health')
 def api_health():
     """Simple health check for load balancers/monitoring."""
     try:
-        db.session.execute(db.text('SELECT 1'))
+        # Direkt über eine Pool-Connection, ohne ORM-Session
+        with db.engine.connect() as connection:
+            connection.exec_driver_sql('SELECT 1')
         return jsonify({'status': 'ok'}), 200
     except Exception:
         return jsonify({'status': 'error'}), 503
@@ -498,7 +568,7 @@ def betreiber():
                     filename = secure_filename(file.filename)
                     # Add timestamp to prevent caching issues
                     name, ext = os.path.splitext(filename)
-                    filename = f"logo_{int(datetime.now().timestamp())}{ext}"
+                    filename = f"logo_{int(time.time())}{ext}"
 
                     upload_path = os.path.join(
                         current_app.static_folder, 'uploads', filename
@@ -536,10 +606,14 @@ def betreiber():
 
     # GET request
     # Get current Betreiber (Systemkunde)
-    betreiber_kunde = Kunde.query.filter_by(ist_systemkunde=True).first()
+    betreiber_kunde = Kunde.query.options(
+        db.joinedload(Kunde.ci)
+    ).filter_by(ist_systemkunde=True).first()
 
-    # Load Kunden with CI data for Betreiber selection
-    kunden_mit_ci = Kunde.query.filter(Kunde.ci != None).order_by(Kunde.firmierung).all()
+    # Load Kunden with CI data for Betreiber selection (CI per JOIN statt Lazy-Load je Option)
+    kunden_mit_ci = Kunde.query.join(Kunde.ci).options(
+        db.contains_eager(Kunde.ci)
+    ).order_by(Kunde.firmierung).all()
 
     branding_config = branding_service.get_branding()
     selected_fonts = branding_service.get_selected_fonts()
@@ -652,8 +726,10 @@ def delete_logo():
     logo_path = Config.get_value('brand_logo', '')
     if logo_path:
         full_path = os.path.join(current_app.static_folder, 'uploads', logo_path)
-        if os.path.exists(full_path):
+        try:
             os.remove(full_path)
+        except FileNotFoundError:
+            pass
 
         _update_config('brand_logo', '')
         # Also clear external logo URL
@@ -702,13 +778,21 @@ def apply_kunde_branding(kunde_id):
 
 
 def _update_config(key: str, value: str):
-    """Update or create a config entry."""
-    config = Config.query.filter_by(key=key).first()
+    """Update or create a config entry.
+
+    Die Formulare setzen viele Keys nacheinander: alle Config-Zeilen werden
+    einmal pro Request geladen statt ein SELECT (+ Autoflush) pro Key.
+    """
+    if 'config_eintraege' not in g:
+        g.config_eintraege = {c.key: c for c in Config.query.all()}
+
+    config = g.config_eintraege.get(key)
     if config:
         config.value = value
     else:
         config = Config(key=key, value=value)
         db.session.add(config)
+        g.config_eintraege[key] = config
 
 
 # ============================================================================
@@ -773,10 +857,9 @@ def settings():
     ]
     configs = {key: Config.get_value(key, '') for key in config_keys}
 
-    # Load all configs for overview table
-    all_configs_list = Config.query.order_by(Config.key).all()
-    all_configs = {c.key: c.value for c in all_configs_list}
-    config_count = len(all_configs_list)
+    # Load all configs for overview table (aus dem Request-Cache, ohne weitere Abfrage)
+    all_configs = dict(sorted(Config.as_dict().items()))
+    config_count = len(all_configs)
 
     # Get Brevo quota info for display
     brevo_service = get_brevo_service()
@@ -1449,7 +1532,7 @@ def _handle_verband_logo_upload(verband_id):
     # Generate filename with timestamp
     filename = secure_filename(file.filename)
     name, ext = os.path.splitext(filename)
-    thumb_filename = f"verband_{verband_id}_{int(datetime.now().timestamp())}{ext}"
+    thumb_filename = f"verband_{verband_id}_{int(time.time())}{ext}"
     save_path = os.path.join(upload_dir, thumb_filename)
 
     # Create thumbnail
@@ -1515,8 +1598,10 @@ def verbaende():
                         old_path = os.path.join(
                             current_app.static_folder, 'uploads', 'verbaende', verband.logo_thumb
                         )
-                        if os.path.exists(old_path):
+                        try:
                             os.remove(old_path)
+                        except FileNotFoundError:
+                            pass
                     verband.logo_thumb = thumb_filename
 
                 # Handle logo deletion
@@ -1525,8 +1610,10 @@ def verbaende():
                         old_path = os.path.join(
                             current_app.static_folder, 'uploads', 'verbaende', verband.logo_thumb
                         )
-                        if os.path.exists(old_path):
+                        try:
                             os.remove(old_path)
+                        except FileNotFoundError:
+                            pass
                         verband.logo_thumb = None
 
                 db.session.commit()
@@ -1545,8 +1632,10 @@ def verbaende():
                         logo_path = os.path.join(
                             current_app.static_folder, 'uploads', 'verbaende', verband.logo_thumb
                         )
-                        if os.path.exists(logo_path):
+                        try:
                             os.remove(logo_path)
+                        except FileNotFoundError:
+                            pass
 
                     name = verband.name
                     db.session.delete(verband)
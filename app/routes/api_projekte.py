@@ -7,9 +7,10 @@ import re
 from flask import Blueprint, jsonify, Response, request
 from datetime import datetime
 from flask_login import login_required, current_user
+from sqlalchemy.orm import raiseload, selectinload, undefer
 from app.models import (
     Projekt, Komponente, Task, ChangelogEintrag,
-    TaskStatus, TaskPhase, Config, TaskKommentar
+    TaskStatus, TaskPrioritaet, TaskPhase, Config, TaskKommentar, KommentarTyp
 )
 
 
@@ -63,7 +64,9 @@ def get_projekt(id):
     Usage:
         curl http://localhost:5001/api/projekte/1
     """
-    projekt = Projekt.query.get_or_404(id)
+    projekt = Projekt.query.options(
+        selectinload(Projekt.aktive_komponenten)
+    ).get_or_404(id)
     return jsonify(projekt.to_dict(include_komponenten=True))
 
 
@@ -154,7 +157,15 @@ def get_komponente_tasks(id):
         curl http://localhost:5001/api/komponenten/1/tasks?status=in_arbeit
     """
     komponente = Komponente.query.get_or_404(id)
-    query = komponente.tasks
+    # to_dict() braucht nur diese Beziehungen; raiseload('*') lässt jeden
+    # weiteren Lazy-Load (N+1) sofort scheitern statt still nachzuladen
+    query = komponente.tasks.options(
+        *Task.listen_optionen(),
+        undefer(Task.anzahl_abgeleitete),
+        undefer(Task.beschreibung),
+        selectinload(Task.entstanden_aus),
+        raiseload('*')
+    )
 
     # Apply filters
     if request.args.get('phase'):
@@ -309,6 +320,11 @@ def update_task(id):
     task = Task.query.get_or_404(id)
     data = request.get_json() or {}
 
+    # Enum-Werte vorab prüfen, sonst schlägt erst der Commit fehl (500)
+    for feld, enum_class in (('status', TaskStatus), ('prioritaet', TaskPrioritaet)):
+        if feld in data and data[feld] not in [e.value for e in enum_class]:
+            return jsonify({'error': f'Ungültiger Wert für {feld}: {data[feld]}'}), 400
+
     # Track what was updated
     updated_fields = []
 
@@ -448,8 +464,7 @@ def task_prompt(id):
     projekt = komponente.projekt
 
     # Get prompt suffix from config
-    config = Config.query.filter_by(key='projektverwaltung_ki_prompt_suffix').first()
-    suffix = config.value if config else ''
+    suffix = Config.get_value('projektverwaltung_ki_prompt_suffix', '')
 
     # Replace placeholders
     suffix = suffix.replace('{task_id}', str(task.id))
@@ -523,20 +538,21 @@ def task_kommentare_list(id):
         curl http://localhost:5001/api/tasks/54/kommentare?erledigt=false
     """
     task = Task.query.get_or_404(id)
-    query = task.kommentare
+    kommentare = task.kommentare
 
     # Apply filters
     if request.args.get('typ'):
-        query = query.filter_by(typ=request.args.get('typ'))
+        typ = request.args.get('typ')
+        kommentare = [k for k in kommentare if k.typ == typ]
     if request.args.get('erledigt') is not None:
         erledigt = request.args.get('erledigt').lower() == 'true'
-        query = query.filter_by(erledigt=erledigt)
+        kommentare = [k for k in kommentare if k.erledigt == erledigt]
 
     return jsonify({
         'task_id': task.id,
         'task_nummer': task.task_nummer,
-        'anzahl': query.count(),
-        'kommentare': [k.to_dict() for k in query.all()]
+        'anzahl': len(kommentare),
+        'kommentare': [k.to_dict() for k in kommentare]
     })
 
 
@@ -564,6 +580,8 @@ def task_kommentar_create(id):
 
     if not data or not data.get('inhalt'):
         return jsonify({'error': 'Inhalt ist erforderlich'}), 400
+    if data.get('typ', 'kommentar') not in [t.value for t in KommentarTyp]:
+        return jsonify({'error': f'Ungültiger Kommentar-Typ: {data["typ"]}'}), 400
 
     kommentar = TaskKommentar(
         task_id=task.id,
@@ -634,6 +652,8 @@ def kommentar_update(id):
         return jsonify({'error': 'Nur eigene Kommentare können bearbeitet werden'}), 403
 
     data = request.get_json()
+    if 'typ' in data and data['typ'] not in [t.value for t in KommentarTyp]:
+        return jsonify({'error': f'Ungültiger Kommentar-Typ: {data["typ"]}'}), 400
     if 'inhalt' in data:
         kommentar.inhalt = data['inhalt']
     if 'typ' in data:
@@ -723,10 +743,7 @@ def task_review_prompt(id):
     ])
 
     # Get config suffix
-    config = Config.query.filter_by(
-        key='projektverwaltung_review_prompt_suffix'
-    ).first()
-    suffix = config.value if config else ''
+    suffix = Config.get_value('projektverwaltung_review_prompt_suffix', '')
 
     prompt = f"""## Review für Task {task.task_nummer}
 
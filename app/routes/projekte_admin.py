@@ -152,7 +152,9 @@ def projekt_detail(id):
     tasks_by_status = {}
     if aktive_komponente:
         for status in TaskStatus:
-            query = aktive_komponente.tasks.filter_by(status=status.value)
+            query = aktive_komponente.tasks.options(
+                *Task.listen_optionen()
+            ).filter_by(status=status.value)
 
             # Archivierte Tasks in Backlog/Erledigt filtern (PRD011-T030)
             if status.value == 'backlog' and not show_archived_backlog:
@@ -475,6 +477,8 @@ def task_neu(komponente_id):
 
     if not titel:
         return jsonify({'error': 'Titel ist erforderlich'}), 400
+    if status not in [s.value for s in TaskStatus]:
+        return jsonify({'error': f'Ungültiger Status: {status}'}), 400
 
     # Get max sortierung for this status
     max_sort = db.session.query(db.func.max(Task.sortierung)).filter(
@@ -565,6 +569,15 @@ def task_update(id):
     if not titel:
         return jsonify({'error': 'Titel ist erforderlich'}), 400
 
+    # Enum-Werte vorab prüfen, sonst schlägt erst der Commit fehl (500)
+    for feld, wert, enum_class in (
+        ('status', status, TaskStatus),
+        ('prioritaet', prioritaet, TaskPrioritaet),
+        ('phase', phase, TaskPhase),
+    ):
+        if wert not in [e.value for e in enum_class]:
+            return jsonify({'error': f'Ungültiger Wert für {feld}: {wert}'}), 400
+
     old_status = task.status
     task.titel = titel
     task.beschreibung = beschreibung or None
@@ -646,6 +659,9 @@ def tasks_reorder():
     new_status = data.get('status')
     order = data.get('order', [])
 
+    if new_status and new_status not in [s.value for s in TaskStatus]:
+        return jsonify({'error': f'Ungültiger Status: {new_status}'}), 400
+
     if task_id and new_status:
         task = Task.query.get(task_id)
         if task:
@@ -750,8 +766,7 @@ def einstellungen():
         flash('Einstellungen gespeichert.', 'success')
         return redirect(url_for('projekte_admin.einstellungen'))
 
-    config = Config.query.filter_by(key='projektverwaltung_ki_prompt_suffix').first()
     return render_template(
         'administration/projekte/einstellungen.html',
-        ki_prompt_suffix=config.value if config else ''
+        ki_prompt_suffix=Config.get_value('projektverwaltung_ki_prompt_suffix', '')
     )
@@ -48,7 +48,7 @@ def liste():
                 'warteliste': Schulungsbuchung.query.filter_by(
                     status=BuchungStatus.WARTELISTE.value
                 ).count(),
-                'naechste_termine': Schulungsdurchfuehrung.get_kommende()[:3],
+                'naechste_termine': Schulungsdurchfuehrung.get_kommende(limit=3),
                 'schulungen_aktiv': Schulung.query.filter_by(aktiv=True).count(),
             }
 
@@ -68,7 +68,7 @@ def detail(id):
     if not schulung.aktiv:
         abort(404)
 
-    durchfuehrungen = schulung.kommende_durchfuehrungen
+    durchfuehrungen = Schulungsdurchfuehrung.get_by_schulung(schulung.id)
 
     return render_template(
         'schulungen/detail.html',
@@ -87,10 +87,8 @@ def embed_liste():
     suche = request.args.get('suche', '').strip()
     theme = request.args.get('theme', 'light')
 
-    if suche:
-        schulungen = Schulung.suche(suche, nur_aktive=True)
-    else:
-        schulungen = Schulung.get_mit_kommenden_terminen()
+    # Flache Katalogzeilen in einer Query (meistbesuchte Seite, kein ORM)
+    schulungen = Schulung.list_with_summary(suchbegriff=suche or None)
 
     return render_template(
         'schulungen/embed_liste.html',
@@ -109,7 +107,7 @@ def embed_detail(id):
         abort(404)
 
     theme = request.args.get('theme', 'light')
-    durchfuehrungen = schulung.kommende_durchfuehrungen
+    durchfuehrungen = Schulungsdurchfuehrung.get_by_schulung(schulung.id)
 
     return render_template(
         'schulungen/embed_detail.html',
@@ -15,6 +15,7 @@ from decimal import Decimal
 from io import BytesIO
 from flask import Blueprint, render_template, request, redirect, url_for, flash, abort, send_file
 from flask_login import login_required, current_user
+from sqlalchemy.orm import raiseload, selectinload
 
 from app import db
 from app.models import (
@@ -37,7 +38,12 @@ schulungen_admin_bp = Blueprint('schulungen_admin', __name__, url_prefix='/admin
 @mitarbeiter_required
 def index():
     """Dashboard with overview of all trainings."""
-    schulungen = Schulung.query.order_by(Schulung.sortierung, Schulung.titel).all()
+    # Alles für die Liste explizit vorladen; raiseload macht N+1 sofort sichtbar
+    schulungen = Schulung.query.options(
+        selectinload(Schulung.thema_verknuepfungen).selectinload(SchulungThema.thema),
+        selectinload(Schulung.durchfuehrungen),
+        raiseload('*', sql_only=True)
+    ).order_by(Schulung.sortierung, Schulung.titel).all()
     themen = Schulungsthema.query.filter_by(aktiv=True).order_by(Schulungsthema.titel).all()
 
     # Stats
@@ -249,7 +255,9 @@ def schulung_loeschen(id):
 @mitarbeiter_required
 def themen_liste():
     """List all training topics."""
-    themen = Schulungsthema.query.order_by(Schulungsthema.titel).all()
+    themen = Schulungsthema.query.options(
+        db.undefer(Schulungsthema.anzahl_schulungen)
+    ).order_by(Schulungsthema.titel).all()
     return render_template(
         'administration/schulungen/themen_liste.html',
         themen=themen,
@@ -370,7 +378,10 @@ def durchfuehrungen_liste():
     status_filter = request.args.get('status', '')
     schulung_filter = request.args.get('schulung', '')
 
-    query = Schulungsdurchfuehrung.query
+    query = Schulungsdurchfuehrung.query.options(
+        selectinload(Schulungsdurchfuehrung.schulung),
+        raiseload('*', sql_only=True)
+    )
 
     if status_filter:
         query = query.filter_by(status=status_filter)
@@ -397,7 +408,9 @@ def durchfuehrungen_liste():
 @mitarbeiter_required
 def durchfuehrung_neu(schulung_id=None):
     """Create a new execution."""
-    schulungen = Schulung.query.filter_by(aktiv=True).order_by(Schulung.titel).all()
+    schulungen = Schulung.query.options(
+        selectinload(Schulung.thema_verknuepfungen).selectinload(SchulungThema.thema)
+    ).filter_by(aktiv=True).order_by(Schulung.titel).all()
 
     if request.method == 'POST':
         schulung_id = int(request.form.get('schulung_id'))
@@ -511,7 +524,14 @@ def buchungen_liste():
     status_filter = request.args.get('status', '')
     durchfuehrung_filter = request.args.get('durchfuehrung', '')
 
-    query = Schulungsbuchung.query
+    query = Schulungsbuchung.query.options(
+        selectinload(Schulungsbuchung.kunde),
+        selectinload(Schulungsbuchung.durchfuehrung).options(
+            selectinload(Schulungsdurchfuehrung.schulung),
+            raiseload('*', sql_only=True)
+        ),
+        raiseload('*', sql_only=True)
+    )
 
     if status_filter:
         query = query.filter_by(status=status_filter)
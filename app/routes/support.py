@@ -112,15 +112,23 @@ def ticket_erstellen():
 @login_required
 def ticket_detail(nummer):
     """View ticket details and comments."""
-    ticket = SupportTicket.query.filter_by(nummer=nummer).first_or_404()
+    ist_team = current_user.is_admin or current_user.is_mitarbeiter
+
+    query = SupportTicket.query
+    if not ist_team:
+        # Öffentliche Kommentare samt Text gleich mitladen
+        query = query.options(
+            db.selectinload(SupportTicket.oeffentliche_kommentare).undefer_group('content')
+        )
+    ticket = query.filter_by(nummer=nummer).first_or_404()
 
     # Check access
     if not ticket.kann_sehen(current_user):
         abort(403)
 
     # Get comments (filter internal comments for non-team members)
-    if current_user.is_admin or current_user.is_mitarbeiter:
-        kommentare = ticket.kommentare.all()
+    if ist_team:
+        kommentare = ticket.kommentare.options(db.undefer_group('content')).all()
     else:
         kommentare = ticket.oeffentliche_kommentare
 
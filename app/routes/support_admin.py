@@ -126,7 +126,7 @@ def ticket_detail(nummer):
         return redirect(url_for('support_admin.ticket_detail', nummer=nummer))
 
     # GET: Show ticket details
-    kommentare = ticket.kommentare.all()
+    kommentare = ticket.kommentare.options(db.undefer_group('content')).all()
 
     # Get team members for assignment dropdown
     team_members = User.query.join(Rolle).filter(
@@ -199,7 +199,9 @@ def assign_ticket(nummer):
 @admin_required
 def teams():
     """List all support teams."""
-    all_teams = SupportTeam.query.order_by(SupportTeam.name).all()
+    all_teams = SupportTeam.query.options(
+        db.selectinload(SupportTeam.mitglieder).joinedload(SupportTeamMitglied.user)
+    ).order_by(SupportTeam.name).all()
 
     return render_template(
         'support/admin/teams.html',
@@ -1,10 +1,21 @@
 """Branding Service for loading brand configuration."""
+import time
 from dataclasses import dataclass
 
+from app import db
 from app.models import Config
 
 
-@dataclass
+# Branding wird auf jeder Seite gerendert, ändert sich aber selten: pro
+# Worker-Prozess für BRANDING_CACHE_TTL Sekunden wiederverwenden.
+# Config-Änderungen im selben Prozess verwerfen den Cache sofort.
+BRANDING_CACHE_TTL = 60
+
+# (Zeitpunkt, BrandingConfig) oder None
+_branding_cache = None
+
+
+@dataclass(frozen=True)
 class BrandingConfig:
     """Branding configuration values."""
     logo_url: str
@@ -70,6 +81,18 @@ class BrandingService:
     ]
 
     def get_branding(self) -> BrandingConfig:
+        """Load branding configuration, cached for BRANDING_CACHE_TTL seconds."""
+        global _branding_cache
+
+        jetzt = time.monotonic()
+        if _branding_cache is not None and jetzt - _branding_cache[0] < BRANDING_CACHE_TTL:
+            return _branding_cache[1]
+
+        branding = self._load_branding()
+        _branding_cache = (jetzt, branding)
+        return branding
+
+    def _load_branding(self) -> BrandingConfig:
         """Load branding configuration from database."""
         logo_path = Config.get_value('brand_logo', '')
         logo_url_external = Config.get_value('brand_logo_url', '')
@@ -223,3 +246,12 @@ def get_branding_service() -> BrandingService:
     if _branding_service is None:
         _branding_service = BrandingService()
     return _branding_service
+
+
+@db.event.listens_for(Config, 'after_insert')
+@db.event.listens_for(Config, 'after_update')
+@db.event.listens_for(Config, 'after_delete')
+def _branding_cache_leeren(mapper, connection, target):
+    """Config changes (Betreiber/Branding forms) invalidate the branding cache."""
+    global _branding_cache
+    _branding_cache = None
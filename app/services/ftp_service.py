@@ -61,8 +61,7 @@ class FTPService:
 
     def _get_config_value(self, key: str) -> str:
         """Get configuration value from database."""
-        config_entry = Config.query.filter_by(key=key).first()
-        return config_entry.value if config_entry else ''
+        return Config.get_value(key, '')
 
     def _decode_password(self, password_b64: str) -> str:
         """Decode Base64-encoded password (FileZilla compatible)."""
@@ -102,6 +101,20 @@ class FTPService:
             port=port
         )
 
+    def load_config(self, target: str = 'vedes') -> FTPConfig:
+        """
+        Load FTP configuration for a target from database.
+
+        Needs the app context; the returned FTPConfig can be passed to
+        test_connection() from worker threads.
+
+        Args:
+            target: 'vedes' or 'elena'
+        """
+        if target == 'elena':
+            return self._load_elena_config()
+        return self._load_vedes_config()
+
     def _connect(self, config: FTPConfig) -> ftplib.FTP:
         """
         Establish FTP connection.
@@ -435,12 +448,7 @@ class FTPService:
         """
         result = FTPResult(success=False)
 
-        if config:
-            ftp_config = config
-        elif target == 'elena':
-            ftp_config = self._load_elena_config()
-        else:
-            ftp_config = self._load_vedes_config()
+        ftp_config = config or self.load_config(target)
 
         if not ftp_config.host:
             result.message = f"{target.upper()} FTP not configured"
@@ -197,8 +197,7 @@ class StorageService:
     def _load_config(self) -> S3Config:
         """Load S3 config from database."""
         def get_config(key: str, default: str = '') -> str:
-            config = Config.query.filter_by(key=key).first()
-            return config.value if config and config.value else default
+            return Config.get_value(key) or default
 
         def decode_password(password_b64: str) -> str:
             """Decode Base64 password (FileZilla compatible)."""
@@ -178,9 +178,7 @@ class SupportService:
             ticket.geschlossen_am = datetime.utcnow()
 
         # Create status change comment
-        status_text = f'Status geändert: {TicketStatus.get_label(alter_status)} → {TicketStatus.get_label(neuer_status)}'
-        if kommentar_text:
-            status_text += f'\n\n{kommentar_text}'
+        status_text = self._status_text(alter_status, neuer_status, kommentar_text)
 
         kommentar = TicketKommentar(
             ticket_id=ticket.id,
@@ -202,6 +200,69 @@ class SupportService:
             entity_id=ticket.id
         )
 
+    def change_status_bulk(
+        self,
+        tickets: List[SupportTicket],
+        neuer_status: str,
+        kommentar_text: str = None,
+        user: User = None
+    ) -> int:
+        """Change the status of many tickets at once (e.g. auto-close).
+
+        The status change comments are written in one bulk insert
+        instead of one ORM insert per ticket.
+
+        Args:
+            tickets: The tickets to update
+            neuer_status: New status value
+            kommentar_text: Optional comment explaining the change
+            user: User making the change (defaults to current_user)
+
+        Returns:
+            Number of tickets whose status changed
+        """
+        if user is None:
+            user = current_user
+
+        jetzt = datetime.utcnow()
+        rows = []
+        for ticket in tickets:
+            alter_status = ticket.status
+            if alter_status == neuer_status:
+                continue
+            ticket.status = neuer_status
+            ticket.aktualisiert_am = jetzt
+            if neuer_status == TicketStatus.GELOEST.value and not ticket.geloest_am:
+                ticket.geloest_am = jetzt
+            elif neuer_status == TicketStatus.GESCHLOSSEN.value and not ticket.geschlossen_am:
+                ticket.geschlossen_am = jetzt
+            rows.append({
+                'ticket_id': ticket.id,
+                'user_id': user.id,
+                'inhalt': self._status_text(alter_status, neuer_status, kommentar_text),
+            })
+
+        if rows:
+            TicketKommentar.bulk_log_status_changes(rows)
+            log_mittel(
+                'support',
+                'ticket_status_geaendert',
+                f'{len(rows)} Tickets → {TicketStatus.get_label(neuer_status)}',
+                entity_type='support_ticket',
+                user_id=user.id
+            )
+        db.session.commit()
+
+        return len(rows)
+
+    @staticmethod
+    def _status_text(alter_status: str, neuer_status: str, kommentar_text: str = None) -> str:
+        """Build the text of a status change comment."""
+        status_text = f'Status geändert: {TicketStatus.get_label(alter_status)} → {TicketStatus.get_label(neuer_status)}'
+        if kommentar_text:
+            status_text += f'\n\n{kommentar_text}'
+        return status_text
+
     def assign_ticket(
         self,
         ticket: SupportTicket,
@@ -247,9 +308,7 @@ class SupportService:
         Returns:
             List of SupportTicket instances
         """
-        return SupportTicket.query.filter_by(
-            erstellt_von_id=user.id
-        ).order_by(SupportTicket.erstellt_am.desc()).all()
+        return SupportTicket.for_list(SupportTicket.erstellt_von_id == user.id)
 
     def get_all_tickets(
         self,
@@ -273,28 +332,28 @@ class SupportService:
         Returns:
             List of filtered SupportTicket instances
         """
-        query = SupportTicket.query
+        filters = []
 
         if status:
-            query = query.filter(SupportTicket.status == status)
+            filters.append(SupportTicket.status == status)
         elif nur_offene:
-            query = query.filter(
+            filters.append(
                 SupportTicket.status.in_(TicketStatus.aktive_status())
             )
 
         if typ:
-            query = query.filter(SupportTicket.typ == typ)
+            filters.append(SupportTicket.typ == typ)
 
         if prioritaet:
-            query = query.filter(SupportTicket.prioritaet == prioritaet)
+            filters.append(SupportTicket.prioritaet == prioritaet)
 
         if team_id:
-            query = query.filter(SupportTicket.team_id == team_id)
+            filters.append(SupportTicket.team_id == team_id)
 
         if bearbeiter_id:
-            query = query.filter(SupportTicket.bearbeiter_id == bearbeiter_id)
+            filters.append(SupportTicket.bearbeiter_id == bearbeiter_id)
 
-        return query.order_by(SupportTicket.erstellt_am.desc()).all()
+        return SupportTicket.for_list(*filters)
 
     def get_ticket_stats(self) -> dict:
         """Get ticket statistics for dashboard.
@@ -333,7 +392,8 @@ class SupportService:
             return
 
         # Get team members with notifications enabled
-        recipients = ticket.team.mitglieder_mit_benachrichtigung
+        team = SupportTeam.with_active_members(ticket.team_id)
+        recipients = team.mitglieder_mit_benachrichtigung
         if not recipients:
             current_app.logger.warning(
                 f'No team members to notify for ticket {ticket.nummer}'
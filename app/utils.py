@@ -1,8 +1,11 @@
 """Utility functions for pricat-converter."""
 import re
+from datetime import date
 from pathlib import Path
 from typing import Optional, Tuple
 
+from flask import g, has_request_context
+
 
 def strip_leading_zeros(value: str) -> str:
     """
@@ -108,3 +111,21 @@ def count_pricat_articles(file_path: Path) -> int:
             return 0
 
     return count
+
+
+def request_today() -> date:
+    """
+    Return today's date, cached for the current request.
+
+    Model properties that compare against today are evaluated many times
+    per list page; within a request they share one value. Outside a
+    request (CLI, scheduler) this is plain date.today().
+
+    Returns:
+        Today's date
+    """
+    if not has_request_context():
+        return date.today()
+    if 'today' not in g:
+        g.today = date.today()
+    return g.today
@@ -0,0 +1,53 @@
+"""Server-side UTC timestamp defaults
+
+Revision ID: 0a3de33664df
+Revises: 8a2f06844e71
+Create Date: 2026-10-17 10:03:11.542871
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0a3de33664df'
+down_revision = '8a2f06844e71'
+branch_labels = None
+depends_on = None
+
+
+# (table, column) pairs filled by the database instead of datetime.utcnow
+TIMESTAMP_COLUMNS = [
+    ('modul_erp', 'created_at'),
+    ('modul_erp', 'updated_at'),
+    ('projekt', 'created_at'),
+    ('projekt', 'updated_at'),
+    ('produkt', 'created_at'),
+    ('admin_page_visit', 'timestamp'),
+    ('password_token', 'created_at'),
+    ('rolle', 'created_at'),
+]
+
+
+def utcnow_default():
+    """Current UTC timestamp as server default (mirrors app.models.sql_functions.utcnow)."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        return sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)")
+    if dialect in ('mysql', 'mariadb'):
+        return sa.text('(UTC_TIMESTAMP())')
+    # SQLite: CURRENT_TIMESTAMP only has whole seconds
+    return sa.text("(strftime('%Y-%m-%d %H:%M:%f', 'now'))")
+
+
+def upgrade():
+    default = utcnow_default()
+    for table, column in TIMESTAMP_COLUMNS:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(column, existing_type=sa.DateTime(), server_default=default)
+
+
+def downgrade():
+    for table, column in reversed(TIMESTAMP_COLUMNS):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(column, existing_type=sa.DateTime(), server_default=None)
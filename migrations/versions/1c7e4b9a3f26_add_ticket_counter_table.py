@@ -0,0 +1,62 @@
+"""Add ticket_counter table for per-year ticket numbers
+
+Revision ID: 1c7e4b9a3f26
+Revises: d5e7a2b9c814
+Create Date: 2026-10-17 16:02:41.118305
+
+SupportTicket.generate_nummer() takes the next number from this table
+instead of scanning support_ticket. Existing years are seeded from the
+highest number already stored (old T-YYYY-N and new YYYY-N format).
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = '1c7e4b9a3f26'
+down_revision = 'd5e7a2b9c814'
+branch_labels = None
+depends_on = None
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    inspector = inspect(op.get_bind())
+    return table_name in inspector.get_table_names()
+
+
+def upgrade():
+    if not table_exists('ticket_counter'):
+        op.create_table(
+            'ticket_counter',
+            sa.Column('year', sa.Integer(), autoincrement=False, nullable=False),
+            sa.Column('seq', sa.Integer(), nullable=False),
+            sa.PrimaryKeyConstraint('year')
+        )
+
+    if not table_exists('support_ticket'):
+        return
+
+    conn = op.get_bind()
+    counters = {}
+    for (nummer,) in conn.execute(sa.text('SELECT nummer FROM support_ticket')):
+        parts = (nummer or '').split('-')
+        try:
+            year, seq = int(parts[-2]), int(parts[-1])
+        except (ValueError, IndexError):
+            continue
+        counters[year] = max(counters.get(year, 0), seq)
+
+    existing = {row[0] for row in conn.execute(sa.text('SELECT year FROM ticket_counter'))}
+    for year, seq in counters.items():
+        if year not in existing:
+            conn.execute(
+                sa.text('INSERT INTO ticket_counter (year, seq) VALUES (:year, :seq)'),
+                {'year': year, 'seq': seq}
+            )
+
+
+def downgrade():
+    if table_exists('ticket_counter'):
+        op.drop_table('ticket_counter')
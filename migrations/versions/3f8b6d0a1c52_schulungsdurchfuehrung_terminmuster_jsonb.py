@@ -0,0 +1,44 @@
+"""Store schulungsdurchfuehrung.terminmuster as JSONB on PostgreSQL
+
+Revision ID: 3f8b6d0a1c52
+Revises: e6a0f3b94c17
+Create Date: 2026-10-17 13:40:08.553914
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = '3f8b6d0a1c52'
+down_revision = 'e6a0f3b94c17'
+branch_labels = None
+depends_on = None
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    inspector = inspect(op.get_bind())
+    return table_name in inspector.get_table_names()
+
+
+def upgrade():
+    # JSONB is PostgreSQL-only; other engines keep the generic JSON column
+    if op.get_bind().dialect.name != 'postgresql' or not table_exists('schulungsdurchfuehrung'):
+        return
+
+    op.execute(
+        'ALTER TABLE schulungsdurchfuehrung ALTER COLUMN terminmuster TYPE JSONB '
+        'USING terminmuster::jsonb'
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql' or not table_exists('schulungsdurchfuehrung'):
+        return
+
+    op.execute(
+        'ALTER TABLE schulungsdurchfuehrung ALTER COLUMN terminmuster TYPE JSON '
+        'USING terminmuster::json'
+    )
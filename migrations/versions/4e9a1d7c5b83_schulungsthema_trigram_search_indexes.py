@@ -0,0 +1,49 @@
+"""Trigram GIN indexes for the Schulungsthema search
+
+Revision ID: 4e9a1d7c5b83
+Revises: 1c7e4b9a3f26
+Create Date: 2026-10-17 16:24:09.502817
+
+Note: PostgreSQL only (pg_trgm). Functional indexes on lower(titel) and
+lower(beschreibung) serve the lower(...) LIKE '%term%' filters in
+Schulungsthema.suche. Not declared on the model because create_all
+would fail on databases without the pg_trgm extension.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = '4e9a1d7c5b83'
+down_revision = '1c7e4b9a3f26'
+branch_labels = None
+depends_on = None
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    inspector = inspect(op.get_bind())
+    return table_name in inspector.get_table_names()
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql' or not table_exists('schulungsthema'):
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for column in ('titel', 'beschreibung'):
+        op.create_index(
+            f'ix_schulungsthema_{column}_trgm', 'schulungsthema',
+            [sa.text(f'lower({column}) gin_trgm_ops')],
+            postgresql_using='gin',
+            if_not_exists=True
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql' or not table_exists('schulungsthema'):
+        return
+
+    for column in ('titel', 'beschreibung'):
+        op.drop_index(f'ix_schulungsthema_{column}_trgm', table_name='schulungsthema', if_exists=True)
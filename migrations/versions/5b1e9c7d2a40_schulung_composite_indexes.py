@@ -0,0 +1,52 @@
+"""Composite indexes for Schulungen list and booking queries
+
+Revision ID: 5b1e9c7d2a40
+Revises: c077f6d87e39
+Create Date: 2026-10-17 12:05:13.418220
+
+Note: The Schulungen tables are created by init-db. Indexes are only
+created where the table exists and the index is still missing.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = '5b1e9c7d2a40'
+down_revision = 'c077f6d87e39'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ('ix_schulung_aktiv_sort', 'schulung', ['aktiv', 'sortierung', 'titel']),
+    ('ix_durchf_status_start', 'schulungsdurchfuehrung', ['status', 'start_datum']),
+    ('ix_durchf_schulung_start', 'schulungsdurchfuehrung', ['schulung_id', 'start_datum']),
+    ('ix_buchung_durchf_status', 'schulungsbuchung', ['durchfuehrung_id', 'status']),
+    ('ix_termin_durchf_datum', 'schulungstermin', ['durchfuehrung_id', 'datum', 'uhrzeit_von']),
+]
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    inspector = inspect(op.get_bind())
+    return table_name in inspector.get_table_names()
+
+
+def index_exists(table_name, index_name):
+    """Check if an index exists on a table."""
+    inspector = inspect(op.get_bind())
+    return index_name in [ix['name'] for ix in inspector.get_indexes(table_name)]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        if table_exists(table) and not index_exists(table, name):
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade():
+    for name, table, columns in reversed(INDEXES):
+        if table_exists(table) and index_exists(table, name):
+            op.drop_index(name, table_name=table)
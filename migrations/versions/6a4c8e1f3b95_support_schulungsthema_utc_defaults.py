@@ -0,0 +1,64 @@
+"""Server-side UTC timestamp defaults for support and Schulungsthema
+
+Revision ID: 6a4c8e1f3b95
+Revises: b2d8f4a6c071
+Create Date: 2026-10-17 17:46:20.884013
+
+Note: schulungsthema is created by init-db, so it is only altered where
+the table exists. onupdate columns need no server default; the SQL
+expression is part of the UPDATE itself.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = '6a4c8e1f3b95'
+down_revision = 'b2d8f4a6c071'
+branch_labels = None
+depends_on = None
+
+
+# (table, column) pairs filled by the database instead of datetime.utcnow
+TIMESTAMP_COLUMNS = [
+    ('schulungsthema', 'created_at'),
+    ('support_team', 'created_at'),
+    ('support_team_mitglied', 'created_at'),
+    ('support_ticket', 'erstellt_am'),
+    ('ticket_kommentar', 'erstellt_am'),
+]
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    inspector = inspect(op.get_bind())
+    return table_name in inspector.get_table_names()
+
+
+def utcnow_default():
+    """Current UTC timestamp as server default (mirrors app.models.sql_functions.utcnow)."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        return sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)")
+    if dialect in ('mysql', 'mariadb'):
+        return sa.text('(UTC_TIMESTAMP())')
+    # SQLite: CURRENT_TIMESTAMP only has whole seconds
+    return sa.text("(strftime('%Y-%m-%d %H:%M:%f', 'now'))")
+
+
+def upgrade():
+    default = utcnow_default()
+    for table, column in TIMESTAMP_COLUMNS:
+        if not table_exists(table):
+            continue
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(column, existing_type=sa.DateTime(), server_default=default)
+
+
+def downgrade():
+    for table, column in reversed(TIMESTAMP_COLUMNS):
+        if not table_exists(table):
+            continue
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(column, existing_type=sa.DateTime(), server_default=None)
@@ -0,0 +1,47 @@
+"""Trigram GIN index for the Schulung title/description search
+
+Revision ID: 7c2d5e9f0b31
+Revises: 3f8b6d0a1c52
+Create Date: 2026-10-17 14:02:37.190245
+
+Note: PostgreSQL only (pg_trgm). The index serves the existing
+ILIKE '%term%' filters in Schulung.suche, so the query itself and its
+results stay unchanged. Not declared on the model because create_all
+would fail on databases without the pg_trgm extension.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = '7c2d5e9f0b31'
+down_revision = '3f8b6d0a1c52'
+branch_labels = None
+depends_on = None
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    inspector = inspect(op.get_bind())
+    return table_name in inspector.get_table_names()
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql' or not table_exists('schulung'):
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_schulung_trgm', 'schulung', ['titel', 'beschreibung'],
+        postgresql_using='gin',
+        postgresql_ops={'titel': 'gin_trgm_ops', 'beschreibung': 'gin_trgm_ops'},
+        if_not_exists=True
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql' or not table_exists('schulung'):
+        return
+
+    op.drop_index('ix_schulung_trgm', table_name='schulung', if_exists=True)
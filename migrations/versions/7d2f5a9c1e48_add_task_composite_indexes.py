@@ -0,0 +1,62 @@
+"""Composite indexes for task and task_kommentar
+
+Revision ID: 7d2f5a9c1e48
+Revises: e3a7c9b5d214
+Create Date: 2026-10-17 19:05:41.512803
+
+Kanban columns filter tasks by komponente_id + status (+ ist_archiviert)
+and sort by sortierung; assigned tasks are looked up by zugewiesen_an +
+status. Comments are loaded per task and filtered by typ/erledigt.
+
+On PostgreSQL the indexes are built CONCURRENTLY (outside the migration
+transaction) so the task table stays writable while they are created.
+"""
+from alembic import op
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = '7d2f5a9c1e48'
+down_revision = 'e3a7c9b5d214'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ('task', 'ix_task_komp_status_arch', ['komponente_id', 'status', 'ist_archiviert']),
+    ('task', 'ix_task_komp_sort', ['komponente_id', 'sortierung']),
+    ('task', 'ix_task_assignee_status', ['zugewiesen_an', 'status']),
+    ('task_kommentar', 'ix_task_kommentar_task_typ_erledigt', ['task_id', 'typ', 'erledigt']),
+]
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    inspector = inspect(op.get_bind())
+    return table_name in inspector.get_table_names()
+
+
+def index_exists(table_name, index_name):
+    """Check if an index exists on a table."""
+    inspector = inspect(op.get_bind())
+    return index_name in [ix['name'] for ix in inspector.get_indexes(table_name)]
+
+
+def upgrade():
+    is_postgres = op.get_bind().dialect.name == 'postgresql'
+
+    for table_name, index_name, columns in INDEXES:
+        if not table_exists(table_name) or index_exists(table_name, index_name):
+            continue
+        if is_postgres:
+            with op.get_context().autocommit_block():
+                op.create_index(index_name, table_name, columns, unique=False,
+                                postgresql_concurrently=True)
+        else:
+            op.create_index(index_name, table_name, columns, unique=False)
+
+
+def downgrade():
+    for table_name, index_name, _columns in reversed(INDEXES):
+        if table_exists(table_name) and index_exists(table_name, index_name):
+            op.drop_index(index_name, table_name=table_name)
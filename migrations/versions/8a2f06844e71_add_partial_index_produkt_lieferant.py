@@ -0,0 +1,35 @@
+"""Add partial index on produkt for get_by_lieferant
+
+Revision ID: 8a2f06844e71
+Revises: d887e4092bf3
+Create Date: 2026-10-17 09:12:40.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8a2f06844e71'
+down_revision = 'd887e4092bf3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Active products per supplier, sorted by name (status <> 'archiviert')
+    op.create_index(
+        'ix_produkt_lieferant_bezeichnung_aktiv',
+        'produkt',
+        ['lieferant_id', 'artikelbezeichnung'],
+        unique=False,
+        postgresql_where=sa.text("status <> 'archiviert'"),
+        sqlite_where=sa.text("status <> 'archiviert'"),
+    )
+    # All products per supplier (nur_aktive=False)
+    op.create_index('ix_produkt_lieferant_status', 'produkt', ['lieferant_id', 'status'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_produkt_lieferant_status', table_name='produkt')
+    op.drop_index('ix_produkt_lieferant_bezeichnung_aktiv', table_name='produkt')
@@ -0,0 +1,57 @@
+"""Composite index for support ticket lists
+
+Revision ID: 8f3b6e2d9a17
+Revises: 4e9a1d7c5b83
+Create Date: 2026-10-17 16:41:52.730164
+
+Replaces the single-column status index with (status, team_id,
+erstellt_am DESC). On PostgreSQL nummer, titel and prioritaet are
+INCLUDEd so list queries can be served by an index-only scan.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = '8f3b6e2d9a17'
+down_revision = '4e9a1d7c5b83'
+branch_labels = None
+depends_on = None
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    inspector = inspect(op.get_bind())
+    return table_name in inspector.get_table_names()
+
+
+def index_exists(table_name, index_name):
+    """Check if an index exists on a table."""
+    inspector = inspect(op.get_bind())
+    return index_name in [ix['name'] for ix in inspector.get_indexes(table_name)]
+
+
+def upgrade():
+    if not table_exists('support_ticket'):
+        return
+
+    if not index_exists('support_ticket', 'ix_ticket_status_team_erstellt'):
+        op.create_index(
+            'ix_ticket_status_team_erstellt', 'support_ticket',
+            ['status', 'team_id', sa.text('erstellt_am DESC')],
+            unique=False,
+            postgresql_include=['nummer', 'titel', 'prioritaet']
+        )
+    if index_exists('support_ticket', 'ix_support_ticket_status'):
+        op.drop_index('ix_support_ticket_status', table_name='support_ticket')
+
+
+def downgrade():
+    if not table_exists('support_ticket'):
+        return
+
+    if not index_exists('support_ticket', 'ix_support_ticket_status'):
+        op.create_index('ix_support_ticket_status', 'support_ticket', ['status'], unique=False)
+    if index_exists('support_ticket', 'ix_ticket_status_team_erstellt'):
+        op.drop_index('ix_ticket_status_team_erstellt', table_name='support_ticket')
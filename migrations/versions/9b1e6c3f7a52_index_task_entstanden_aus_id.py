@@ -0,0 +1,42 @@
+"""Index task.entstanden_aus_id
+
+Revision ID: 9b1e6c3f7a52
+Revises: 7d2f5a9c1e48
+Create Date: 2026-10-17 19:41:12.084417
+
+Task.anzahl_abgeleitete counts derived tasks with a correlated subquery
+on entstanden_aus_id; without an index every listed task scans the table.
+"""
+from alembic import op
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = '9b1e6c3f7a52'
+down_revision = '7d2f5a9c1e48'
+branch_labels = None
+depends_on = None
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    inspector = inspect(op.get_bind())
+    return table_name in inspector.get_table_names()
+
+
+def index_exists(table_name, index_name):
+    """Check if an index exists on a table."""
+    inspector = inspect(op.get_bind())
+    return index_name in [ix['name'] for ix in inspector.get_indexes(table_name)]
+
+
+def upgrade():
+    if not table_exists('task') or index_exists('task', 'ix_task_entstanden_aus_id'):
+        return
+
+    op.create_index('ix_task_entstanden_aus_id', 'task', ['entstanden_aus_id'], unique=False)
+
+
+def downgrade():
+    if table_exists('task') and index_exists('task', 'ix_task_entstanden_aus_id'):
+        op.drop_index('ix_task_entstanden_aus_id', table_name='task')
@@ -0,0 +1,37 @@
+"""Index on schulungsbuchung (status, gebucht_am) for the ERP export
+
+Revision ID: 9d4c2e81b7f3
+Revises: 5b1e9c7d2a40
+Create Date: 2026-10-17 12:31:46.902114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = '9d4c2e81b7f3'
+down_revision = '5b1e9c7d2a40'
+branch_labels = None
+depends_on = None
+
+
+def index_exists(table_name, index_name):
+    """Check if the table exists and carries the index."""
+    inspector = inspect(op.get_bind())
+    if table_name not in inspector.get_table_names():
+        return None
+    return index_name in [ix['name'] for ix in inspector.get_indexes(table_name)]
+
+
+def upgrade():
+    # Table is created by init-db; skip if missing or index already present
+    if index_exists('schulungsbuchung', 'ix_buchung_status_gebucht_am') is False:
+        op.create_index('ix_buchung_status_gebucht_am', 'schulungsbuchung',
+                        ['status', 'gebucht_am'], unique=False)
+
+
+def downgrade():
+    if index_exists('schulungsbuchung', 'ix_buchung_status_gebucht_am'):
+        op.drop_index('ix_buchung_status_gebucht_am', table_name='schulungsbuchung')
@@ -0,0 +1,37 @@
+"""Index on schulung_thema (schulung_id, sortierung)
+
+Revision ID: a81f4c3e6d92
+Revises: 7c2d5e9f0b31
+Create Date: 2026-10-17 14:27:51.604318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = 'a81f4c3e6d92'
+down_revision = '7c2d5e9f0b31'
+branch_labels = None
+depends_on = None
+
+
+def index_exists(table_name, index_name):
+    """Check if the table exists and carries the index."""
+    inspector = inspect(op.get_bind())
+    if table_name not in inspector.get_table_names():
+        return None
+    return index_name in [ix['name'] for ix in inspector.get_indexes(table_name)]
+
+
+def upgrade():
+    # Table is created by init-db; skip if missing or index already present
+    if index_exists('schulung_thema', 'ix_schulung_thema_schulung_sort') is False:
+        op.create_index('ix_schulung_thema_schulung_sort', 'schulung_thema',
+                        ['schulung_id', 'sortierung'], unique=False)
+
+
+def downgrade():
+    if index_exists('schulung_thema', 'ix_schulung_thema_schulung_sort'):
+        op.drop_index('ix_schulung_thema_schulung_sort', table_name='schulung_thema')
@@ -0,0 +1,81 @@
+"""Store year and sequence number of support tickets
+
+Revision ID: b2d8f4a6c071
+Revises: 8f3b6e2d9a17
+Create Date: 2026-10-17 17:08:33.415926
+
+Adds year/seq_num (parsed from nummer, old T-YYYY-N and new YYYY-N
+format) plus an index on (year, seq_num). nummer_anzeige/nummer_intern
+format these columns instead of parsing the string per access.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = 'b2d8f4a6c071'
+down_revision = '8f3b6e2d9a17'
+branch_labels = None
+depends_on = None
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    inspector = inspect(op.get_bind())
+    return table_name in inspector.get_table_names()
+
+
+def column_exists(table_name, column_name):
+    """Check if a column exists in a table."""
+    inspector = inspect(op.get_bind())
+    return column_name in [c['name'] for c in inspector.get_columns(table_name)]
+
+
+def index_exists(table_name, index_name):
+    """Check if an index exists on a table."""
+    inspector = inspect(op.get_bind())
+    return index_name in [ix['name'] for ix in inspector.get_indexes(table_name)]
+
+
+def upgrade():
+    if not table_exists('support_ticket'):
+        return
+
+    with op.batch_alter_table('support_ticket', schema=None) as batch_op:
+        if not column_exists('support_ticket', 'year'):
+            batch_op.add_column(sa.Column('year', sa.SmallInteger(), nullable=True))
+        if not column_exists('support_ticket', 'seq_num'):
+            batch_op.add_column(sa.Column('seq_num', sa.Integer(), nullable=True))
+
+    if not index_exists('support_ticket', 'ix_ticket_year_seq'):
+        op.create_index('ix_ticket_year_seq', 'support_ticket', ['year', 'seq_num'], unique=False)
+
+    conn = op.get_bind()
+    rows = conn.execute(sa.text(
+        'SELECT id, nummer FROM support_ticket WHERE seq_num IS NULL'
+    )).fetchall()
+    for ticket_id, nummer in rows:
+        parts = (nummer or '').replace('T-', '').split('-')
+        try:
+            year, seq_num = int(parts[0]), int(parts[-1])
+        except (ValueError, IndexError):
+            continue
+        conn.execute(
+            sa.text('UPDATE support_ticket SET year = :year, seq_num = :seq_num WHERE id = :id'),
+            {'year': year, 'seq_num': seq_num, 'id': ticket_id}
+        )
+
+
+def downgrade():
+    if not table_exists('support_ticket'):
+        return
+
+    if index_exists('support_ticket', 'ix_ticket_year_seq'):
+        op.drop_index('ix_ticket_year_seq', table_name='support_ticket')
+
+    with op.batch_alter_table('support_ticket', schema=None) as batch_op:
+        if column_exists('support_ticket', 'seq_num'):
+            batch_op.drop_column('seq_num')
+        if column_exists('support_ticket', 'year'):
+            batch_op.drop_column('year')
@@ -0,0 +1,42 @@
+"""Covering indexes on produkt ean and artikelnummer_lieferant
+
+Revision ID: c077f6d87e39
+Revises: 0a3de33664df
+Create Date: 2026-10-17 10:41:27.903516
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c077f6d87e39'
+down_revision = '0a3de33664df'
+branch_labels = None
+depends_on = None
+
+
+INCLUDE_COLUMNS = ['artikelbezeichnung', 'markenname', 'status']
+
+
+def upgrade():
+    # INCLUDE is PostgreSQL-only; other engines keep the plain indexes
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_produkt_ean', table_name='produkt')
+    op.create_index('ix_produkt_ean', 'produkt', ['ean'], unique=True,
+                    postgresql_include=INCLUDE_COLUMNS)
+    op.drop_index('ix_produkt_artikelnummer_lieferant', table_name='produkt')
+    op.create_index('ix_produkt_artikelnummer_lieferant', 'produkt', ['artikelnummer_lieferant'],
+                    unique=False, postgresql_include=INCLUDE_COLUMNS)
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_produkt_artikelnummer_lieferant', table_name='produkt')
+    op.create_index('ix_produkt_artikelnummer_lieferant', 'produkt', ['artikelnummer_lieferant'], unique=False)
+    op.drop_index('ix_produkt_ean', table_name='produkt')
+    op.create_index('ix_produkt_ean', 'produkt', ['ean'], unique=True)
@@ -0,0 +1,60 @@
+"""Composite indexes on kunde_api_nutzung for the billing view
+
+Revision ID: c5f8a2d6e193
+Revises: 9b1e6c3f7a52
+Create Date: 2026-10-17 20:08:33.716250
+
+The billing page lists a user's API calls newest first and sums them per
+Kunde: (user_id, created_at DESC) and (user_id, kunde_id).
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5f8a2d6e193'
+down_revision = '9b1e6c3f7a52'
+branch_labels = None
+depends_on = None
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    inspector = inspect(op.get_bind())
+    return table_name in inspector.get_table_names()
+
+
+def index_exists(table_name, index_name):
+    """Check if an index exists on a table."""
+    inspector = inspect(op.get_bind())
+    return index_name in [ix['name'] for ix in inspector.get_indexes(table_name)]
+
+
+def upgrade():
+    if not table_exists('kunde_api_nutzung'):
+        return
+
+    if not index_exists('kunde_api_nutzung', 'ix_api_nutzung_user_created'):
+        op.create_index(
+            'ix_api_nutzung_user_created',
+            'kunde_api_nutzung',
+            ['user_id', sa.text('created_at DESC')],
+            unique=False,
+        )
+    if not index_exists('kunde_api_nutzung', 'ix_api_nutzung_user_kunde'):
+        op.create_index(
+            'ix_api_nutzung_user_kunde',
+            'kunde_api_nutzung',
+            ['user_id', 'kunde_id'],
+            unique=False,
+        )
+
+
+def downgrade():
+    if not table_exists('kunde_api_nutzung'):
+        return
+
+    for index_name in ('ix_api_nutzung_user_kunde', 'ix_api_nutzung_user_created'):
+        if index_exists('kunde_api_nutzung', index_name):
+            op.drop_index(index_name, table_name='kunde_api_nutzung')
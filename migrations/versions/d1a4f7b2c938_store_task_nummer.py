@@ -0,0 +1,75 @@
+"""Store task_nummer on task
+
+Revision ID: d1a4f7b2c938
+Revises: c5f8a2d6e193
+Create Date: 2026-10-17 20:36:05.228714
+
+task_nummer (PRD{prd_nummer}-T{id:03d}, or T{id:03d} without PRD number)
+was computed per access via the Komponente. It is now a stored, indexed
+column maintained by ORM events; existing tasks are backfilled here.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = 'd1a4f7b2c938'
+down_revision = 'c5f8a2d6e193'
+branch_labels = None
+depends_on = None
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    inspector = inspect(op.get_bind())
+    return table_name in inspector.get_table_names()
+
+
+def column_exists(table_name, column_name):
+    """Check if a column exists in a table."""
+    inspector = inspect(op.get_bind())
+    return column_name in [c['name'] for c in inspector.get_columns(table_name)]
+
+
+def index_exists(table_name, index_name):
+    """Check if an index exists on a table."""
+    inspector = inspect(op.get_bind())
+    return index_name in [ix['name'] for ix in inspector.get_indexes(table_name)]
+
+
+def upgrade():
+    if not table_exists('task'):
+        return
+
+    if not column_exists('task', 'task_nummer'):
+        with op.batch_alter_table('task', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('task_nummer', sa.String(length=30), nullable=True))
+
+    if not index_exists('task', 'ix_task_task_nummer'):
+        op.create_index('ix_task_task_nummer', 'task', ['task_nummer'], unique=False)
+
+    conn = op.get_bind()
+    rows = conn.execute(sa.text(
+        'SELECT task.id, komponente.prd_nummer FROM task '
+        'LEFT JOIN komponente ON komponente.id = task.komponente_id '
+        'WHERE task.task_nummer IS NULL'
+    )).fetchall()
+    for task_id, prd_nummer in rows:
+        nummer = f'PRD{prd_nummer}-T{task_id:03d}' if prd_nummer else f'T{task_id:03d}'
+        conn.execute(
+            sa.text('UPDATE task SET task_nummer = :nummer WHERE id = :id'),
+            {'nummer': nummer, 'id': task_id}
+        )
+
+
+def downgrade():
+    if not table_exists('task'):
+        return
+
+    if index_exists('task', 'ix_task_task_nummer'):
+        op.drop_index('ix_task_task_nummer', table_name='task')
+
+    if column_exists('task', 'task_nummer'):
+        with op.batch_alter_table('task', schema=None) as batch_op:
+            batch_op.drop_column('task_nummer')
@@ -0,0 +1,67 @@
+"""Denormalized booking counters on schulungsdurchfuehrung
+
+Revision ID: d5e7a2b9c814
+Revises: a81f4c3e6d92
+Create Date: 2026-10-17 15:11:24.730583
+
+Adds gebucht_count / warteliste_count and backfills them from the
+existing bookings. Afterwards they are maintained by mapper events on
+Schulungsbuchung.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5e7a2b9c814'
+down_revision = 'a81f4c3e6d92'
+branch_labels = None
+depends_on = None
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    inspector = inspect(op.get_bind())
+    return table_name in inspector.get_table_names()
+
+
+def column_exists(table_name, column_name):
+    """Check if a column exists in a table."""
+    inspector = inspect(op.get_bind())
+    return column_name in [c['name'] for c in inspector.get_columns(table_name)]
+
+
+def upgrade():
+    if not table_exists('schulungsdurchfuehrung'):
+        return
+
+    with op.batch_alter_table('schulungsdurchfuehrung', schema=None) as batch_op:
+        if not column_exists('schulungsdurchfuehrung', 'gebucht_count'):
+            batch_op.add_column(sa.Column('gebucht_count', sa.Integer(), nullable=False, server_default='0'))
+        if not column_exists('schulungsdurchfuehrung', 'warteliste_count'):
+            batch_op.add_column(sa.Column('warteliste_count', sa.Integer(), nullable=False, server_default='0'))
+
+    if table_exists('schulungsbuchung'):
+        op.execute("""
+            UPDATE schulungsdurchfuehrung SET
+                gebucht_count = (
+                    SELECT COUNT(*) FROM schulungsbuchung b
+                    WHERE b.durchfuehrung_id = schulungsdurchfuehrung.id AND b.status = 'gebucht'
+                ),
+                warteliste_count = (
+                    SELECT COUNT(*) FROM schulungsbuchung b
+                    WHERE b.durchfuehrung_id = schulungsdurchfuehrung.id AND b.status = 'warteliste'
+                )
+        """)
+
+
+def downgrade():
+    if not table_exists('schulungsdurchfuehrung'):
+        return
+
+    with op.batch_alter_table('schulungsdurchfuehrung', schema=None) as batch_op:
+        if column_exists('schulungsdurchfuehrung', 'warteliste_count'):
+            batch_op.drop_column('warteliste_count')
+        if column_exists('schulungsdurchfuehrung', 'gebucht_count'):
+            batch_op.drop_column('gebucht_count')
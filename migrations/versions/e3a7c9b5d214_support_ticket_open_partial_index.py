@@ -0,0 +1,54 @@
+"""Partial index on open support tickets
+
+Revision ID: e3a7c9b5d214
+Revises: 6a4c8e1f3b95
+Create Date: 2026-10-17 18:12:57.306148
+
+Indexes erstellt_am DESC only for tickets in an open status (offen,
+in_bearbeitung, warte_auf_kunde). Serves the default dashboard list
+("nur offene", newest first) without carrying the closed tickets.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = 'e3a7c9b5d214'
+down_revision = '6a4c8e1f3b95'
+branch_labels = None
+depends_on = None
+
+
+OPEN_STATUS = "status IN ('offen', 'in_bearbeitung', 'warte_auf_kunde')"
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    inspector = inspect(op.get_bind())
+    return table_name in inspector.get_table_names()
+
+
+def index_exists(table_name, index_name):
+    """Check if an index exists on a table."""
+    inspector = inspect(op.get_bind())
+    return index_name in [ix['name'] for ix in inspector.get_indexes(table_name)]
+
+
+def upgrade():
+    if not table_exists('support_ticket') or index_exists('support_ticket', 'ix_ticket_open'):
+        return
+
+    op.create_index(
+        'ix_ticket_open',
+        'support_ticket',
+        [sa.text('erstellt_am DESC')],
+        unique=False,
+        postgresql_where=sa.text(OPEN_STATUS),
+        sqlite_where=sa.text(OPEN_STATUS),
+    )
+
+
+def downgrade():
+    if table_exists('support_ticket') and index_exists('support_ticket', 'ix_ticket_open'):
+        op.drop_index('ix_ticket_open', table_name='support_ticket')
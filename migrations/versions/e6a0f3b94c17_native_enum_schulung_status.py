@@ -0,0 +1,87 @@
+"""Native ENUM types for schulungsbuchung and schulungsdurchfuehrung status
+
+Revision ID: e6a0f3b94c17
+Revises: 9d4c2e81b7f3
+Create Date: 2026-10-17 13:02:55.271630
+
+Note: PostgreSQL and MySQL/MariaDB get native ENUM types. On SQLite the
+column stays VARCHAR, which is what SQLAlchemy emits for non-native
+enums anyway.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6a0f3b94c17'
+down_revision = '9d4c2e81b7f3'
+branch_labels = None
+depends_on = None
+
+
+ENUMS = [
+    ('schulungsbuchung', 'buchung_status', ['gebucht', 'warteliste', 'storniert']),
+    ('schulungsdurchfuehrung', 'durchfuehrung_status', ['geplant', 'aktiv', 'abgeschlossen', 'abgesagt']),
+]
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    inspector = inspect(op.get_bind())
+    return table_name in inspector.get_table_names()
+
+
+def is_mysql():
+    return op.get_bind().dialect.name in ('mysql', 'mariadb')
+
+
+def upgrade():
+    if is_mysql():
+        for table, type_name, values in ENUMS:
+            if not table_exists(table):
+                continue
+            op.alter_column(
+                table, 'status',
+                existing_type=sa.String(20),
+                type_=sa.Enum(*values, name=type_name),
+                existing_nullable=False
+            )
+        return
+
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table, type_name, values in ENUMS:
+        if not table_exists(table):
+            continue
+        sa.Enum(*values, name=type_name).create(op.get_bind(), checkfirst=True)
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN status TYPE {type_name} '
+            f'USING status::{type_name}'
+        )
+
+
+def downgrade():
+    if is_mysql():
+        for table, type_name, values in reversed(ENUMS):
+            if not table_exists(table):
+                continue
+            op.alter_column(
+                table, 'status',
+                existing_type=sa.Enum(*values, name=type_name),
+                type_=sa.String(20),
+                existing_nullable=False
+            )
+        return
+
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table, type_name, values in reversed(ENUMS):
+        if table_exists(table):
+            op.execute(
+                f'ALTER TABLE {table} ALTER COLUMN status TYPE VARCHAR(20) '
+                f'USING status::text'
+            )
+        sa.Enum(*values, name=type_name).drop(op.get_bind(), checkfirst=True)
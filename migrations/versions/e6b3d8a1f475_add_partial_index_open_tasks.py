@@ -0,0 +1,54 @@
+"""Partial index on open tasks
+
+Revision ID: e6b3d8a1f475
+Revises: d1a4f7b2c938
+Create Date: 2026-10-17 21:14:48.903126
+
+Indexes (komponente_id, sortierung) only for tasks that are not
+'erledigt'. Serves Komponente.offene_tasks (filter + order) and the open
+task count on the project dashboard without carrying completed tasks.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6b3d8a1f475'
+down_revision = 'd1a4f7b2c938'
+branch_labels = None
+depends_on = None
+
+
+OPEN_STATUS = "status <> 'erledigt'"
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    inspector = inspect(op.get_bind())
+    return table_name in inspector.get_table_names()
+
+
+def index_exists(table_name, index_name):
+    """Check if an index exists on a table."""
+    inspector = inspect(op.get_bind())
+    return index_name in [ix['name'] for ix in inspector.get_indexes(table_name)]
+
+
+def upgrade():
+    if not table_exists('task') or index_exists('task', 'ix_task_open'):
+        return
+
+    op.create_index(
+        'ix_task_open',
+        'task',
+        ['komponente_id', 'sortierung'],
+        unique=False,
+        postgresql_where=sa.text(OPEN_STATUS),
+        sqlite_where=sa.text(OPEN_STATUS),
+    )
+
+
+def downgrade():
+    if table_exists('task') and index_exists('task', 'ix_task_open'):
+        op.drop_index('ix_task_open', table_name='task')
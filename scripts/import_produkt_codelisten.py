@@ -628,9 +628,19 @@ def main():
                 import traceback
                 traceback.print_exc()
 
-        # Add all entries to session
-        for entry in all_entries:
-            db.session.add(entry)
+        # Write all entries in batched INSERT ... ON CONFLICT statements
+        ProduktLookup.bulk_upsert([
+            {
+                'kategorie': entry.kategorie,
+                'code': entry.code,
+                'bezeichnung': entry.bezeichnung,
+                'zusatz_1': entry.zusatz_1,
+                'zusatz_2': entry.zusatz_2,
+                'zusatz_3': entry.zusatz_3,
+                'sortierung': entry.sortierung,
+            }
+            for entry in all_entries
+        ])
 
         # Commit all changes
         db.session.commit()